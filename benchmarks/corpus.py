@@ -0,0 +1,264 @@
+"""
+Self-validation of real-world modules.
+
+Synthetic modules do not exercise the odd cases found in the wild: C
+extensions, descriptors, metaclasses, module-level `__getattr__`, huge
+constant tables. This harness imports the standard library and the installed
+packages, builds a contract for each module with `SpyModel.from_module`,
+dumps it to YAML, loads it back and validates the module against it:
+
+    python -m benchmarks.corpus                     # stdlib and site-packages
+    python -m benchmarks.corpus --no-site-packages --output corpus.json
+    python -m benchmarks.corpus json email.mime     # given modules only
+
+Each module is reported with the time of every step, the peak memory
+allocated while extracting and validating it, and its status:
+
+- `ok`: the module is compliant with its own contract;
+- `skipped`: the module cannot be imported here, or is built into the
+  interpreter and has no file to validate;
+- `extraction_error`: `SpyModel.from_module` raised;
+- `roundtrip_error`: the contract could not be dumped to YAML or loaded back;
+- `validation_failed`: the module violates its own contract, or validation raised.
+
+The run exits with status 1 when any module fails.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+STATUS_OK = "ok"
+STATUS_SKIPPED = "skipped"
+STATUS_EXTRACTION_ERROR = "extraction_error"
+STATUS_ROUNDTRIP_ERROR = "roundtrip_error"
+STATUS_VALIDATION_FAILED = "validation_failed"
+
+FAILURES = (STATUS_EXTRACTION_ERROR, STATUS_ROUNDTRIP_ERROR, STATUS_VALIDATION_FAILED)
+
+# Modules with side effects on import (opening a browser, printing, starting a GUI).
+EXCLUDED = frozenset({
+    "__hello__", "__phello__", "antigravity", "idlelib", "this", "tkinter", "turtle", "turtledemo",
+})
+
+
+@dataclass
+class ModuleReport:
+    """
+    Outcome of the self-validation of one module.
+
+    Attributes:
+    -----------
+    module : str
+        Importable name of the module.
+
+    status : str
+        One of `ok`, `skipped`, `extraction_error`, `roundtrip_error` and
+        `validation_failed`.
+
+    members : int
+        Variables, functions, classes and methods extracted from the module.
+
+    timings : Dict[str, float]
+        Seconds spent extracting (`extract`), dumping and loading the contract
+        (`dump`, `load`) and validating the module (`validate`).
+
+    peak_memory : int
+        Peak bytes allocated while extracting and validating, or 0 if not measured.
+
+    error : Optional[str]
+        The exception or violation behind a status other than `ok`.
+    """
+
+    module: str
+    status: str = STATUS_OK
+    members: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+    peak_memory: int = 0
+    error: Optional[str] = None
+
+
+def stdlib_modules() -> List[str]:
+    """
+    Return the top-level modules of the standard library.
+    """
+    return sorted(name for name in sys.stdlib_module_names if name not in EXCLUDED)
+
+
+def site_packages_modules() -> List[str]:
+    """
+    Return the top-level modules provided by the installed distributions.
+    """
+    from importlib.metadata import packages_distributions
+
+    return sorted(
+        name for name in packages_distributions()
+        if name.isidentifier() and name not in EXCLUDED and name not in sys.stdlib_module_names
+    )
+
+
+def _count_members(spymodel) -> int:
+    module = spymodel.deployments[0].systems[0].pythons[0].modules[0]
+    classes = module.classes or []
+    return (
+        len(module.variables or []) + len(module.functions or []) + len(classes)
+        + sum(len(cls.methods or []) for cls in classes)
+    )
+
+
+def _describe(error: BaseException) -> str:
+    lines = [line.strip() for line in f"{type(error).__name__}: {error}".splitlines() if line.strip()]
+    return "; ".join(lines[:3])[:300]
+
+
+def self_validate(name: str, directory: str, session, memory: bool = True) -> ModuleReport:
+    """
+    Build a contract for module `name`, write it to `directory` and validate
+    the module against it.
+    """
+    from importspy.models import SpyModel
+    from importspy.persistences import YamlParser
+
+    report = ModuleReport(name)
+    try:
+        info_module = importlib.import_module(name)
+    except BaseException as e:
+        report.status, report.error = STATUS_SKIPPED, f"not importable: {_describe(e)}"
+        return report
+    if not getattr(info_module, "__file__", None):
+        report.status, report.error = STATUS_SKIPPED, "built into the interpreter"
+        return report
+
+    parser = YamlParser()
+    contract_path = os.path.join(directory, f"{name}.yml")
+
+    started = time.perf_counter()
+    try:
+        spymodel = SpyModel.from_module(info_module, reload=False)
+    except Exception as e:
+        report.status, report.error = STATUS_EXTRACTION_ERROR, _describe(e)
+        return report
+    report.timings["extract"] = time.perf_counter() - started
+    report.members = _count_members(spymodel)
+
+    try:
+        started = time.perf_counter()
+        parser.save(spymodel.model_dump(mode="json", exclude_none=True), contract_path)
+        report.timings["dump"] = time.perf_counter() - started
+        started = time.perf_counter()
+        contract = SpyModel(**parser.load(contract_path))
+        report.timings["load"] = time.perf_counter() - started
+    except Exception as e:
+        report.status, report.error = STATUS_ROUNDTRIP_ERROR, _describe(e.__cause__ or e)
+        return report
+
+    started = time.perf_counter()
+    try:
+        session.validate(contract, info_module, reload=False)
+    except Exception as e:
+        report.status, report.error = STATUS_VALIDATION_FAILED, _describe(e)
+        return report
+    report.timings["validate"] = time.perf_counter() - started
+
+    if memory:
+        session.clear()
+        tracemalloc.start()
+        try:
+            session.validate(SpyModel.from_module(info_module, reload=False), info_module, reload=False)
+            report.peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return report
+
+
+def run(names: Iterable[str], directory: str, memory: bool = True) -> List[ModuleReport]:
+    """
+    Self-validate every module of `names`, in order.
+    """
+    from importspy.session import SpySession
+
+    reports = []
+    with SpySession() as session:
+        for name in names:
+            reports.append(self_validate(name, directory, session, memory))
+            session.clear()
+    return reports
+
+
+def format_report(reports: List[ModuleReport], top: int = 10) -> str:
+    """
+    Render the outcome of a run: counts per status, the failures, and the
+    slowest and most memory-hungry modules.
+    """
+    counts: Dict[str, int] = {}
+    for report in reports:
+        counts[report.status] = counts.get(report.status, 0) + 1
+    lines = ["Modules: " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))]
+
+    failures = [report for report in reports if report.status in FAILURES]
+    if failures:
+        lines.append("Failures:")
+        lines += [f"  {report.status:<18} {report.module}: {report.error}" for report in failures]
+
+    validated = [report for report in reports if report.status == STATUS_OK]
+    slowest = sorted(validated, key=lambda report: sum(report.timings.values()), reverse=True)[:top]
+    lines.append("Slowest modules:")
+    lines += [
+        f"  {sum(report.timings.values()) * 1000:>10.3f} ms  {report.members:>6} members  {report.module}"
+        for report in slowest
+    ]
+    largest = sorted(validated, key=lambda report: report.peak_memory, reverse=True)[:top]
+    if largest and largest[0].peak_memory:
+        lines.append("Largest peak memory:")
+        lines += [
+            f"  {report.peak_memory / 1024:>10.1f} KiB  {report.members:>6} members  {report.module}"
+            for report in largest
+        ]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.corpus", description=__doc__.split("\n\n")[1])
+    parser.add_argument("modules", nargs="*", help="Modules to validate instead of the whole corpus.")
+    parser.add_argument("--no-stdlib", action="store_true", help="Skip the standard library.")
+    parser.add_argument("--no-site-packages", action="store_true", help="Skip the installed packages.")
+    parser.add_argument("--no-memory", action="store_true", help="Do not measure peak memory (faster).")
+    parser.add_argument("--top", type=int, default=10, help="Entries in the slowest and largest rankings.")
+    parser.add_argument("--output", help="Write the per-module reports to this JSON file.")
+    args = parser.parse_args(argv)
+
+    names = list(args.modules)
+    if not names:
+        names += [] if args.no_stdlib else stdlib_modules()
+        names += [] if args.no_site_packages else site_packages_modules()
+
+    with tempfile.TemporaryDirectory(prefix="importspy-corpus-") as directory:
+        reports = run(names, directory, memory=not args.no_memory)
+
+    print(format_report(reports, args.top))
+    if args.output:
+        from importspy import __version__
+
+        with open(args.output, "w") as file:
+            json.dump({
+                "meta": {
+                    "importspy": __version__,
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "machine": platform.machine(),
+                },
+                "modules": [asdict(report) for report in reports]
+            }, file, indent=2)
+    return 1 if any(report.status in FAILURES for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
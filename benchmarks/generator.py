@@ -0,0 +1,170 @@
+"""
+Synthetic modules and matching import contracts for the benchmarks.
+
+A `Shape` says how many module-level variables, functions and classes a
+module has, how many methods each class defines, how many arguments each
+function and method takes, and how deep class hierarchies go. `generate()`
+writes the module and a contract describing it exactly, so validating one
+against the other is always compliant and exercises every validator:
+
+    shape = shape_for(1000)
+    module_path, contract_path = generate(shape, "/tmp/bench")
+
+Classes are chained in hierarchies of `depth + 1` classes, each inheriting
+from the previous one, and every class lists its direct base in the
+contract. The deployment block describes the running host.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from importspy.persistences import YamlParser
+from importspy.utilities.python_util import PythonUtil
+from importspy.utilities.runtime_util import RuntimeUtil
+from importspy.utilities.system_util import SystemUtil
+
+
+@dataclass(frozen=True)
+class Shape:
+    """
+    Size of a synthetic module.
+
+    Attributes:
+    -----------
+    variables : int
+        Module-level variables.
+
+    functions : int
+        Module-level functions.
+
+    classes : int
+        Classes, including the bases of every hierarchy.
+
+    methods : int
+        Methods defined by each class.
+
+    arguments : int
+        Arguments of each function and method, besides `self`.
+
+    depth : int
+        Number of ancestors of the last class of each hierarchy.
+    """
+
+    variables: int = 0
+    functions: int = 0
+    classes: int = 0
+    methods: int = 4
+    arguments: int = 3
+    depth: int = 2
+
+    @property
+    def members(self) -> int:
+        """
+        Variables, functions, classes and methods in the module.
+        """
+        return self.variables + self.functions + self.classes * (1 + self.methods)
+
+    @property
+    def name(self) -> str:
+        return f"bench_{self.members}"
+
+
+def shape_for(members: int, methods: int = 4, arguments: int = 3, depth: int = 2) -> Shape:
+    """
+    Return a shape of about `members` members: a quarter of them variables,
+    a quarter functions and the rest classes with their methods.
+    """
+    variables = members // 4
+    functions = members // 4
+    classes = max(1, (members - variables - functions) // (1 + methods))
+    return Shape(variables, functions, classes, methods, arguments, depth)
+
+
+def _base_of(shape: Shape, index: int) -> int:
+    """
+    Index of the class `index` inherits from, or -1 for the root of a hierarchy.
+    """
+    return -1 if index % (shape.depth + 1) == 0 else index - 1
+
+
+def module_source(shape: Shape) -> str:
+    """
+    Return the source of a module of the given shape.
+    """
+    arguments = ", ".join(f"arg_{a}: int" for a in range(shape.arguments))
+    lines = [f'"""Synthetic module generated by benchmarks/generator.py ({shape.members} members)."""', ""]
+    lines += [f"var_{v}: int = {v}" for v in range(shape.variables)]
+    lines.append("")
+    for f in range(shape.functions):
+        lines += [f"def func_{f}({arguments}) -> int:", f"    return {f}", ""]
+    method_arguments = ", ".join(["self"] + [f"arg_{a}: int" for a in range(shape.arguments)])
+    for c in range(shape.classes):
+        base = _base_of(shape, c)
+        lines.append(f"class Class_{c}(Class_{base}):" if base >= 0 else f"class Class_{c}:")
+        for m in range(shape.methods):
+            lines += [f"    def method_{c}_{m}({method_arguments}) -> int:", f"        return {m}", ""]
+        if not shape.methods:
+            lines += ["    pass", ""]
+    return "\n".join(lines) + "\n"
+
+
+def _arguments(shape: Shape, method: bool) -> List[dict]:
+    arguments = [{"name": "self"}] if method else []
+    return arguments + [{"name": f"arg_{a}", "annotation": "int"} for a in range(shape.arguments)]
+
+
+def contract_data(shape: Shape) -> dict:
+    """
+    Return the import contract describing a module of the given shape,
+    deployed on the running host.
+    """
+    python_utils = PythonUtil()
+    function_arguments = _arguments(shape, method=False)
+    method_arguments = _arguments(shape, method=True)
+    classes = []
+    for c in range(shape.classes):
+        class_data = {
+            "name": f"Class_{c}",
+            "methods": [
+                {"name": f"method_{c}_{m}", "arguments": method_arguments, "return_annotation": "int"}
+                for m in range(shape.methods)
+            ]
+        }
+        base = _base_of(shape, c)
+        if base >= 0:
+            class_data["superclasses"] = [{"name": f"Class_{base}"}]
+        classes.append(class_data)
+    return {
+        "filename": f"{shape.name}.py",
+        "variables": [{"name": f"var_{v}", "annotation": "int", "value": v} for v in range(shape.variables)],
+        "functions": [
+            {"name": f"func_{f}", "arguments": function_arguments, "return_annotation": "int"}
+            for f in range(shape.functions)
+        ],
+        "classes": classes,
+        "deployments": [{
+            "arch": RuntimeUtil().extract_arch(),
+            "systems": [{
+                "os": SystemUtil().extract_os(),
+                "pythons": [{
+                    "version": python_utils.extract_python_version(),
+                    "interpreter": python_utils.extract_python_implementation(),
+                    "modules": [{"filename": f"{shape.name}.py"}]
+                }]
+            }]
+        }]
+    }
+
+
+def generate(shape: Shape, directory: str) -> Tuple[str, str]:
+    """
+    Write the module and its contract into `directory` and return their paths.
+    """
+    os.makedirs(directory, exist_ok=True)
+    module_path = os.path.join(directory, f"{shape.name}.py")
+    contract_path = os.path.join(directory, f"{shape.name}.yml")
+    with open(module_path, "w") as file:
+        file.write(module_source(shape))
+    YamlParser().save(contract_data(shape), contract_path)
+    return module_path, contract_path
@@ -0,0 +1,170 @@
+"""
+Memory profile of repeated validations.
+
+Plugin hosts call `Spy().importspy` thousands of times over the life of a
+process, so anything a validation leaves behind adds up. This harness runs
+each validation phase many times under `tracemalloc` and reports, per phase,
+the peak memory allocated while it ran and the memory still held afterwards:
+
+    python -m benchmarks.memory                         # 200 runs per phase
+    python -m benchmarks.memory --iterations 2000 --phases importspy --top 5
+
+Phases are timed on a generated module and contract (see
+`benchmarks.generator`), with caching disabled so that each run does the
+full work:
+
+- `contract`: parsing the contract into a `SpyModel`;
+- `load`: executing the module;
+- `extract`: extracting its structure;
+- `host`: describing the running host;
+- `validate`: `SpySession.validate` on the executed module, extraction included;
+- `importspy`: `Spy().importspy(...)` end to end, as plugin hosts call it,
+  with the default session and its caches.
+
+Each phase runs once before measuring, so caches filled on first use (lazy
+imports, pydantic schemas) are not mistaken for leaks. Memory retained by
+the second half of the runs (`growth`) is the one to watch: it grows with
+the number of runs only if something leaks. `--top` lists the source lines
+holding the most retained memory.
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.generator import generate, shape_for
+
+
+@dataclass
+class PhaseMemory:
+    """
+    Memory used by repeated runs of one phase.
+
+    Attributes:
+    -----------
+    phase : str
+        Name of the phase.
+
+    iterations : int
+        Number of measured runs.
+
+    peak : int
+        Highest number of bytes allocated at once during the runs.
+
+    retained : int
+        Bytes still allocated after the runs and a garbage collection.
+
+    growth : int
+        Bytes retained by the second half of the runs alone. Memory filled
+        once and then reused (caches, resized dictionaries) shows in
+        `retained` but not here, while a leak grows it in proportion to the runs.
+
+    top : List[Tuple[str, int]]
+        Source lines holding the most retained memory, as `(location, bytes)`.
+    """
+
+    phase: str
+    iterations: int
+    peak: int
+    retained: int
+    growth: int
+    top: List[Tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def growth_per_run(self) -> float:
+        runs = self.iterations - self.iterations // 2
+        return self.growth / runs if runs else 0.0
+
+
+def profile(phase: str, func: Callable, iterations: int, top: int = 0) -> PhaseMemory:
+    """
+    Run `func` once to warm up, then `iterations` times under `tracemalloc`.
+    """
+    func()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for _ in range(iterations // 2):
+            func()
+        gc.collect()
+        halfway = tracemalloc.get_traced_memory()[0]
+        for _ in range(iterations - iterations // 2):
+            func()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        statistics = tracemalloc.take_snapshot().statistics("lineno") if top else []
+    finally:
+        tracemalloc.stop()
+    return PhaseMemory(
+        phase,
+        iterations,
+        peak,
+        retained,
+        retained - halfway,
+        [(str(stat.traceback[0]), stat.size) for stat in statistics[:top]]
+    )
+
+
+def phases(module_path: str, contract_path: str) -> Dict[str, Callable]:
+    """
+    Return the phases of a validation of `module_path` against `contract_path`.
+    """
+    from importspy.s import Spy
+    from importspy.session import SpySession
+    from importspy.utilities.module_util import ModuleUtil
+
+    session = SpySession(pin_host=False, cache_size=0)
+    module_util = ModuleUtil()
+    info_module = module_util.import_from_path(module_path)
+    spymodel = session.load_contract(contract_path)
+    return {
+        "contract": lambda: session.load_contract(contract_path),
+        "load": lambda: module_util.import_from_path(module_path),
+        "extract": lambda: session.extract(info_module),
+        "host": session.host,
+        "validate": lambda: session.validate(spymodel, info_module, reload=False),
+        "importspy": lambda: Spy().importspy(filepath=contract_path, info_module=info_module),
+    }
+
+
+def format_profile(results: List[PhaseMemory]) -> str:
+    """
+    Render the memory of every phase as a table, in KiB, followed by the top
+    retaining lines if they were collected.
+    """
+    lines = [f"{'phase':<10} {'runs':>7} {'peak KiB':>10} {'retained KiB':>13} {'growth B/run':>13}"]
+    for result in results:
+        lines.append(
+            f"{result.phase:<10} {result.iterations:>7} {result.peak / 1024:>10.1f} "
+            f"{result.retained / 1024:>13.1f} {result.growth_per_run:>13.1f}"
+        )
+    for result in results:
+        if result.top:
+            lines.append(f"Retained by {result.phase}:")
+            lines += [f"  {size / 1024:>10.1f} KiB  {location}" for location, size in result.top]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200, help="Measured runs per phase.")
+    parser.add_argument("--members", type=int, default=100, help="Size of the generated module.")
+    parser.add_argument("--phases", help="Comma-separated phases to profile; all by default.")
+    parser.add_argument("--top", type=int, default=0, help="Show the N source lines retaining the most memory.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="importspy-memory-") as directory:
+        module_path, contract_path = generate(shape_for(args.members), directory)
+        selected = phases(module_path, contract_path)
+        names = args.phases.split(",") if args.phases else list(selected)
+        results = [profile(name, selected[name], args.iterations, args.top) for name in names]
+    print(format_profile(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
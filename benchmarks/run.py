@@ -0,0 +1,240 @@
+"""
+Benchmark ImportSpy on synthetic modules of growing size.
+
+For each size, a module and its contract are generated (see
+`benchmarks.generator`) and the following are timed, keeping the best of
+`--repeat` runs:
+
+- `contract_load`: parsing the YAML contract into a `SpyModel`;
+- `from_module`: `SpyModel.from_module` on the executed module;
+- `extract`: the module structure compared by the validators;
+- `module_validator`, `variable_validator`, `function_validator`,
+  `class_validator`, `runtime_validator`, `system_validator` and
+  `python_validator`: each validator on its part of the contract;
+- `cli`: `importspy <module> -s <contract> --no-daemon` in a fresh interpreter.
+
+Results are written as JSON and can be compared against a stored baseline:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.25
+
+The run fails when a metric is slower than the baseline by more than the
+tolerance.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.generator import generate, shape_for
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+
+_CLI = "import sys; from importspy.cli import main; sys.argv[0] = 'importspy'; main()"
+
+
+def best_of(repeat: int, func: Callable, setup: Optional[Callable] = None) -> float:
+    """
+    Return the shortest of `repeat` timings of `func`, in seconds. `setup`,
+    if given, runs untimed before each of them and its result is passed to `func`.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        args = (setup(),) if setup else ()
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _compliant(validate: Callable) -> Callable:
+    """
+    Wrap a validator call so that a violation aborts the benchmark: the
+    generated contracts always match their modules.
+    """
+    def run(*args):
+        try:
+            return validate(*args)
+        except ValueError as ve:
+            raise RuntimeError(f"Generated module is not compliant: {ve}") from ve
+    return run
+
+
+def measure(members: int, directory: str, repeat: int) -> Dict[str, float]:
+    """
+    Time every stage of a validation on a generated module of about `members` members.
+    """
+    from importspy.constants import Contexts, Errors
+    from importspy.models import Module, Runtime, SpyModel
+    from importspy.persistences import YamlParser
+    from importspy.utilities.module_util import ModuleUtil
+    from importspy.validators import (
+        ClassValidator,
+        FunctionValidator,
+        ModuleValidator,
+        PythonValidator,
+        RuntimeValidator,
+        SystemValidator,
+        VariableValidator
+    )
+    from importspy.violation_systems import (
+        FunctionContractViolation,
+        ModuleContractViolation,
+        PythonContractViolation,
+        RuntimeContractViolation,
+        SystemContractViolation,
+        VariableContractViolation
+    )
+
+    shape = shape_for(members)
+    module_path, contract_path = generate(shape, directory)
+    results = {"members": shape.members}
+
+    results["contract_load"] = best_of(repeat, lambda: SpyModel(**YamlParser().load(contract_path)))
+    spymodel = SpyModel(**YamlParser().load(contract_path))
+
+    module_util = ModuleUtil()
+    info_module = module_util.import_from_path(module_path)
+    results["from_module"] = best_of(repeat, lambda: SpyModel.from_module(info_module, reload=False))
+    results["extract"] = best_of(repeat, lambda: Module.from_module(info_module))
+    module = Module.from_module(info_module)
+    host = [Runtime.from_host()]
+
+    validators = {
+        "module_validator": lambda bundle: ModuleValidator().validate(
+            [spymodel], module, ModuleContractViolation(Contexts.MODULE_CONTEXT, bundle)
+        ),
+        "variable_validator": lambda bundle: VariableValidator().validate(
+            spymodel.variables, module.variables,
+            VariableContractViolation(Errors.SCOPE_VARIABLE, Contexts.MODULE_CONTEXT, bundle)
+        ),
+        "function_validator": lambda bundle: FunctionValidator().validate(
+            spymodel.functions, module.functions, FunctionContractViolation(Contexts.MODULE_CONTEXT, bundle)
+        ),
+        "class_validator": lambda bundle: ClassValidator().validate(
+            spymodel.classes, module.classes, ModuleContractViolation(Contexts.CLASS_CONTEXT, bundle)
+        ),
+        "runtime_validator": lambda bundle: RuntimeValidator().validate(
+            spymodel.deployments, host, RuntimeContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
+        ),
+        "system_validator": lambda bundle: SystemValidator().validate(
+            spymodel.deployments[0].systems, host[0].systems,
+            SystemContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
+        ),
+        "python_validator": lambda bundle: PythonValidator().validate(
+            spymodel.deployments[0].systems[0].pythons, host[0].systems[0].pythons,
+            PythonContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
+        ),
+    }
+    for name, validate in validators.items():
+        results[name] = best_of(repeat, _compliant(validate), setup=_module_bundle(shape.name))
+
+    results["cli"] = best_of(repeat, lambda: _run_cli(module_path, contract_path))
+    return results
+
+
+def _module_bundle(name: str) -> Callable:
+    from importspy.constants import Errors
+    from importspy.violation_systems import Bundle
+
+    def setup():
+        bundle = Bundle()
+        bundle[Errors.KEY_FILE_NAME] = f"{name}.py"
+        return bundle
+    return setup
+
+
+def _run_cli(module_path: str, contract_path: str):
+    completed = subprocess.run(
+        [sys.executable, "-c", _CLI, module_path, "-s", contract_path, "--no-daemon"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "NO_COLOR": "1"}
+    )
+    if completed.returncode != 0 or "NOT compliant" in completed.stdout:
+        raise RuntimeError(f"CLI validation failed: {completed.stdout}{completed.stderr}")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[Tuple[str, str, float, float]]:
+    """
+    Return the metrics of `results` slower than in `baseline` by more than
+    `tolerance` (a fraction), as `(size, metric, baseline, current)`.
+    Sizes and metrics missing from either side are ignored.
+    """
+    regressions = []
+    for size, metrics in results["results"].items():
+        reference = baseline.get("results", {}).get(size, {})
+        for metric, value in metrics.items():
+            if metric == "members" or metric not in reference:
+                continue
+            if value > reference[metric] * (1 + tolerance):
+                regressions.append((size, metric, reference[metric], value))
+    return regressions
+
+
+def format_results(results: dict) -> str:
+    """
+    Render the results as a table, one column per size, in milliseconds.
+    """
+    sizes = list(results["results"])
+    metrics = [metric for metric in next(iter(results["results"].values()), {}) if metric != "members"]
+    lines = [f"{'metric':<20}" + "".join(f"{size:>12}" for size in sizes)]
+    for metric in metrics:
+        lines.append(f"{metric:<20}" + "".join(
+            f"{results['results'][size].get(metric, float('nan')) * 1000:>12.3f}" for size in sizes
+        ))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated module sizes, in members (up to 100000).")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is kept.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against the results stored in this JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown against the baseline, as a fraction.")
+    parser.add_argument("--directory", help="Where to generate the modules; a temporary directory by default.")
+    args = parser.parse_args(argv)
+
+    from importspy import __version__
+
+    results = {
+        "meta": {
+            "importspy": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+        },
+        "results": {}
+    }
+    with tempfile.TemporaryDirectory(prefix="importspy-bench-") as tmp:
+        for size in (int(size) for size in args.sizes.split(",")):
+            results["results"][str(size)] = measure(size, args.directory or tmp, args.repeat)
+            print(f"measured {size} members", file=sys.stderr)
+
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for size, metric, reference, value in regressions:
+            print(f"REGRESSION {metric} at {size} members: {reference * 1000:.3f} ms -> {value * 1000:.3f} ms")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
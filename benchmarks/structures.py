@@ -0,0 +1,144 @@
+"""
+Cost of the models holding an extracted module structure.
+
+ImportSpy builds the models of the structures it extracts itself without
+validating them (see `importspy.models._observed`), and validates only the
+contracts it is given. This harness compares, on generated modules of
+growing size, building the same structure both ways:
+
+    python -m benchmarks.structures                   # 100 to 10k members
+    python -m benchmarks.structures --sizes 1000 --repeat 10
+
+For each size it reports, keeping the best of `--repeat` runs:
+
+- `extract`: extracting variables, functions and classes with `ModuleUtil`;
+- `observed`: building their models from the extracted data, as
+  `SpyModel.from_module` does;
+- `validated`: building the same models through pydantic validation, as
+  for a contract;
+
+and the memory retained per model by the observed and validated structures.
+Observed variables, attributes and arguments are shared between identical
+occurrences, so the memory of a model shared by several functions counts once.
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.generator import generate, shape_for
+from benchmarks.run import best_of
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+
+def count_models(model) -> int:
+    """
+    Return the number of models in the tree rooted at `model`.
+    """
+    from importspy.models import Fingerprinted
+
+    count = 1
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        for item in value if isinstance(value, list) else [value]:
+            if isinstance(item, Fingerprinted):
+                count += count_models(item)
+    return count
+
+
+def retained(build: Callable) -> int:
+    """
+    Return the bytes still allocated after `build()`, while its result is alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def measure(members: int, directory: str, repeat: int) -> Dict[str, float]:
+    """
+    Time and weigh the structure of a generated module of about `members` members.
+    """
+    from importspy.models import Class, Function, Module, Variable
+    from importspy.utilities.module_util import ModuleUtil
+
+    module_util = ModuleUtil()
+    module_path, _ = generate(shape_for(members), directory)
+    info_module = module_util.import_from_path(module_path)
+
+    def extract():
+        return (
+            module_util.extract_variables(info_module),
+            module_util.extract_functions(info_module),
+            module_util.extract_classes(info_module)
+        )
+
+    variables, functions, classes = extract()
+
+    def observed():
+        return Module(
+            variables=Variable.from_variable_info(variables),
+            functions=Function.from_functions_info(functions),
+            classes=Class.from_class_info(classes)
+        )
+
+    data = observed().model_dump()
+
+    def validated():
+        return Module.model_validate(data)
+
+    models = count_models(observed())
+    return {
+        "members": shape_for(members).members,
+        "models": models,
+        "extract": best_of(repeat, extract),
+        "observed": best_of(repeat, observed),
+        "validated": best_of(repeat, validated),
+        "observed_bytes": retained(observed) / models,
+        "validated_bytes": retained(validated) / models,
+    }
+
+
+def format_results(results: List[Dict[str, float]]) -> str:
+    """
+    Render the measurements as a table: timings in milliseconds, memory in
+    bytes per model.
+    """
+    lines = [
+        f"{'members':>8} {'models':>8} {'extract ms':>11} {'observed ms':>12} {'validated ms':>13} "
+        f"{'observed B':>11} {'validated B':>12}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['members']:>8} {result['models']:>8} {result['extract'] * 1000:>11.3f} "
+            f"{result['observed'] * 1000:>12.3f} {result['validated'] * 1000:>13.3f} "
+            f"{result['observed_bytes']:>11.1f} {result['validated_bytes']:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.structures", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated module sizes.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per timing; the best is kept.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="importspy-structures-") as directory:
+        results = [measure(int(size), directory, args.repeat) for size in args.sizes.split(",")]
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,55 @@
 __version__ = "0.3.0"
 
-from .s import Spy
\ No newline at end of file
+__all__ = ["Spy", "SpySession"]
+
+# Public names resolved on first access, mapped to the submodule defining
+# them. Importing `Spy` pulls in pydantic and the validators; nothing is
+# loaded until it is actually used, so `import importspy` stays cheap.
+_LAZY_ATTRIBUTES = {
+    "Spy": "s",
+    "SpySession": "session",
+}
+
+_SUBMODULES = (
+    "backends",
+    "batch",
+    "cli",
+    "commands",
+    "config",
+    "constants",
+    "contract_index",
+    "daemon",
+    "deferred",
+    "hooks",
+    "incremental",
+    "log_manager",
+    "metrics",
+    "models",
+    "persistences",
+    "s",
+    "session",
+    "timings",
+    "tracing",
+    "utilities",
+    "validators",
+    "verdicts",
+    "violation_systems",
+    "watch",
+)
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_SUBMODULES})
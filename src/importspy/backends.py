@@ -0,0 +1,214 @@
+"""
+Execution backends for running validations in parallel.
+
+Three backends are available:
+
+- **threads**: cheap to start, but serialized by the GIL on regular builds.
+- **processes**: full isolation and real parallelism, at the cost of
+  spawning workers and pickling data between them.
+- **subinterpreters**: each validation runs in its own interpreter, with its
+  own GIL and its own `sys.modules`, inside the current process. This relies
+  on `concurrent.futures.InterpreterPoolExecutor` (built on
+  `concurrent.interpreters`, Python 3.14+) and on every extension module that
+  ImportSpy imports supporting isolated interpreters. When either is missing
+  the backend transparently falls back to processes.
+
+Isolated backends (processes and subinterpreters) don't share objects with
+the caller: requests and verdicts cross the boundary as compact JSON bytes,
+encoded with `encode_request()` and decoded with `decode_verdict()`.
+"""
+
+import concurrent.futures
+import functools
+import json
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict
+from enum import Enum
+from typing import Dict, Optional, Tuple
+
+from . import tracing
+from .verdicts import Verdict
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+_subinterpreters_supported: Optional[bool] = None
+
+
+class Backend(str, Enum):
+    """Supported execution backends."""
+    THREADS = "threads"
+    PROCESSES = "processes"
+    SUBINTERPRETERS = "subinterpreters"
+
+
+def encode_request(modulepath: str,
+                   contract_path: Optional[str] = None,
+                   contract_text: Optional[str] = None) -> bytes:
+    """
+    Serialize a validation request for an isolated worker.
+
+    The contract is given either by path, read by the worker, or by content,
+    so a contract shared by many modules is read only once by the caller.
+    While a trace is being recorded, the worker is asked to trace too.
+    """
+    return json.dumps(
+        {
+            "module": modulepath,
+            "contract_path": contract_path,
+            "contract_text": contract_text,
+            "trace": tracing.active_tracer() is not None
+        },
+        separators=(",", ":")
+    ).encode()
+
+
+def decode_response(payload: bytes) -> Tuple[Verdict, Dict[str, float]]:
+    """
+    Deserialize the verdict and the timings returned by `validate_request()`.
+    Spans traced by the worker are merged into the active tracer.
+    """
+    response = json.loads(payload)
+    tracer = tracing.active_tracer()
+    if tracer is not None and response.get("trace"):
+        tracer.merge(response["trace"])
+    return Verdict(**response["verdict"]), response["timings"]
+
+
+def decode_verdict(payload: bytes) -> Verdict:
+    """
+    Deserialize the verdict returned by `validate_request()`.
+    """
+    return decode_response(payload)[0]
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_contract_text(contract_text: str):
+    """
+    Parse a contract sent as text, once per worker for each distinct contract.
+    """
+    from .models import SpyModel
+    from .persistences import YamlParser
+    return SpyModel(**YamlParser().loads(contract_text))
+
+
+def validate_request(payload: bytes) -> bytes:
+    """
+    Worker entry point: load a module from its file and validate it.
+
+    Runs in the isolated worker, so everything it needs is imported here.
+    Contract violations are returned as a non-compliant verdict; any other
+    error (e.g. an unreadable contract) propagates to the caller.
+
+    Parameters:
+    -----------
+    payload : bytes
+        A request built by `encode_request()`.
+
+    Returns:
+    --------
+    bytes
+        The JSON-encoded verdict, with the seconds spent in each phase of the
+        validation (see `importspy.timings`) and, if the request asked for
+        it, the spans traced by the worker.
+    """
+    from .session import default_session
+    from .timings import PHASE_CONTRACT, PHASE_LOAD, record, span
+    from .utilities.module_util import ModuleUtil
+
+    request = json.loads(payload)
+    tracer = tracing.start() if request.get("trace") and tracing.active_tracer() is None else None
+    try:
+        with record() as timings, tracing.trace(f"validate {request['module']}"):
+            try:
+                if request["contract_text"] is not None:
+                    with span(PHASE_CONTRACT):
+                        spymodel = _parse_contract_text(request["contract_text"])
+                else:
+                    spymodel = default_session().load_contract(request["contract_path"])
+                with span(PHASE_LOAD):
+                    info_module = ModuleUtil().import_from_path(request["module"])
+                default_session().validate(spymodel, info_module, reload=False)
+                verdict = Verdict(compliant=True)
+            except ValueError as ve:
+                verdict = Verdict(compliant=False, error=str(ve))
+    finally:
+        if tracer is not None:
+            tracing.stop()
+    response = {"verdict": asdict(verdict), "timings": timings}
+    if tracer is not None:
+        response["trace"] = tracer.events
+    return json.dumps(response, separators=(",", ":")).encode()
+
+
+def _probe() -> bool:
+    """Import ImportSpy's whole dependency tree, as a worker would."""
+    from . import s  # noqa: F401
+    return True
+
+
+def subinterpreters_available() -> bool:
+    """
+    Tell whether validations can run in subinterpreters on this interpreter.
+
+    Requires `InterpreterPoolExecutor` and a successful import of ImportSpy
+    inside a subinterpreter; extension modules built without subinterpreter
+    support refuse to load there. The probe runs once per process.
+    """
+    global _subinterpreters_supported
+    if _subinterpreters_supported is None:
+        pool_class = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+        if pool_class is None:
+            _subinterpreters_supported = False
+        else:
+            try:
+                with pool_class(max_workers=1) as pool:
+                    _subinterpreters_supported = pool.submit(_probe).result()
+            except Exception as e:
+                logger.debug(f"Subinterpreters unavailable: {e}")
+                _subinterpreters_supported = False
+    return _subinterpreters_supported
+
+
+def create_executor(backend: Backend, workers: Optional[int] = None) -> Executor:
+    """
+    Build an executor for `backend`.
+
+    The subinterpreter backend falls back to a process pool when
+    `subinterpreters_available()` is False.
+
+    Parameters:
+    -----------
+    backend : Backend
+        The requested backend.
+
+    workers : Optional[int]
+        Maximum number of parallel workers; defaults to the executor's own default.
+
+    Returns:
+    --------
+    Executor
+        A ready-to-use executor; the caller is responsible for shutting it down.
+    """
+    backend = Backend(backend)
+    if backend is Backend.THREADS:
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="importspy")
+    if backend is Backend.SUBINTERPRETERS:
+        if subinterpreters_available():
+            return concurrent.futures.InterpreterPoolExecutor(max_workers=workers)
+        logger.debug("Falling back to processes for the subinterpreter backend")
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def is_isolated(executor: Optional[Executor]) -> bool:
+    """
+    Tell whether `executor` runs work outside the current interpreter.
+
+    Work submitted to such executors must be a module-level function taking
+    and returning plain data, like `validate_request()`.
+    """
+    interpreter_pool = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+    return isinstance(executor, ProcessPoolExecutor) or (
+        interpreter_pool is not None and isinstance(executor, interpreter_pool)
+    )
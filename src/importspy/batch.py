@@ -0,0 +1,204 @@
+"""
+Batch validation for ImportSpy.
+
+`validate_many()` validates a stream of `(module path, contract path)` pairs
+on a pool of workers and yields one `ValidationResult` per pair as soon as it
+completes, in completion order. Pairs are pulled from the input lazily and
+only a small window of them is in flight at any time, so memory stays
+constant however long the stream is, and a consumer that stops iterating
+stops the batch.
+
+Contracts are typically shared by many modules, so each distinct contract is
+parsed once rather than once per pair. Contracts are loaded by the caller as
+pairs are submitted: thread workers receive the model parsed by a shared
+`SpySession`, while isolated workers receive the contract text and keep the
+parsed model for later requests carrying the same text.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .backends import (
+    Backend,
+    create_executor,
+    decode_response,
+    encode_request,
+    is_isolated,
+    validate_request
+)
+from .models import SpyModel
+from .session import SpySession
+from .timings import PHASE_CONTRACT, PHASE_LOAD, PHASE_TOTAL, record, span
+from .tracing import trace
+from .utilities.module_util import ModuleUtil
+
+
+@dataclass
+class ValidationResult:
+    """
+    Outcome of validating one module against one import contract.
+
+    Attributes:
+    -----------
+    module : str
+        Path of the validated module.
+
+    contract : str
+        Path of the import contract.
+
+    compliant : bool
+        Whether the module satisfied the contract.
+
+    violations : List[str]
+        Violation messages reported for a non-compliant module.
+
+    timings : Dict[str, float]
+        Seconds spent in each phase (see `importspy.timings`) and in total.
+        A contract shared by several pairs is parsed once: the first of them
+        reports the parsing time, the others the cache lookup.
+
+    error : Optional[str]
+        Description of an unexpected failure, such as a module raising on
+        import or an unreadable contract. Such pairs are never compliant.
+    """
+
+    module: str
+    contract: str
+    compliant: bool
+    violations: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def validate_many(pairs: Iterable[Tuple[str, str]],
+                  workers: Optional[int] = None,
+                  backend: Backend = Backend.THREADS,
+                  session: Optional[SpySession] = None) -> Iterator[ValidationResult]:
+    """
+    Validate many modules in parallel, yielding results as they complete.
+
+    Parameters:
+    -----------
+    pairs : Iterable[Tuple[str, str]]
+        `(module path, contract path)` pairs, consumed lazily.
+
+    workers : Optional[int]
+        Number of parallel workers; defaults to the number of CPUs.
+
+    backend : Backend
+        `threads`, `processes` or `subinterpreters` (see `importspy.backends`).
+
+    session : Optional[SpySession]
+        Session used by thread workers. A private one, pinned to the current
+        host, is opened for the batch when omitted.
+
+    Yields:
+    -------
+    ValidationResult
+        One result per pair, in completion order. A failing pair never
+        interrupts the batch.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+    pending: Dict[Future, Tuple[str, str]] = {}
+    contract_texts: Dict[str, str] = {}
+    own_session = session is None
+    session = session or SpySession()
+    executor = create_executor(backend, workers)
+    isolated = is_isolated(executor)
+    remaining = iter(pairs)
+
+    def _submit_next() -> bool:
+        for modulepath, contract in remaining:
+            try:
+                if isolated:
+                    future = _submit_isolated(executor, modulepath, contract, contract_texts)
+                else:
+                    with record() as parsing:
+                        spymodel = session.load_contract(contract)
+                    future = executor.submit(
+                        _validate_in_session, session, spymodel, modulepath, contract, parsing[PHASE_TOTAL]
+                    )
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            pending[future] = (modulepath, contract)
+            return True
+        return False
+
+    try:
+        while len(pending) < max_in_flight and _submit_next():
+            pass
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                modulepath, contract = pending.pop(future)
+                yield _result_of(future, modulepath, contract, isolated)
+                _submit_next()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if own_session:
+            session.close()
+
+
+def _submit_isolated(executor, modulepath: str, contract: str, contract_texts: Dict[str, str]) -> Future:
+    """
+    Send a pair to an isolated worker, reading each contract file only once.
+    """
+    if contract not in contract_texts:
+        with open(contract) as file:
+            contract_texts[contract] = file.read()
+    return executor.submit(
+        validate_request,
+        encode_request(os.path.abspath(modulepath), contract_text=contract_texts[contract])
+    )
+
+
+def _validate_in_session(session: SpySession,
+                         spymodel: SpyModel,
+                         modulepath: str,
+                         contract: str,
+                         parsing: float) -> ValidationResult:
+    """
+    Thread worker: validate one pair with the batch session. `parsing` is the
+    time the submitting thread spent loading the contract.
+    """
+    with record() as timings, trace(f"validate {modulepath}"):
+        try:
+            with span(PHASE_LOAD):
+                info_module = ModuleUtil().import_from_path(os.path.abspath(modulepath))
+            session.validate(spymodel, info_module, reload=False)
+            result = ValidationResult(modulepath, contract, compliant=True)
+        except ValueError as ve:
+            result = ValidationResult(modulepath, contract, compliant=False, violations=[str(ve)])
+        except Exception as e:
+            result = ValidationResult(modulepath, contract, compliant=False, error=f"{type(e).__name__}: {e}")
+    if parsing:
+        timings[PHASE_CONTRACT] = timings.get(PHASE_CONTRACT, 0.0) + parsing
+        timings[PHASE_TOTAL] += parsing
+    result.timings = timings
+    return result
+
+
+def _result_of(future: Future, modulepath: str, contract: str, isolated: bool) -> ValidationResult:
+    """
+    Turn a completed worker future into a `ValidationResult`.
+    """
+    try:
+        outcome = future.result()
+    except Exception as e:
+        return ValidationResult(modulepath, contract, compliant=False, error=f"{type(e).__name__}: {e}")
+    if not isolated:
+        return outcome
+    verdict, timings = decode_response(outcome)
+    return ValidationResult(
+        modulepath,
+        contract,
+        compliant=verdict.compliant,
+        violations=[verdict.error] if verdict.error else [],
+        timings=timings
+    )
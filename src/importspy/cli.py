@@ -19,120 +19,134 @@ Use cases:
 Example:
     importspy ./examples/my_plugin.py -s ./contracts/expected.yml --log-level DEBUG
 
+Watch mode keeps validating a set of modules while they are edited:
+    importspy watch ./plugins -s ./contracts/expected.yml
+
+A daemon keeps contracts and caches warm between invocations; while it runs,
+`importspy` forwards its validations to it:
+    importspy serve
+
 Note:
     Validation is powered by the core `Spy` class.
+    The Typer commands live in `importspy.commands`; this module only imports
+    them (and typer, pydantic and ruamel with them) when a command has to be
+    run in-process, so `--version` and daemon-forwarded validations start fast.
     Validation errors are caught and displayed with enhanced CLI formatting.
 """
 
-import typer
+# Only the standard library modules Python loads at startup anyway: even
+# `typing` would account for a third of the `--version` run.
+import os
 import sys
-import importlib.util
-from typing import Optional
-from types import ModuleType
-from pathlib import Path
-from importspy import (
-    Spy,
-    __version__
+
+from importspy import __version__
+
+_COMMANDS = (
+    "app",
+    "importspy",
+    "watch_app",
+    "watch",
+    "serve_app",
+    "serve",
+    "show_version",
+    "show_delta",
+    "handle_validation_error",
+    "LogLevel",
 )
-from enum import Enum
-import logging
-import functools
 
-def handle_validation_error(func):
+_ANSI = {"red": 31, "green": 32, "yellow": 33, "magenta": 35, "cyan": 36}
+
+
+def __getattr__(name):
+    # Keeps `importspy.cli.app` and friends importable without paying for
+    # typer at module import time.
+    if name in _COMMANDS:
+        from importspy import commands
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _style(text: str, color: str, bold: bool = False) -> str:
     """
-    Decorator that formats validation errors for CLI output.
+    Color `text` like `typer.style` does, but only when stdout is a terminal.
 
-    Intercepts `ValueError` raised by the `Spy.importspy()` call and presents
-    the error reason in a readable, styled terminal message.
+    Args:
+        text (str): Text to style.
+        color (str): One of the colors used by the CLI.
+        bold (bool, optional): Also make the text bold.
 
-    Used to wrap the main `importspy()` CLI command.
+    Returns:
+        str: The styled text, or `text` itself when stdout is not a terminal.
     """
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            func(*args, **kwargs)
-            typer.echo(typer.style("Module is compliant with the import contract.", fg=typer.colors.GREEN, bold=True))
-        except ValueError as ve:
-            typer.echo(typer.style("Module is NOT compliant with the import contract.", fg=typer.colors.RED, bold=True))
-            typer.echo()
-            typer.secho("Reason:", fg="magenta", bold=True)
-            typer.echo(f"  {typer.style(str(ve), fg='yellow')}")
-    return wrapper
-
-class LogLevel(str, Enum):
-    DEBUG = "DEBUG"
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-
-app = typer.Typer()
-
-@app.command()
-@handle_validation_error
-def importspy(
-    version: Optional[bool] = typer.Option(
-        None,
-        "--version",
-        "-v",
-        callback=lambda value: show_version(value),
-        is_eager=True,
-        help="Show the version and exit."
-    ),
-    modulepath: Optional[str] = typer.Argument(
-        str,
-        help="Path to the Python module to load and validate."
-    ),
-    spymodel_path: Optional[str] = typer.Option(
-        "spymodel.yml",
-        "--spymodel",
-        "-s",
-        help="Path to the import contract file (.yml)."
-    ),
-    log_level: Optional[LogLevel] = typer.Option(
-        None,
-        "--log-level",
-        "-l",
-        help="Log level for output verbosity."
-    )
-) -> ModuleType:
+    if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+        return text
+    codes = f"{_ANSI[color]};1" if bold else str(_ANSI[color])
+    return f"\033[{codes}m{text}\033[0m"
+
+
+def _simple_validation(args: list[str]) -> tuple[str, str] | None:
     """
-    Validates a Python module against a YAML-defined SpyModel contract.
+    Recognize `<module> [-s <contract>]`, the form that can be forwarded to a daemon.
 
     Args:
-        version (bool, optional): Show ImportSpy version and exit.
-        modulepath (str): Path to the Python module to validate.
-        spymodel_path (str, optional): Path to the YAML contract file. Defaults to `spymodel.yml`.
-        log_level (LogLevel, optional): Set logging verbosity (DEBUG, INFO, WARNING, ERROR).
+        args (list[str]): Command-line arguments, without the program name.
 
     Returns:
-        ModuleType: The validated Python module (if compliant).
+        tuple[str, str] | None: The module and contract paths, or `None`
+        for any other form, which is left to the Typer command.
+    """
+    modulepath, spymodel_path = None, "spymodel.yml"
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        if arg in ("-s", "--spymodel") and args:
+            spymodel_path = args.pop(0)
+        elif arg.startswith("--spymodel="):
+            spymodel_path = arg.split("=", 1)[1]
+        elif arg.startswith("-") or modulepath is not None:
+            return None
+        else:
+            modulepath = arg
+    if modulepath is None:
+        return None
+    return modulepath, spymodel_path
+
+
+def report(error: str | None):
+    """
+    Print the outcome of a validation, however it was run.
 
-    Raises:
-        ValueError: If the module does not conform to the contract.
+    Args:
+        error (str | None): The violation message, or `None` if the module is compliant.
     """
-    module_path = Path(modulepath).resolve()
-    module_name = module_path.stem
-    spec = importlib.util.spec_from_file_location(module_name, str(module_path))
-    info_module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = info_module
-    spec.loader.exec_module(info_module)
-
-    Spy().importspy(
-        filepath=spymodel_path,
-        log_level=logging.getLevelNamesMapping()[log_level] if log_level else None,
-        info_module=info_module
-    )
-
-def show_version(value: bool):
+    if error is None:
+        print(_style("Module is compliant with the import contract.", "green", bold=True))
+    else:
+        print(_style("Module is NOT compliant with the import contract.", "red", bold=True))
+        print()
+        print(_style("Reason:", "magenta", bold=True))
+        print(f"  {_style(error, 'yellow')}")
+
+
+def forward_to_daemon(modulepath: str, spymodel_path: str) -> bool:
     """
-    Displays the current version of ImportSpy and exits the process.
+    Validate through a running daemon and print the outcome.
 
     Args:
-        value (bool): If True, prints the version and exits immediately.
+        modulepath (str): Path to the Python module to validate.
+        spymodel_path (str): Path to the YAML contract file.
+
+    Returns:
+        bool: False if no daemon answered and the validation must run in-process.
     """
-    if value:
-        typer.secho(f"ImportSpy v{__version__}", fg="cyan", bold=True)
-        raise typer.Exit()
+    from importspy.daemon import DaemonClient
+
+    verdict = DaemonClient().validate(modulepath, spymodel_path)
+    if verdict is None:
+        return False
+    report(None if verdict.compliant else str(verdict.error))
+    return True
+
 
 def main():
     """
@@ -141,5 +155,26 @@ def main():
     Executes the `importspy` Typer app, allowing CLI usage like:
 
         $ importspy my_module.py -s my_contract.yml
+
+    `importspy watch ...` and `importspy serve ...` are routed to the watch
+    mode and daemon apps instead. `--version` and validations answered by a
+    running daemon are handled here, before typer is imported.
     """
-    app()
+    args = sys.argv[1:]
+    if args in (["--version"], ["-v"]):
+        print(_style(f"ImportSpy v{__version__}", "cyan", bold=True))
+        return
+    simple = None if args[:1] in (["watch"], ["serve"]) else _simple_validation(args)
+    if simple is not None:
+        if forward_to_daemon(*simple):
+            return
+        args = [*args, "--no-daemon"]
+
+    from importspy import commands
+
+    if args[:1] == ["watch"]:
+        commands.watch_app(args=args[1:], prog_name="importspy watch")
+    elif args[:1] == ["serve"]:
+        commands.serve_app(args=args[1:], prog_name="importspy serve")
+    else:
+        commands.app(args=args, prog_name="importspy")
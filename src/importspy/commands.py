@@ -0,0 +1,255 @@
+"""
+Typer commands behind the `importspy` CLI.
+
+The commands live apart from `importspy.cli` so that the entry point can
+answer `--version` and forward validations to a running daemon without
+importing typer; this module is only imported when a command has to be
+parsed and run. The validation machinery (`Spy`, pydantic models, the YAML
+parser) is in turn imported by the command bodies that use it.
+"""
+
+import typer
+from typing import List, Optional
+from types import ModuleType
+from pathlib import Path
+from importspy import __version__
+from importspy.cli import forward_to_daemon, report
+from enum import Enum
+import contextlib
+import logging
+import functools
+
+def handle_validation_error(func):
+    """
+    Decorator that formats validation errors for CLI output.
+
+    Intercepts `ValueError` raised by the `Spy.importspy()` call and presents
+    the error reason in a readable, styled terminal message.
+
+    Used to wrap the main `importspy()` CLI command.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            func(*args, **kwargs)
+        except ValueError as ve:
+            report(str(ve))
+        else:
+            report(None)
+    return wrapper
+
+class LogLevel(str, Enum):
+    DEBUG = "DEBUG"
+    INFO = "INFO"
+    WARNING = "WARNING"
+    ERROR = "ERROR"
+
+app = typer.Typer()
+
+@app.command()
+@handle_validation_error
+def importspy(
+    version: Optional[bool] = typer.Option(
+        None,
+        "--version",
+        "-v",
+        callback=lambda value: show_version(value),
+        is_eager=True,
+        help="Show the version and exit."
+    ),
+    modulepath: Optional[str] = typer.Argument(
+        str,
+        help="Path to the Python module to load and validate."
+    ),
+    spymodel_path: Optional[str] = typer.Option(
+        "spymodel.yml",
+        "--spymodel",
+        "-s",
+        help="Path to the import contract file (.yml)."
+    ),
+    log_level: Optional[LogLevel] = typer.Option(
+        None,
+        "--log-level",
+        "-l",
+        help="Log level for output verbosity."
+    ),
+    no_daemon: bool = typer.Option(
+        False,
+        "--no-daemon",
+        help="Validate in-process even if an ImportSpy daemon is running."
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Print the time spent in each validation phase (validates in-process)."
+    ),
+    trace_path: Optional[str] = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace-event JSON file of the validation (validates in-process)."
+    )
+) -> ModuleType:
+    """
+    Validates a Python module against a YAML-defined SpyModel contract.
+
+    Args:
+        version (bool, optional): Show ImportSpy version and exit.
+        modulepath (str): Path to the Python module to validate.
+        spymodel_path (str, optional): Path to the YAML contract file. Defaults to `spymodel.yml`.
+        log_level (LogLevel, optional): Set logging verbosity (DEBUG, INFO, WARNING, ERROR).
+        no_daemon (bool, optional): Skip the daemon and validate in-process.
+        timings (bool, optional): Print a table of the time spent in each phase.
+        trace_path (str, optional): Write the validation spans to this file, for Perfetto or chrome://tracing.
+
+    Returns:
+        ModuleType: The validated Python module (if compliant and validated in-process).
+
+    Raises:
+        ValueError: If the module does not conform to the contract.
+    """
+    if not no_daemon and not log_level and not timings and not trace_path and forward_to_daemon(modulepath, spymodel_path):
+        raise typer.Exit()
+
+    from importspy.s import Spy
+    from importspy.timings import PHASE_LOAD, record, span
+    from importspy.tracing import tracing
+    from importspy.utilities.module_util import ModuleUtil
+
+    try:
+        with tracing(trace_path) if trace_path else contextlib.nullcontext(), record() as recorded:
+            with span(PHASE_LOAD):
+                info_module = ModuleUtil().import_from_path(str(Path(modulepath).resolve()))
+
+            Spy().importspy(
+                filepath=spymodel_path,
+                log_level=logging.getLevelNamesMapping()[log_level] if log_level else None,
+                info_module=info_module,
+                reload=False
+            )
+    finally:
+        if timings:
+            show_timings(recorded)
+
+def show_version(value: bool):
+    """
+    Displays the current version of ImportSpy and exits the process.
+
+    Args:
+        value (bool): If True, prints the version and exits immediately.
+    """
+    if value:
+        typer.secho(f"ImportSpy v{__version__}", fg="cyan", bold=True)
+        raise typer.Exit()
+
+def show_timings(timings: dict):
+    """
+    Prints the time spent in each validation phase as a table.
+
+    Args:
+        timings (dict): Seconds per phase, as recorded by `importspy.timings.record()`.
+    """
+    from importspy.timings import format_timings
+
+    typer.secho("Timings:", fg="cyan", bold=True)
+    typer.echo(format_timings(timings))
+    typer.echo()
+
+watch_app = typer.Typer()
+
+@watch_app.command()
+def watch(
+    paths: List[str] = typer.Argument(
+        ...,
+        help="Python modules or directories to watch."
+    ),
+    spymodel_path: str = typer.Option(
+        "spymodel.yml",
+        "--spymodel",
+        "-s",
+        help="Path to the import contract file (.yml)."
+    ),
+    debounce: float = typer.Option(
+        0.2,
+        "--debounce",
+        help="Seconds to wait for a burst of saves to settle."
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Poll for changes instead of using inotify."
+    )
+):
+    """
+    Revalidates modules whenever they or the contract change, printing only
+    the modules whose verdict changed.
+
+    Args:
+        paths (List[str]): Modules or directories, searched recursively for `.py` files.
+        spymodel_path (str, optional): Path to the YAML contract file. Defaults to `spymodel.yml`.
+        debounce (float, optional): Seconds to wait for a burst of saves to settle.
+        poll (bool, optional): Poll for changes instead of using inotify.
+    """
+    from importspy.watch import Watcher
+
+    watcher = Watcher(paths, spymodel_path, debounce=debounce, use_inotify=not poll)
+    mode = "inotify" if watcher.uses_inotify else "polling"
+    typer.secho(f"Watching {len(paths)} path(s) against {spymodel_path} ({mode}). Press Ctrl+C to stop.", fg="cyan")
+    try:
+        watcher.run(show_delta)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+serve_app = typer.Typer()
+
+@serve_app.command()
+def serve(
+    socket_path: Optional[str] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket to listen on. Defaults to $IMPORTSPY_SOCKET or a per-user runtime path."
+    ),
+    metrics_textfile: Optional[str] = typer.Option(
+        None,
+        "--metrics-textfile",
+        help="Keep Prometheus metrics in this file, for the node_exporter textfile collector."
+    )
+):
+    """
+    Runs a validation daemon that keeps contracts and caches warm, answering
+    `importspy` invocations over a Unix domain socket.
+
+    Args:
+        socket_path (str, optional): Unix socket to listen on.
+        metrics_textfile (str, optional): File rewritten with the metrics after every request.
+    """
+    from importspy.daemon import SpyServer
+
+    try:
+        server = SpyServer(socket_path, metrics_textfile=metrics_textfile)
+    except RuntimeError as e:
+        typer.secho(str(e), fg=typer.colors.RED, bold=True)
+        raise typer.Exit(1)
+    typer.secho(f"ImportSpy daemon listening on {server.socket_path}. Press Ctrl+C to stop.", fg="cyan")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def show_delta(delta):
+    """
+    Prints a change in the verdict of a watched module.
+
+    Args:
+        delta (Delta): The change reported by the watcher.
+    """
+    if delta.compliant is None:
+        typer.echo(f"{typer.style('removed', fg=typer.colors.BLUE, bold=True)}        {delta.module}")
+    elif delta.compliant:
+        typer.echo(f"{typer.style('compliant', fg=typer.colors.GREEN, bold=True)}      {delta.module}")
+    else:
+        typer.echo(f"{typer.style('NOT compliant', fg=typer.colors.RED, bold=True)}  {delta.module}")
+        typer.echo(f"  {typer.style(str(delta.error), fg='yellow')}")
@@ -0,0 +1,312 @@
+"""
+Reverse index from contract clauses to the modules validated against them.
+
+When a contract shared by many plugins is edited, revalidating every plugin
+means re-importing all of them. Most edits touch one clause, though: a new
+required method, a changed variable value, an extra environment variable.
+
+`ContractIndex` records, for each contract, which modules were validated
+against which clause (module identity, variable, function, class,
+environment variable, deployment), together with the structure extracted
+from each module and its verdict. `revalidate()` then diffs the edited
+contract against the clauses every module was checked against and re-checks
+only the affected modules, on their cached structures, without importing
+anything. Previously compliant modules are checked against the changed
+clauses alone; previously failing ones against the whole new contract.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from .batch import ValidationResult
+from .constants import Contexts, Errors
+from .models import Module, SpyModel
+from .verdicts import atomic_write
+from .violation_systems import Bundle, ModuleContractViolation
+
+if TYPE_CHECKING:
+    from .session import SpySession
+
+CLAUSE_MODULE = "module"
+CLAUSE_VARIABLE = "variable"
+CLAUSE_FUNCTION = "function"
+CLAUSE_CLASS = "class"
+CLAUSE_ENV = "env"
+CLAUSE_DEPLOYMENT = "deployment"
+
+
+def contract_clauses(spymodel: SpyModel) -> Dict[str, str]:
+    """
+    Split a contract into clauses, mapping each clause id to its fingerprint.
+
+    Clause ids are stable across edits of the clause itself
+    (`"function:start"`, `"env:0:0:API_KEY"`, `"deployment:0:x86_64"`), while
+    fingerprints change whenever the clause does. Deployments are matched in
+    declaration order, so their ids, and those of the environment variables
+    they declare, carry their position in the contract.
+    """
+    clauses = {
+        CLAUSE_MODULE: hashlib.sha256(f"{spymodel.filename}:{spymodel.version}".encode()).hexdigest()
+    }
+    for kind, entities in (
+        (CLAUSE_VARIABLE, spymodel.variables),
+        (CLAUSE_FUNCTION, spymodel.functions),
+        (CLAUSE_CLASS, spymodel.classes),
+    ):
+        for entity in entities or []:
+            clauses[f"{kind}:{entity.name}"] = entity.fingerprint
+    for position, runtime in enumerate(spymodel.deployments or []):
+        clauses[f"{CLAUSE_DEPLOYMENT}:{position}:{runtime.arch.value}"] = runtime.fingerprint
+        for system_position, system in enumerate(runtime.systems):
+            if system.environment:
+                for variable in system.environment.variables or []:
+                    clauses[f"{CLAUSE_ENV}:{position}:{system_position}:{variable.name}"] = variable.fingerprint
+    return clauses
+
+
+class ContractIndex:
+    """
+    Persisted mapping from contract clauses to dependent modules.
+
+    Entries are kept in memory and, when `directory` is given, also written
+    there as one JSON document per contract and module, so that recording a
+    validation rewrites that module's record alone.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the index.
+
+        Parameters:
+        -----------
+        directory : Optional[str]
+            Directory used to persist the index. If `None`, it only lives in
+            memory for the lifetime of the object.
+        """
+        self.directory = directory
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self,
+               contract_path: str,
+               spymodel: SpyModel,
+               modulepath: str,
+               module: Module,
+               error: Optional[str] = None):
+        """
+        Record that `module` was validated against `spymodel`.
+
+        Parameters:
+        -----------
+        contract_path : str
+            Path of the contract the module was validated against.
+
+        spymodel : SpyModel
+            The contract as parsed for that validation.
+
+        modulepath : str
+            Path of the validated module.
+
+        module : Module
+            Structure extracted from the module, reused by `revalidate()`.
+
+        error : Optional[str]
+            The violation reported, or `None` if the module was compliant.
+        """
+        modulepath = os.path.abspath(modulepath)
+        record = {
+            "module": modulepath,
+            "clauses": contract_clauses(spymodel),
+            "structure": module.model_dump(mode="json"),
+            "error": error,
+        }
+        with self._lock:
+            self._index(self._load(contract_path), modulepath, record)
+            self._save(contract_path, modulepath, record)
+
+    def forget(self, contract_path: str, modulepath: str):
+        """
+        Drop the record of a module, e.g. after its file was deleted.
+        """
+        modulepath = os.path.abspath(modulepath)
+        with self._lock:
+            if self._index(self._load(contract_path), modulepath, None):
+                self._save(contract_path, modulepath, None)
+
+    def modules_for(self, contract_path: str, clause: str) -> Set[str]:
+        """
+        Return the modules whose verdict depended on `clause` of the contract.
+        """
+        with self._lock:
+            return set(self._load(contract_path)["clauses"].get(clause, []))
+
+    def affected(self, contract_path: str, spymodel: SpyModel) -> Dict[str, Set[str]]:
+        """
+        Return, for each module bound to the contract, the clauses that differ
+        between `spymodel` and the version the module was validated against.
+        Modules with no differing clause are left out.
+        """
+        clauses = contract_clauses(spymodel)
+        with self._lock:
+            entry = self._load(contract_path)
+            candidates: Set[str] = set()
+            for clause in set(clauses) | set(entry["clauses"]):
+                dependents = entry["clauses"].get(clause)
+                if dependents is None:
+                    candidates.update(entry["modules"])
+                else:
+                    candidates.update(
+                        modulepath for modulepath in dependents
+                        if entry["modules"][modulepath]["clauses"].get(clause) != clauses.get(clause)
+                    )
+            affected = {}
+            for modulepath in candidates:
+                recorded = entry["modules"][modulepath]["clauses"]
+                changed = {clause for clause in set(recorded) | set(clauses) if recorded.get(clause) != clauses.get(clause)}
+                if changed:
+                    affected[modulepath] = changed
+            return affected
+
+    def revalidate(self, contract_path: str, session: 'SpySession') -> List[ValidationResult]:
+        """
+        Re-check the modules affected by an edit of the contract, on their
+        cached structures and without importing them.
+
+        Parameters:
+        -----------
+        contract_path : str
+            Path of the edited contract.
+
+        session : SpySession
+            Session providing the contract parser, the validators and the host.
+
+        Returns:
+        --------
+        List[ValidationResult]
+            One result per affected module. Modules left out keep their verdict.
+        """
+        spymodel = session.load_contract(contract_path)
+        results = []
+        for modulepath, changed in sorted(self.affected(contract_path, spymodel).items()):
+            started = time.perf_counter()
+            with self._lock:
+                record = self._load(contract_path)["modules"][modulepath]
+            module = Module.model_validate(record["structure"])
+            try:
+                if record["error"] is None and not any(
+                    clause.split(":")[0] in (CLAUSE_ENV, CLAUSE_DEPLOYMENT) for clause in changed
+                ):
+                    self._check_clauses(session, spymodel, module, changed)
+                else:
+                    session._validate_structure(spymodel, module, session.host())
+                error = None
+            except ValueError as ve:
+                error = str(ve)
+            self.record(contract_path, spymodel, modulepath, module, error)
+            results.append(ValidationResult(
+                modulepath,
+                contract_path,
+                compliant=error is None,
+                violations=[error] if error else [],
+                timings={"total": time.perf_counter() - started}
+            ))
+        return results
+
+    def clear(self):
+        """
+        Forget every in-memory entry. Persisted entries are left untouched.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _check_clauses(session: 'SpySession', spymodel: SpyModel, module: Module, changed: Set[str]):
+        """
+        Validate `module` against the changed module-level clauses only.
+        Removed clauses cannot introduce a violation and are ignored; the
+        module filename and version are always part of the check.
+        """
+        names = {kind: {clause.split(":", 1)[1] for clause in changed if clause.startswith(f"{kind}:")}
+                 for kind in (CLAUSE_VARIABLE, CLAUSE_FUNCTION, CLAUSE_CLASS)}
+        partial = Module(
+            filename=spymodel.filename,
+            version=spymodel.version,
+            variables=[v for v in spymodel.variables or [] if v.name in names[CLAUSE_VARIABLE]],
+            functions=[f for f in spymodel.functions or [] if f.name in names[CLAUSE_FUNCTION]],
+            classes=[c for c in spymodel.classes or [] if c.name in names[CLAUSE_CLASS]]
+        )
+        bundle = Bundle()
+        bundle[Errors.KEY_FILE_NAME] = spymodel.filename
+        session.module_validator.validate(
+            [partial],
+            module,
+            ModuleContractViolation(Contexts.MODULE_CONTEXT, bundle)
+        )
+
+    @staticmethod
+    def _index(entry: dict, modulepath: str, record: Optional[dict]) -> bool:
+        """
+        Replace the record of a module, or drop it if `record` is `None`, and
+        update the reverse mapping. Returns whether a previous record existed.
+        """
+        previous = entry["modules"].pop(modulepath, None)
+        if previous is not None:
+            for clause in previous["clauses"]:
+                dependents = entry["clauses"].get(clause)
+                if dependents is not None:
+                    dependents.discard(modulepath)
+                    if not dependents:
+                        del entry["clauses"][clause]
+        if record is not None:
+            entry["modules"][modulepath] = record
+            for clause in record["clauses"]:
+                entry["clauses"].setdefault(clause, set()).add(modulepath)
+        return previous is not None
+
+    def _load(self, contract_path: str) -> dict:
+        contract_path = os.path.abspath(contract_path)
+        entry = self._entries.get(contract_path)
+        if entry is not None:
+            return entry
+        entry = {"clauses": {}, "modules": {}}
+        if self.directory:
+            directory = self._path(contract_path)
+            try:
+                names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+            except OSError:
+                names = []
+            for name in names:
+                try:
+                    with open(os.path.join(directory, name)) as file:
+                        record = json.load(file)
+                    self._index(entry, record["module"], record)
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue
+        self._entries[contract_path] = entry
+        return entry
+
+    def _save(self, contract_path: str, modulepath: str, record: Optional[dict]):
+        if not self.directory:
+            return
+        directory = self._path(os.path.abspath(contract_path))
+        path = os.path.join(directory, f"{hashlib.sha256(modulepath.encode()).hexdigest()}.json")
+        if record is None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return
+        try:
+            os.makedirs(directory, exist_ok=True)
+            atomic_write(path, json.dumps(record))
+        except OSError:
+            pass
+
+    def _path(self, contract_path: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(contract_path.encode()).hexdigest())
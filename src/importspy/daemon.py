@@ -0,0 +1,424 @@
+"""
+Validation daemon for ImportSpy.
+
+Every one-shot `importspy` invocation pays for starting Python, importing
+pydantic and ruamel, building the model schemas and parsing the contract,
+which dominates when a pre-commit hook or an editor runs it on every save.
+`importspy serve` starts a long-lived daemon that keeps all of that warm in
+a `SpySession` and answers validation requests on a Unix domain socket; the
+CLI forwards its requests there when a daemon is running and validates
+in-process otherwise.
+
+Protocol: each message is a frame made of a 4-byte big-endian length
+followed by that many bytes of UTF-8 JSON. A connection can carry any
+number of request/response pairs. A request names the module and contract
+by absolute path and carries the client's Python version; the daemon
+declines requests from a different Python (`"status": "mismatch"`) and the
+client then falls back to in-process validation. So that runtime clauses
+are checked against the client rather than the daemon, the daemon answers
+a request without `"env"` with the names of the environment variables the
+contract references (`"status": "env"`), and the client sends back the
+values of those variables alone before getting the verdict.
+
+The plugin runs in the daemon process, so a request also carries the
+client's working directory and `sys.path`: the daemon runs one plugin at a
+time with those in place, and the values of the declared variables set in
+`os.environ`, then evicts the modules the plugin imported outside the
+standard library, so that a helper edited between two requests is imported
+again. Other environment variables are the daemon's own.
+
+The socket only accepts connections from its owner: it is created with mode
+0600, by default in a directory private to the user, and both ends check
+the user id of their peer where the platform reports it (`SO_PEERCRED`).
+
+The client side only depends on the standard library, so that forwarding a
+request stays cheap.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import socket
+import socketserver
+import struct
+import sys
+import tempfile
+import threading
+from typing import Optional
+
+from .verdicts import Verdict, private_directory
+
+HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+SOCKET_ENV = "IMPORTSPY_SOCKET"
+
+STATUS_OK = "ok"
+STATUS_MISMATCH = "mismatch"
+STATUS_ERROR = "error"
+STATUS_ENV = "env"
+
+
+def default_socket_path(create: bool = True) -> str:
+    """
+    Return the socket path used when none is given.
+
+    Honors `IMPORTSPY_SOCKET`, then `XDG_RUNTIME_DIR`, and falls back to a
+    per-user directory in the temporary directory, created with mode 0700.
+
+    Parameters:
+    -----------
+    create : bool
+        Whether to create the fallback directory. Clients pass `False`: no
+        daemon can be listening in a directory that does not exist.
+
+    Raises:
+    -------
+    PermissionError
+        If the fallback directory exists but is not private to the user.
+
+    FileNotFoundError
+        If `create` is false and the fallback directory does not exist.
+    """
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "importspy.sock")
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    directory = os.path.join(tempfile.gettempdir(), f"importspy-{user}")
+    if not create and not os.path.lexists(directory):
+        raise FileNotFoundError(f"{directory} does not exist.")
+    if not private_directory(directory):
+        raise PermissionError(f"{directory} is not a directory private to the current user.")
+    return os.path.join(directory, "importspy.sock")
+
+
+def send_frame(sock: socket.socket, message: dict):
+    """
+    Write one framed JSON message.
+    """
+    payload = json.dumps(message, separators=(",", ":")).encode()
+    sock.sendall(HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> Optional[dict]:
+    """
+    Read one framed JSON message, or return `None` if the peer closed the connection.
+
+    Raises:
+    -------
+    ValueError
+        If the frame is larger than `MAX_FRAME` or truncated.
+    """
+    header = _recv_exactly(sock, HEADER.size)
+    if header is None:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"Frame of {length} bytes exceeds the {MAX_FRAME} bytes limit.")
+    payload = _recv_exactly(sock, length)
+    if payload is None:
+        raise ValueError("Connection closed in the middle of a frame.")
+    return json.loads(payload)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            if chunks:
+                raise ValueError("Connection closed in the middle of a frame.")
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _python_identity() -> list:
+    return [platform.python_version(), platform.python_implementation()]
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """
+    Return the user id of the process at the other end of a Unix socket, or
+    `None` where the platform does not report it.
+    """
+    option = getattr(socket, "SO_PEERCRED", None)
+    if option is None:
+        return None
+    credentials = struct.Struct("3i")
+    _, uid, _ = credentials.unpack(sock.getsockopt(socket.SOL_SOCKET, option, credentials.size))
+    return uid
+
+
+def _trusted_peer(sock: socket.socket) -> bool:
+    """
+    Whether the peer runs as the current user, or cannot be identified.
+    """
+    uid = _peer_uid(sock)
+    return uid is None or uid == os.getuid()
+
+
+class DaemonClient:
+    """
+    Thin client forwarding validations to a running daemon.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, connect_timeout: float = 1.0):
+        """
+        Parameters:
+        -----------
+        socket_path : Optional[str]
+            Socket of the daemon; defaults to `default_socket_path()`, and to
+            none at all if that directory does not exist or is not private
+            to the user. The client never creates it.
+
+        connect_timeout : float
+            Seconds to wait for the daemon to accept the connection.
+        """
+        if socket_path is None:
+            try:
+                socket_path = default_socket_path(create=False)
+            except OSError:
+                socket_path = None
+        self.socket_path = socket_path
+        self.connect_timeout = connect_timeout
+
+    def validate(self, modulepath: str, contract_path: str) -> Optional[Verdict]:
+        """
+        Ask the daemon to validate a module.
+
+        Returns:
+        --------
+        Optional[Verdict]
+            The daemon's verdict, or `None` when the request should be handled
+            in-process instead: no daemon is listening, it runs a different
+            Python or as another user, or the validation failed for a reason
+            other than a contract violation (so that the in-process run
+            reports it).
+        """
+        if self.socket_path is None:
+            return None
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.connect_timeout)
+                sock.connect(self.socket_path)
+                sock.settimeout(None)
+                if not _trusted_peer(sock):
+                    return None
+                send_frame(sock, {
+                    "module": os.path.abspath(modulepath),
+                    "contract": os.path.abspath(contract_path),
+                    "python": _python_identity(),
+                    "cwd": os.getcwd(),
+                    "path": sys.path,
+                })
+                response = recv_frame(sock)
+                if response and response.get("status") == STATUS_ENV:
+                    send_frame(sock, {"env": {
+                        name: os.environ[name] for name in response.get("names", []) if name in os.environ
+                    }})
+                    response = recv_frame(sock)
+        except (OSError, ValueError):
+            return None
+        if not response or response.get("status") != STATUS_OK:
+            return None
+        return Verdict(compliant=response["compliant"], error=response.get("error"))
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        if not _trusted_peer(self.request):
+            return
+        while True:
+            try:
+                request = recv_frame(self.request)
+                if request is None:
+                    return
+                response = self.server.handle_request_message(request)
+                if response["status"] == STATUS_ENV:
+                    send_frame(self.request, response)
+                    reply = recv_frame(self.request)
+                    if reply is None:
+                        return
+                    response = self.server.handle_request_message({**request, "env": reply.get("env", {})})
+            except (OSError, ValueError):
+                return
+            send_frame(self.request, response)
+            self.server.export_metrics()
+
+
+class SpyServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Daemon answering validation requests on a Unix domain socket.
+
+    Requests are served concurrently, one thread per connection, by a single
+    `SpySession` keeping contracts, host description and module structures warm.
+    Plugins are run one at a time, in the context of the client that sent them.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Optional[str] = None, session=None, metrics_textfile: Optional[str] = None):
+        """
+        Bind the socket. A stale socket file left by a dead daemon is replaced.
+
+        Parameters:
+        -----------
+        socket_path : Optional[str]
+            Where to listen; defaults to `default_socket_path()`.
+
+        session : Optional[SpySession]
+            Session serving the requests; a new one is opened when omitted.
+
+        metrics_textfile : Optional[str]
+            File rewritten with `importspy.metrics` after every request, for
+            the node_exporter textfile collector.
+
+        Raises:
+        -------
+        RuntimeError
+            If another daemon is already listening on `socket_path`.
+
+        PermissionError
+            If `socket_path` is omitted and the default socket directory is
+            not private to the user.
+        """
+        from .session import SpySession
+
+        self.socket_path = socket_path or default_socket_path()
+        self.session = session or SpySession()
+        self.metrics_textfile = metrics_textfile
+        self._client_lock = threading.Lock()
+        self._remove_stale_socket()
+        umask = os.umask(0o177)
+        try:
+            super().__init__(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(umask)
+
+    def handle_request_message(self, request: dict) -> dict:
+        """
+        Validate the module named by `request` and build the response message.
+
+        A request without `"env"` is answered with the names of the environment
+        variables the contract references; only those are read from `"env"`.
+        """
+        from .models import Variable
+        from .timings import PHASE_LOAD, record, span
+        from .utilities.module_util import ModuleUtil, VariableInfo
+
+        if request.get("python") != _python_identity():
+            return {"status": STATUS_MISMATCH}
+        if "env" not in request:
+            try:
+                names = _referenced_variables(self.session.load_contract(request["contract"]))
+            except Exception as e:
+                return {"status": STATUS_ERROR, "error": f"{type(e).__name__}: {e}"}
+            return {"status": STATUS_ENV, "names": sorted(names)}
+        with record() as timings:
+            try:
+                spymodel = self.session.load_contract(request["contract"])
+                names = _referenced_variables(spymodel)
+                runtime = self.session.host()[0]
+                system = runtime.systems[0]
+                environment = system.environment.model_copy(update={"variables": Variable.from_variable_info(
+                    [VariableInfo(name, None, value) for name, value in request["env"].items() if name in names]
+                )})
+                host = [runtime.model_copy(update={"systems": [system.model_copy(update={"environment": environment})]})]
+                with self._client_context(request, {name: value for name, value in request["env"].items() if name in names}):
+                    with span(PHASE_LOAD):
+                        info_module = ModuleUtil().import_from_path(request["module"])
+                    self.session.validate(spymodel, info_module, reload=False, host=host)
+                compliant, error = True, None
+            except ValueError as ve:
+                compliant, error = False, str(ve)
+            except Exception as e:
+                return {"status": STATUS_ERROR, "error": f"{type(e).__name__}: {e}"}
+        return {
+            "status": STATUS_OK,
+            "compliant": compliant,
+            "error": error,
+            "timings": timings,
+        }
+
+    @contextlib.contextmanager
+    def _client_context(self, request: dict, env: dict):
+        """
+        Hold the working directory, `sys.path` and `env` of the client while a
+        plugin runs, then restore the daemon's and evict the modules the plugin
+        imported outside the standard library.
+        """
+        with self._client_lock:
+            cwd, path, loaded = os.getcwd(), list(sys.path), set(sys.modules)
+            saved = {name: os.environ.get(name) for name in env}
+            try:
+                os.chdir(request.get("cwd", cwd))
+                sys.path[:] = request.get("path", path)
+                os.environ.update(env)
+                yield
+            finally:
+                for name, value in saved.items():
+                    if value is None:
+                        os.environ.pop(name, None)
+                    else:
+                        os.environ[name] = value
+                sys.path[:] = path
+                os.chdir(cwd)
+                _evict_modules(loaded)
+
+    def export_metrics(self):
+        """
+        Rewrite the metrics textfile, if one is configured.
+        """
+        if self.metrics_textfile:
+            from . import metrics
+
+            try:
+                metrics.write_textfile(self.metrics_textfile)
+            except OSError:
+                pass
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+    def _remove_stale_socket(self):
+        if not os.path.exists(self.socket_path):
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                os.unlink(self.socket_path)
+                return
+        raise RuntimeError(f"An ImportSpy daemon is already listening on {self.socket_path}.")
+
+
+def _evict_modules(loaded: set):
+    """
+    Remove from `sys.modules` the modules imported since `loaded` was taken,
+    except those of the standard library and of packages already loaded then.
+    """
+    roots = {name.partition(".")[0] for name in loaded} | set(sys.stdlib_module_names)
+    for name in [name for name in sys.modules if name not in loaded]:
+        if name.partition(".")[0] not in roots:
+            sys.modules.pop(name, None)
+
+
+def _referenced_variables(spymodel) -> set:
+    """
+    Return the names of the environment variables declared by the contract.
+    """
+    return {
+        variable.name
+        for runtime in spymodel.deployments or []
+        for system in runtime.systems
+        if system.environment
+        for variable in system.environment.variables or []
+    }
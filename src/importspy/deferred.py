@@ -0,0 +1,112 @@
+"""
+Deferred validation for ImportSpy.
+
+By default `Spy.importspy` validates synchronously inside the importing
+module's top-level code, so its whole cost lands on the import critical path.
+In deferred mode validation is submitted to a background thread instead and
+the caller immediately receives a `DeferredModule`: a lightweight proxy that
+resolves to the validated module on first attribute access, re-raising the
+contract violation there if validation failed.
+
+Failures can also be observed without touching the proxy, either through an
+`on_failure` callback or through the `concurrent.futures.Future` returned by
+`future_of()`.
+
+Note:
+    Accessing the proxy blocks until validation completes. Since validation
+    re-executes the importing module, which in turn imports the core module,
+    do not access the proxy from the core module's own top-level code: keep it
+    and use it from functions called once the import has completed.
+"""
+
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+_executor: Optional['ThreadPoolExecutor'] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> 'ThreadPoolExecutor':
+    """
+    Return the thread pool shared by all deferred validations, creating it lazily.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="importspy")
+        return _executor
+
+
+class DeferredModule:
+    """
+    Proxy standing in for a module whose validation is still running.
+
+    Every attribute read, write or listing waits for the validation to finish
+    and is then forwarded to the validated module. If validation failed, the
+    original `ValueError` is raised instead.
+    """
+
+    __slots__ = ("_importspy_future",)
+
+    def __init__(self, future: 'Future'):
+        object.__setattr__(self, "_importspy_future", future)
+
+    def __getattr__(self, name):
+        return getattr(self._importspy_future.result(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._importspy_future.result(), name, value)
+
+    def __dir__(self):
+        return dir(self._importspy_future.result())
+
+    def __repr__(self):
+        future = self._importspy_future
+        if not future.done():
+            return "<DeferredModule (validating)>"
+        if future.exception():
+            return "<DeferredModule (not compliant)>"
+        return f"<DeferredModule {future.result()!r}>"
+
+
+def future_of(module: DeferredModule) -> 'Future':
+    """
+    Return the future tracking the validation behind a `DeferredModule`.
+
+    Its result is the validated module; its exception is the contract violation.
+    """
+    return object.__getattribute__(module, "_importspy_future")
+
+
+def defer(validate: Callable[[], ModuleType],
+          on_failure: Optional[Callable[[BaseException], None]] = None) -> DeferredModule:
+    """
+    Run `validate` in the background and return a proxy for its result.
+
+    Parameters:
+    -----------
+    validate : Callable[[], ModuleType]
+        The blocking validation to run, returning the validated module.
+
+    on_failure : Optional[Callable[[BaseException], None]]
+        Called from the background thread with the raised exception if
+        validation fails.
+
+    Returns:
+    --------
+    DeferredModule
+        Proxy resolving to the validated module.
+    """
+    future = get_executor().submit(validate)
+    if on_failure:
+        def _notify(done: 'Future'):
+            if not done.cancelled() and done.exception() is not None:
+                on_failure(done.exception())
+        future.add_done_callback(_notify)
+    return DeferredModule(future)
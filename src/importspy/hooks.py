@@ -0,0 +1,187 @@
+"""
+Import hook that enforces import contracts at import time.
+
+Instead of having every core module call `Spy().importspy(...)`, an
+`ImportSpyFinder` is installed once on `sys.meta_path` with a routing table
+that maps module-name glob patterns to contract files. Whenever a matching
+module is imported, the finder wraps the loader chosen by the regular import
+machinery so that, right after the module has been executed, the very same
+module object is validated against its contract.
+
+Verdicts are cached per (module source hash, contract hash, host profile), so a
+module that already passed (or failed) under an unchanged contract is not
+validated again, neither by later imports nor, with the default persistent
+cache, by later processes.
+
+Example:
+    ```python
+    from importspy import hooks
+
+    hooks.install({"plugins.*": "contracts/plugin.yml"})
+    import plugins.extension  # validated before the import statement returns
+    ```
+"""
+
+import fnmatch
+import importlib.abc
+import sys
+from types import ModuleType
+from typing import Optional
+
+from .log_manager import LogManager
+from .verdicts import (
+    VerdictCache,
+    default_cache_dir
+)
+
+
+class ImportSpyLoader(importlib.abc.Loader):
+    """
+    Loader wrapper that validates a module once it has been executed.
+
+    Module creation and execution are delegated to the wrapped loader; any
+    other loader attribute (e.g. `get_source`) is forwarded as well, so the
+    wrapper stays transparent to tools that introspect `__loader__`.
+    """
+
+    def __init__(self, loader: importlib.abc.Loader, contract: str, finder: 'ImportSpyFinder'):
+        self.loader = loader
+        self.contract = contract
+        self.finder = finder
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType):
+        self.loader.exec_module(module)
+        self.finder.validate(module, self.contract)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class ImportSpyFinder(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that routes matching imports through contract validation.
+
+    Attributes:
+    -----------
+    routes : dict[str, str]
+        Module-name glob patterns mapped to contract paths. The first pattern
+        matching a module name wins.
+
+    cache : VerdictCache
+        Where verdicts are remembered between imports and processes.
+
+    log_level : Optional[int]
+        Log level forwarded to `Spy.importspy`.
+
+    revalidate : bool
+        Ignore cached verdicts and validate every matching import again.
+    """
+
+    def __init__(self,
+                 routes: dict[str, str],
+                 cache: Optional[VerdictCache] = None,
+                 log_level: Optional[int] = None,
+                 revalidate: bool = False):
+        self.routes = dict(routes)
+        self.cache = cache if cache is not None else VerdictCache(default_cache_dir())
+        self.log_level = log_level
+        self.revalidate = revalidate
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+
+    def route(self, fullname: str) -> Optional[str]:
+        """
+        Return the contract bound to `fullname`, or `None` if no pattern matches.
+        """
+        if fullname.split(".")[0] == "importspy":
+            return None
+        for pattern, contract in self.routes.items():
+            if fnmatch.fnmatchcase(fullname, pattern):
+                return contract
+        return None
+
+    def find_spec(self, fullname, path, target=None):
+        contract = self.route(fullname)
+        if not contract:
+            return None
+        for finder in sys.meta_path:
+            if isinstance(finder, ImportSpyFinder) or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is None or not spec.has_location:
+                return spec
+            spec.loader = ImportSpyLoader(spec.loader, contract, self)
+            return spec
+        return None
+
+    def validate(self, module: ModuleType, contract: str):
+        """
+        Validate an already executed module, consulting the verdict cache first.
+
+        Parameters:
+        -----------
+        module : ModuleType
+            The module object just created by the import system.
+
+        contract : str
+            Path to the import contract bound to the module.
+
+        Raises:
+        -------
+        ValueError
+            If the module does not satisfy the contract, either now or
+            according to a cached verdict.
+        """
+        from .s import Spy
+
+        self.logger.debug(f"Validating {module.__name__} against {contract}")
+        Spy(verdicts=self.cache).importspy(
+            filepath=contract,
+            log_level=self.log_level,
+            info_module=module,
+            reload=False,
+            revalidate=self.revalidate
+        )
+
+
+def install(routes: dict[str, str],
+            cache: Optional[VerdictCache] = None,
+            log_level: Optional[int] = None,
+            revalidate: bool = False) -> ImportSpyFinder:
+    """
+    Create an `ImportSpyFinder` and put it in front of `sys.meta_path`.
+
+    Parameters:
+    -----------
+    routes : dict[str, str]
+        Module-name glob patterns mapped to contract paths.
+
+    cache : Optional[VerdictCache]
+        Verdict cache to use. Defaults to a persistent cache in the user cache directory.
+
+    log_level : Optional[int]
+        Log level used while validating.
+
+    revalidate : bool
+        Ignore cached verdicts and validate every matching import again.
+
+    Returns:
+    --------
+    ImportSpyFinder
+        The installed finder, to be passed to `uninstall()`.
+    """
+    finder = ImportSpyFinder(routes, cache=cache, log_level=log_level, revalidate=revalidate)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def uninstall(finder: ImportSpyFinder):
+    """
+    Remove a finder previously returned by `install()` from `sys.meta_path`.
+    """
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
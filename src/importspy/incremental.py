@@ -0,0 +1,234 @@
+"""
+Incremental revalidation for ImportSpy.
+
+A contract clause on a function or a class only depends on two things: the
+expected entity declared by the contract and the entity of the same name
+found in the module. Both have a structural fingerprint, so once a clause
+has been checked its outcome stays valid for as long as neither fingerprint
+changes.
+
+`IncrementalValidator` records the outcome of every function and class
+clause, keyed by those fingerprints, and on the next run re-runs
+`FunctionValidator` / `ClassValidator` only for clauses whose fingerprints
+changed. The rest reuse their previous outcome and are reported as skipped,
+so editing one method of a large plugin rechecks that method's class alone.
+Outcomes are kept per module file in an `IncrementalStore`, in memory or
+persisted to a directory so that they survive between processes.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .constants import Contexts, Errors
+from .models import Module, SpyModel
+from .validators import ClassValidator, FunctionValidator
+from .verdicts import atomic_write
+from .violation_systems import (
+    Bundle,
+    FunctionContractViolation,
+    ModuleContractViolation
+)
+
+ENTITY_FUNCTION = "function"
+ENTITY_CLASS = "class"
+
+
+@dataclass
+class IncrementalReport:
+    """
+    Outcome of an incremental validation.
+
+    Attributes:
+    -----------
+    compliant : bool
+        Whether the module satisfied the contract.
+
+    violations : List[str]
+        Violation messages, one per failing clause.
+
+    checked : List[str]
+        Entities whose clauses were validated in this run, e.g. `"class Plugin"`.
+
+    skipped : List[str]
+        Entities whose previous outcome was reused because neither the
+        contract nor the module changed them.
+    """
+
+    compliant: bool
+    violations: List[str] = field(default_factory=list)
+    checked: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+
+def strip_entities(spymodel: SpyModel) -> SpyModel:
+    """
+    Copy a contract without its function and class clauses, at module level
+    and in every deployment, leaving the checks that are always re-run.
+    """
+    deployments = [
+        runtime.model_copy(update={"systems": [
+            system.model_copy(update={"pythons": [
+                python.model_copy(update={"modules": [
+                    module.model_copy(update={"functions": None, "classes": None})
+                    for module in python.modules
+                ]})
+                for python in system.pythons
+            ]})
+            for system in runtime.systems
+        ]})
+        for runtime in spymodel.deployments or []
+    ]
+    return spymodel.model_copy(update={
+        "functions": None,
+        "classes": None,
+        "deployments": deployments if spymodel.deployments is not None else None
+    })
+
+
+class IncrementalStore:
+    """
+    Clause outcomes recorded for each module file.
+
+    Outcomes are kept in memory and, when `directory` is given, also written
+    there as one JSON document per module.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Parameters:
+        -----------
+        directory : Optional[str]
+            Directory used to persist outcomes. If `None`, they only live in
+            memory for the lifetime of the store.
+        """
+        self.directory = directory
+        self._states: Dict[str, Dict[str, dict]] = {}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, modulepath: str) -> Dict[str, dict]:
+        """
+        Return the outcomes recorded for the module at `modulepath`.
+        """
+        modulepath = os.path.abspath(modulepath)
+        state = self._states.get(modulepath)
+        if state is None and self.directory:
+            try:
+                with open(self._path(modulepath)) as file:
+                    state = json.load(file)
+            except (OSError, ValueError):
+                state = None
+        return state or {}
+
+    def put(self, modulepath: str, state: Dict[str, dict]):
+        """
+        Record the outcomes of a run for the module at `modulepath`.
+        """
+        modulepath = os.path.abspath(modulepath)
+        self._states[modulepath] = state
+        if self.directory:
+            try:
+                atomic_write(self._path(modulepath), json.dumps(state))
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Forget every in-memory outcome. Persisted outcomes are left untouched.
+        """
+        self._states.clear()
+
+    def _path(self, modulepath: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(modulepath.encode()).hexdigest()}.json")
+
+
+class IncrementalValidator:
+    """
+    Validates function and class clauses, reusing unchanged outcomes.
+    """
+
+    def __init__(self):
+        self.function_validator = FunctionValidator()
+        self.class_validator = ClassValidator()
+
+    def validate(self,
+                 modules_1: List[Module],
+                 module_2: Module,
+                 previous: Dict[str, dict]) -> Tuple[Dict[str, dict], IncrementalReport]:
+        """
+        Check every function and class clause of `modules_1` against `module_2`.
+
+        Parameters:
+        -----------
+        modules_1 : List[Module]
+            Expected modules: the contract itself and the modules declared by
+            its matching deployment.
+
+        module_2 : Module
+            Observed module structure.
+
+        previous : Dict[str, dict]
+            Outcomes recorded by the previous run for this module.
+
+        Returns:
+        --------
+        Tuple[Dict[str, dict], IncrementalReport]
+            The outcomes to record for the next run, and the report.
+        """
+        state: Dict[str, dict] = {}
+        report = IncrementalReport(compliant=True)
+        for module_1 in modules_1:
+            for kind, expected_entities, observed_entities in (
+                (ENTITY_FUNCTION, module_1.functions, module_2.functions),
+                (ENTITY_CLASS, module_1.classes, module_2.classes),
+            ):
+                for expected in expected_entities or []:
+                    observed = next((entity for entity in observed_entities or [] if entity.name == expected.name), None)
+                    key = f"{kind}:{expected.name}:{expected.fingerprint}"
+                    observed_fingerprint = observed.fingerprint if observed else None
+                    label = f"{kind} {expected.name}"
+                    outcome = previous.get(key)
+                    if outcome is not None and outcome["observed"] == observed_fingerprint:
+                        report.skipped.append(label)
+                    else:
+                        outcome = {
+                            "observed": observed_fingerprint,
+                            "error": self._check(kind, module_1, expected, observed_entities)
+                        }
+                        report.checked.append(label)
+                    state[key] = outcome
+                    if outcome["error"] is not None:
+                        report.compliant = False
+                        report.violations.append(outcome["error"])
+        return state, report
+
+    def _check(self, kind: str, module_1: Module, expected, observed_entities) -> Optional[str]:
+        """
+        Validate a single clause, returning its violation message if any.
+        """
+        bundle = Bundle()
+        bundle[Errors.KEY_MODULES_1] = [module_1]
+        bundle[Errors.KEY_MODULE_NAME] = module_1.filename
+        bundle[Errors.KEY_MODULE_VERSION] = module_1.version
+        bundle[Errors.KEY_FILE_NAME] = module_1.filename
+        try:
+            if kind == ENTITY_FUNCTION:
+                self.function_validator.validate(
+                    [expected],
+                    observed_entities,
+                    FunctionContractViolation(Contexts.MODULE_CONTEXT, bundle)
+                )
+            else:
+                self.class_validator.validate(
+                    [expected],
+                    observed_entities,
+                    ModuleContractViolation(Contexts.CLASS_CONTEXT, bundle)
+                )
+        except ValueError as ve:
+            return str(ve)
+        return None
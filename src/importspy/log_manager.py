@@ -13,6 +13,7 @@ contract resolution, and runtime introspection.
 """
 
 import logging
+import threading
 
 
 class CustomFormatter(logging.Formatter):
@@ -66,18 +67,33 @@ class LogManager:
     avoiding duplicate configuration across modules. Designed for both
     embedded validation flows and CLI analysis.
 
+    Every instance shares the same handler and configuration state, so
+    creating a `LogManager` on each validation never adds handlers: the root
+    logger is configured once per process.
+
     Attributes:
         default_level (int): Default log level from the root logger.
         default_handler (logging.StreamHandler): Stream handler with ImportSpy formatting.
         configured (bool): Whether the logger has already been initialized.
     """
 
+    _lock = threading.Lock()
+    _handler = None
+    _configured = False
+
     def __init__(self):
         """Initialize the default logging handler and formatter."""
         self.default_level = logging.getLogger().getEffectiveLevel()
-        self.default_handler = logging.StreamHandler()
-        self.default_handler.setFormatter(CustomFormatter())
-        self.configured = False
+        with LogManager._lock:
+            if LogManager._handler is None:
+                LogManager._handler = logging.StreamHandler()
+                LogManager._handler.setFormatter(CustomFormatter())
+        self.default_handler = LogManager._handler
+
+    @property
+    def configured(self) -> bool:
+        """Whether the root logger has been configured by any `LogManager`."""
+        return LogManager._configured
 
     def configure(self, level: int = None, handlers: list = None):
         """Apply logging configuration globally.
@@ -92,9 +108,33 @@ class LogManager:
         Raises:
             RuntimeError: If configuration is attempted more than once.
         """
-        if self.configured:
-            raise RuntimeError("LogManager has already been configured.")
+        with LogManager._lock:
+            if LogManager._configured:
+                raise RuntimeError("LogManager has already been configured.")
+            self._apply(level, handlers)
+
+    def ensure_configured(self, level: int = None) -> bool:
+        """Configure logging unless it already is, atomically.
+
+        Checking `configured` and then calling `configure()` races when
+        several threads validate for the first time at once; this method
+        checks and configures under the same lock.
 
+        Args:
+            level (int, optional): Logging level to apply if not yet configured.
+
+        Returns:
+            bool: True if this call configured logging.
+        """
+        with LogManager._lock:
+            if LogManager._configured:
+                return False
+            self._apply(level, None)
+            return True
+
+    def _apply(self, level: int = None, handlers: list = None):
+        """Install the handlers and level. Must be called under the class lock."""
+        LogManager._configured = True
         level = level or self.default_level
 
         if handlers:
@@ -104,7 +144,6 @@ class LogManager:
             logging.getLogger().addHandler(self.default_handler)
 
         logging.getLogger().setLevel(level)
-        self.configured = True
 
     def get_logger(self, name: str) -> logging.Logger:
         """Return a named logger configured with ImportSpy's formatter.
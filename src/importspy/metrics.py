@@ -0,0 +1,297 @@
+"""
+Operational metrics for ImportSpy.
+
+Long-running plugin hosts want to know how ImportSpy behaves over time: how
+many validations ran and failed, how well its caches work, and how long
+modules take to execute and to be inspected. This module keeps an
+in-process registry of counters and histograms that the session updates as
+it goes, and renders it in the Prometheus text exposition format:
+
+    from importspy import metrics
+
+    print(metrics.render())                       # e.g. from an HTTP handler
+    metrics.write_textfile("/var/lib/node_exporter/importspy.prom")
+
+The second form feeds the node_exporter textfile collector, so no server or
+client library is needed. Updating a metric takes a lock and a dictionary
+update.
+
+Exported metrics:
+
+- `importspy_validations_total{outcome}`: validations, `compliant` or `violation`;
+- `importspy_violations_total{context}`: violations by context (`module`,
+  `class`, `runtime`, `environment`);
+- `importspy_cache_requests_total{cache,result}`: hits and misses of the
+  contract, structure, host, outcome and verdict caches;
+- `importspy_phase_seconds{phase}`: histogram of the validation phases, among
+  them module execution (`load`) and extraction (`extract`);
+- `importspy_members_inspected_total{kind}`: variables, functions, classes,
+  methods and attributes extracted from modules.
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .constants import Errors
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    pairs = list(pairs)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing value, one per combination of label values.
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        """
+        Add `amount` to the counter identified by `labels`.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """
+        Return the current value for `labels`.
+        """
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(zip(self.labelnames, key))} {_format_value(value)}" for key, value in values]
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values over fixed cumulative buckets.
+    """
+
+    type = "histogram"
+
+    def __init__(self,
+                 name: str,
+                 documentation: str,
+                 labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        """
+        Record one observation for `labels`.
+        """
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][index] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        """
+        Return the number of observations for `labels`.
+        """
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        samples = []
+        for key, (counts, total, count) in values:
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket in zip(self.buckets, counts):
+                cumulative += bucket
+                samples.append(f"{self.name}_bucket{_format_labels(labels + [('le', _format_value(bound))])} {cumulative}")
+            samples.append(f"{self.name}_bucket{_format_labels(labels + [('le', '+Inf')])} {count}")
+            samples.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            samples.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return samples
+
+
+class Registry:
+    """
+    Set of metrics rendered together.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Add a metric and return it.
+
+        Raises:
+        -------
+        ValueError
+            If a metric with the same name is already registered.
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered.")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def metrics(self) -> List[_Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+        """
+        lines = []
+        for metric in self.metrics():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, filepath: str):
+        """
+        Write `render()` to `filepath` atomically, as the node_exporter
+        textfile collector expects: it must never read a partial file.
+        The file stays readable by the collector's user.
+        """
+        from .verdicts import atomic_write
+
+        atomic_write(filepath, self.render(), mode=0o644)
+
+    def clear(self):
+        """
+        Reset every metric.
+        """
+        for metric in self.metrics():
+            metric.clear()
+
+
+REGISTRY = Registry()
+
+VALIDATIONS = REGISTRY.register(Counter(
+    "importspy_validations_total", "Validations run, by outcome.", ("outcome",)
+))
+VIOLATIONS = REGISTRY.register(Counter(
+    "importspy_violations_total", "Contract violations reported, by context.", ("context",)
+))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "importspy_cache_requests_total", "Cache lookups, by cache and result.", ("cache", "result")
+))
+PHASE_SECONDS = REGISTRY.register(Histogram(
+    "importspy_phase_seconds", "Time spent in each validation phase.", ("phase",)
+))
+MEMBERS_INSPECTED = REGISTRY.register(Counter(
+    "importspy_members_inspected_total", "Module members extracted, by kind.", ("kind",)
+))
+
+OUTCOME_COMPLIANT = "compliant"
+OUTCOME_VIOLATION = "violation"
+RESULT_HIT = "hit"
+RESULT_MISS = "miss"
+
+
+def violation_context(error: str) -> str:
+    """
+    Return the validation context a violation message belongs to, or
+    `"unknown"` for a message not built by ImportSpy's violation system.
+    """
+    for context, intro in Errors.CONTEXT_INTRO.items():
+        if error.startswith(intro):
+            return context.value
+    return "unknown"
+
+
+def record_validation(error: Optional[str]):
+    """
+    Count a validation and, if `error` is set, its violation.
+    """
+    if error is None:
+        VALIDATIONS.inc(outcome=OUTCOME_COMPLIANT)
+    else:
+        VALIDATIONS.inc(outcome=OUTCOME_VIOLATION)
+        VIOLATIONS.inc(context=violation_context(error))
+
+
+def record_cache(cache: str, hit: bool):
+    """
+    Count a lookup in `cache`.
+    """
+    CACHE_REQUESTS.inc(cache=cache, result=RESULT_HIT if hit else RESULT_MISS)
+
+
+def render() -> str:
+    """
+    Render the default registry in the Prometheus text exposition format.
+    """
+    return REGISTRY.render()
+
+
+def write_textfile(filepath: str):
+    """
+    Write the default registry to `filepath` for the node_exporter textfile collector.
+    """
+    REGISTRY.write_textfile(filepath)
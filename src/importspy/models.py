@@ -11,13 +11,20 @@ to introspect, serialize, and enforce compatibility rules at multiple levels:
 from source code structure to runtime platform details.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from pydantic_core import ValidationError
 from typing import Optional, Union, List
 from types import ModuleType
+from enum import Enum
+from functools import cached_property, lru_cache
+import hashlib
+import json
+import threading
+import weakref
 
 from .utilities.module_util import (
     ModuleUtil, ClassInfo, ArgumentInfo,
-    FunctionInfo, AttributeInfo, VariableInfo
+    FunctionInfo, AttributeInfo, VariableInfo, ValueInfo
 )
 from .utilities.runtime_util import RuntimeUtil
 from .utilities.system_util import SystemUtil
@@ -30,7 +37,122 @@ logger = logging.getLogger("/".join(__file__.split('/')[-2:]))
 logger.addHandler(logging.NullHandler())
 
 
-class Python(BaseModel):
+# Fields whose entries validators look up by name. Every other list keeps
+# its order in the fingerprint: deployments, systems, pythons and their
+# modules are matched in declaration order, and the first match wins.
+_MATCHED_BY_NAME = frozenset({
+    "variables", "functions", "classes", "arguments",
+    "attributes", "methods", "superclasses", "secrets",
+})
+
+
+def _canonical(value, by_name: bool = False, ordered: bool = False):
+    """
+    Reduce a field value to a JSON-serializable form for fingerprinting.
+
+    Nested models are replaced by their fingerprint. Lists matched by name
+    are sorted, so their declaration order does not change the fingerprint;
+    any other list keeps its order. With `ordered`, no list is sorted and
+    nested models are replaced by their `layout`.
+    """
+    if isinstance(value, Fingerprinted):
+        return value.layout if ordered else value.fingerprint
+    if isinstance(value, list):
+        items = [_canonical(item, ordered=ordered) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True)) if by_name and not ordered else items
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+_DIGESTS = ("fingerprint", "layout")
+_SHARED = "__importspy_shared__"
+
+
+class Fingerprinted:
+    """
+    Mixin giving a model a Merkle-style structural fingerprint.
+
+    The fingerprint is a SHA-256 digest of the model type and its fields,
+    computed bottom-up from the fingerprints of nested models (arguments,
+    functions, classes, module; or deployments, systems, pythons, contract).
+    Two models have the same fingerprint exactly when they describe the same
+    structure, so comparing them is a single string comparison.
+
+    The `layout` digest also covers the declaration order of entities matched
+    by name, which the fingerprint leaves out but violation messages follow.
+
+    Both digests are computed once per instance and discarded when a field
+    of the instance is assigned; `model_copy()` starts afresh. A nested
+    model or list mutated in place is not noticed by its parents: replace it
+    instead.
+
+    Models shared between callers (interned variables, the host description)
+    are frozen: assigning one of their fields raises the `ValidationError`
+    of a frozen pydantic model, and `model_copy()` returns a mutable copy.
+
+    Validation schemas are built on first use rather than at import time, so
+    that importing ImportSpy does not pay for the models it never touches.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        return self._digest(ordered=False)
+
+    @cached_property
+    def layout(self) -> str:
+        return self._digest(ordered=True)
+
+    def _digest(self, ordered: bool) -> str:
+        fields = {
+            name: _canonical(getattr(self, name), name in _MATCHED_BY_NAME, ordered)
+            for name in type(self).model_fields
+        }
+        payload = json.dumps([type(self).__name__, fields], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get(_SHARED):
+            raise ValidationError.from_exception_data(type(self).__name__, [
+                {"type": "frozen_instance", "loc": (name,), "input": value}
+            ])
+        super().__setattr__(name, value)
+        for digest in _DIGESTS:
+            self.__dict__.pop(digest, None)
+
+    def __copy__(self):
+        copied = super().__copy__()
+        copied.__dict__.pop(_SHARED, None)
+        return copied
+
+    def __deepcopy__(self, memo=None):
+        copied = super().__deepcopy__(memo)
+        copied.__dict__.pop(_SHARED, None)
+        return copied
+
+    def model_copy(self, *args, **kwargs):
+        copied = super().model_copy(*args, **kwargs)
+        for digest in _DIGESTS:
+            copied.__dict__.pop(digest, None)
+        return copied
+
+
+def _share(model):
+    """
+    Freeze `model` and the models nested in it, and return it.
+    """
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        for item in value if isinstance(value, list) else [value]:
+            if isinstance(item, Fingerprinted):
+                _share(item)
+    model.__dict__[_SHARED] = True
+    return model
+
+
+class Python(Fingerprinted, BaseModel):
     """
     Represents a Python runtime environment.
 
@@ -51,7 +173,7 @@ class Python(BaseModel):
         return str(self)
 
 
-class Environment(BaseModel):
+class Environment(Fingerprinted, BaseModel):
     """
     Represents runtime environment variables and secrets.
     Used for validating runtime configuration.
@@ -66,7 +188,7 @@ class Environment(BaseModel):
         return str(self)
 
 
-class System(BaseModel):
+class System(Fingerprinted, BaseModel):
     """
     Represents a full OS environment within a deployment system.
 
@@ -87,7 +209,7 @@ class System(BaseModel):
         return str(self)
 
 
-class Runtime(BaseModel):
+class Runtime(Fingerprinted, BaseModel):
     """
     Represents a runtime deployment context.
 
@@ -96,6 +218,49 @@ class Runtime(BaseModel):
     arch: Constants.SupportedArchitectures
     systems: list[System]
 
+    @classmethod
+    def from_host(cls, modules: Optional[list['Module']] = None):
+        """
+        Describe the running host: architecture, OS, environment variables,
+        Python version and interpreter, with `modules` attached to the Python runtime.
+
+        The host rarely changes within a process, so its description is
+        shared: the environment is built once per set of environment
+        variables, and without `modules` the whole runtime is. Shared
+        models are frozen; use `model_copy()` to change them.
+        """
+        system_utils = SystemUtil()
+        python_utils = PythonUtil()
+        host = (
+            RuntimeUtil().extract_arch(),
+            system_utils.extract_os(),
+            tuple(system_utils.extract_envs()),
+            python_utils.extract_python_version(),
+            python_utils.extract_python_implementation()
+        )
+        if modules:
+            return cls._describe(*host, modules=modules)
+        return _host_runtime(cls, *host)
+
+    @classmethod
+    def _describe(cls, arch, os, envs, version, interpreter, modules=None):
+        return cls(
+            arch=arch,
+            systems=[
+                System(
+                    os=os,
+                    environment=_host_environment(envs),
+                    pythons=[
+                        Python(
+                            version=version,
+                            interpreter=interpreter,
+                            modules=modules or []
+                        )
+                    ]
+                )
+            ]
+        )
+
     def __str__(self):
         return f"{self.arch}"
 
@@ -103,7 +268,140 @@ class Runtime(BaseModel):
         return str(self)
 
 
-class Variable(BaseModel):
+@lru_cache(maxsize=8)
+def _host_environment(envs: tuple) -> Environment:
+    return _share(Environment(variables=Variable.from_variable_info(envs)))
+
+
+@lru_cache(maxsize=8)
+def _host_runtime(cls, *host) -> Runtime:
+    return _share(cls._describe(*host))
+
+
+class ValueDigest(Fingerprinted, BaseModel):
+    """
+    Bounded stand-in for a value that is not kept inline.
+
+    Containers, large strings and numbers and arbitrary objects are compared
+    through their type, their size and a digest of their content (see
+    `ModuleUtil.capture_value`). In a contract it is written as a mapping:
+
+        value:
+          type: dict
+          size: 128
+          digest: 3f1c...
+    """
+    type: str
+    size: Optional[int] = None
+    digest: Optional[str] = None
+
+    @classmethod
+    def capture(cls, value):
+        """
+        Return `value` in the form extracted models hold it: inline if it is
+        a small scalar, as a `ValueDigest` otherwise.
+        """
+        return _captured(ModuleUtil().capture_value(value))
+
+    def __str__(self):
+        size_part = f" of size {self.size}" if self.size is not None else ""
+        digest_part = f" ({self.digest})" if self.digest else ""
+        return f"<{self.type}{size_part}{digest_part}>"
+
+    def __repr__(self):
+        return str(self)
+
+
+_OBSERVED_ENUMS = {
+    "annotation": Constants.SupportedAnnotations,
+    "return_annotation": Constants.SupportedAnnotations,
+    "type": Constants.SupportedClassAttributeTypes,
+}
+
+
+# Fields of extracted models that hold data taken from user code as is,
+# rather than produced by ImportSpy: `__version__` can be any object.
+_OBSERVED_STRINGS = ("version",)
+
+
+@lru_cache(maxsize=None)
+def _observed_fields(cls):
+    """
+    Return the enum fields and the user-data string fields of `cls`.
+    """
+    enums = tuple((name, enum_type) for name, enum_type in _OBSERVED_ENUMS.items() if name in cls.model_fields)
+    strings = tuple(name for name in _OBSERVED_STRINGS if name in cls.model_fields)
+    return enums, strings
+
+
+def _observed(cls, values: dict):
+    """
+    Build a model from data ImportSpy extracted itself, without validation.
+
+    Extracted names are strings, values are captured scalars or
+    `ValueDigest`s and nested models are already built, so only enum fields
+    need converting and only fields taken from user code as is (the module
+    version) need checking. A value outside its enum, or a version that is
+    not a string, falls back to validation, which rejects it as it would in
+    a contract; user-supplied contracts are always validated.
+
+    The fields set are the keys of `values`, so that `model_copy(update=...)`
+    and `exclude_unset` behave as for any model.
+    """
+    enums, strings = _observed_fields(cls)
+    for name, enum_type in enums:
+        value = values.get(name)
+        if value is not None and value.__class__ is not enum_type:
+            member = enum_type._value2member_map_.get(value)
+            if member is None:
+                return cls(**values)
+            values[name] = member
+    for name in strings:
+        value = values.get(name)
+        if value is not None and value.__class__ is not str:
+            return cls(**values)
+    return cls.model_construct(set(values), **values)
+
+
+def _captured(value):
+    """
+    Turn a value extracted by `ModuleUtil` into a model field value.
+    """
+    if isinstance(value, ValueInfo):
+        return ValueDigest(type=value.type, size=value.size, digest=value.digest)
+    return value
+
+
+_SHAREABLE_VALUES = frozenset({type(None), bool, int, float, str})
+_flyweights: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+_flyweights_lock = threading.Lock()
+
+
+def _interned(cls, values: dict):
+    """
+    Return the model of `cls` built from `values` by `_observed`, shared
+    with every other extracted model built from the same values.
+
+    Variables, attributes and arguments repeat across functions, classes and
+    modules (`self`, `*args`, `**kwargs`, `name: str`): the flyweight table
+    keeps one model for each, so a batch run holds each of them once and
+    compares them by identity. Entries are held weakly and disappear with
+    the last structure using them. Values held as a `ValueDigest` are not
+    shared. Shared models are frozen.
+    """
+    value = values.get("value")
+    if value.__class__ not in _SHAREABLE_VALUES:
+        return _observed(cls, values)
+    key = (cls, value.__class__, *values.values())
+    model = _flyweights.get(key)
+    if model is None:
+        model = _share(_observed(cls, values))
+        with _flyweights_lock:
+            model = _flyweights.setdefault(key, model)
+    return model
+
+
+class Variable(Fingerprinted, BaseModel):
     """
     Represents a top-level variable in a Python module.
 
@@ -115,15 +413,15 @@ class Variable(BaseModel):
     """
     name: str
     annotation: Optional[Constants.SupportedAnnotations] = None
-    value: Optional[Union[int, str, float, bool, None]] = None
+    value: Optional[Union[int, str, float, bool, ValueDigest, None]] = None
 
     @classmethod
     def from_variable_info(cls, variables_info: list[VariableInfo]):
-        return [cls(
-            name=var_info.name,
-            value=var_info.value,
-            annotation=var_info.annotation
-        ) for var_info in variables_info]
+        return [_interned(cls, {
+            "name": var_info.name,
+            "annotation": var_info.annotation,
+            "value": _captured(var_info.value)
+        }) for var_info in variables_info]
 
     def __str__(self):
         type_part = f": {self.annotation}" if self.annotation else ""
@@ -143,12 +441,12 @@ class Attribute(Variable):
 
     @classmethod
     def from_attributes_info(cls, attributes_info: list[AttributeInfo]):
-        return [cls(
-            type=attr_info.type,
-            name=attr_info.name,
-            value=attr_info.value,
-            annotation=attr_info.annotation
-        ) for attr_info in attributes_info]
+        return [_interned(cls, {
+            "name": attr_info.name,
+            "annotation": attr_info.annotation,
+            "value": _captured(attr_info.value),
+            "type": attr_info.type
+        }) for attr_info in attributes_info]
 
 
 class Argument(Variable, BaseModel):
@@ -163,14 +461,14 @@ class Argument(Variable, BaseModel):
     """
     @classmethod
     def from_arguments_info(cls, arguments_info: list[ArgumentInfo]):
-        return [cls(
-            name=arg_info.name,
-            annotation=arg_info.annotation,
-            value=arg_info.value
-        ) for arg_info in arguments_info]
+        return [_interned(cls, {
+            "name": arg_info.name,
+            "annotation": arg_info.annotation,
+            "value": _captured(arg_info.value)
+        }) for arg_info in arguments_info]
 
 
-class Function(BaseModel):
+class Function(Fingerprinted, BaseModel):
     """
     Represents a callable entity.
 
@@ -185,11 +483,11 @@ class Function(BaseModel):
 
     @classmethod
     def from_functions_info(cls, functions_info: list[FunctionInfo]):
-        return [cls(
-            name=func_info.name,
-            arguments=Argument.from_arguments_info(func_info.arguments),
-            return_annotation=func_info.return_annotation
-        ) for func_info in functions_info]
+        return [_observed(cls, {
+            "name": func_info.name,
+            "arguments": Argument.from_arguments_info(func_info.arguments),
+            "return_annotation": func_info.return_annotation
+        }) for func_info in functions_info]
 
     def __str__(self):
         args = ", ".join(str(arg) for arg in self.arguments) if self.arguments else ""
@@ -199,7 +497,7 @@ class Function(BaseModel):
         return str(self)
 
 
-class Class(BaseModel):
+class Class(Fingerprinted, BaseModel):
     """
     Represents a Python class declaration.
 
@@ -216,12 +514,12 @@ class Class(BaseModel):
 
     @classmethod
     def from_class_info(cls, extracted_classes: list[ClassInfo]):
-        return [cls(
-            name=name,
-            attributes=Attribute.from_attributes_info(attributes),
-            methods=Function.from_functions_info(methods),
-            superclasses=cls.from_class_info(superclasses)
-        ) for name, attributes, methods, superclasses in extracted_classes]
+        return [_observed(cls, {
+            "name": name,
+            "attributes": Attribute.from_attributes_info(attributes),
+            "methods": Function.from_functions_info(methods),
+            "superclasses": cls.from_class_info(superclasses)
+        }) for name, attributes, methods, superclasses in extracted_classes]
 
     def get_class_attributes(self) -> List[Attribute]:
         if self.attributes:
@@ -232,7 +530,7 @@ class Class(BaseModel):
             return [attr for attr in self.attributes if attr.type == Config.INSTANCE_TYPE]
 
 
-class Module(BaseModel):
+class Module(Fingerprinted, BaseModel):
     """
     Represents a Python module.
 
@@ -247,6 +545,21 @@ class Module(BaseModel):
     functions: Optional[list[Function]] = None
     classes: Optional[list[Class]] = None
 
+    @classmethod
+    def from_module(cls, info_module: ModuleType):
+        """
+        Extract the structure (version, variables, functions, classes)
+        of an already executed module.
+        """
+        module_utils = ModuleUtil()
+        return _observed(cls, {
+            "filename": "/".join(info_module.__file__.split('/')[-1:]),
+            "version": module_utils.extract_version(info_module),
+            "variables": Variable.from_variable_info(module_utils.extract_variables(info_module)),
+            "functions": Function.from_functions_info(module_utils.extract_functions(info_module)),
+            "classes": Class.from_class_info(module_utils.extract_classes(info_module))
+        })
+
     def __str__(self):
         return f"Module: {self.filename or 'unknown'} (v{self.version or '-'})"
 
@@ -264,65 +577,32 @@ class SpyModel(Module):
     deployments: Optional[list[Runtime]] = None
 
     @classmethod
-    def from_module(cls, info_module: ModuleType):
+    def from_module(cls, info_module: ModuleType, reload: bool = True):
         """
         Build a SpyModel instance by extracting structure and metadata
         from an actual Python module object.
+
+        When `reload` is False the given module object is inspected as-is,
+        which is what the import hook needs right after the import system
+        has executed it.
         """
         module_utils = ModuleUtil()
-        runtime_utils = RuntimeUtil()
-        system_utils = SystemUtil()
-        python_utils = PythonUtil()
 
-        info_module = module_utils.load_module(info_module)
+        if reload:
+            info_module = module_utils.load_module(info_module)
         logger.debug(f"Create SpyModel from info_module: {ModuleType}")
 
-        filename = "/".join(info_module.__file__.split('/')[-1:])
-        version = module_utils.extract_version(info_module)
-        variables = Variable.from_variable_info(module_utils.extract_variables(info_module))
-        functions = Function.from_functions_info(module_utils.extract_functions(info_module))
-        classes = Class.from_class_info(module_utils.extract_classes(info_module))
+        module = Module.from_module(info_module)
+        runtime = Runtime.from_host([module])
 
-        arch = runtime_utils.extract_arch()
-        os = system_utils.extract_os()
-        python_version = python_utils.extract_python_version()
-        interpreter = python_utils.extract_python_implementation()
-        envs = Variable.from_variable_info(system_utils.extract_envs())
+        if reload:
+            module_utils.unload_module(info_module)
+            logger.debug("Unload module")
 
-        module_utils.unload_module(info_module)
-        logger.debug("Unload module")
-
-        return cls(
-            filename=filename,
-            deployments=[
-                Runtime(
-                    arch=arch,
-                    systems=[
-                        System(
-                            os=os,
-                            environment=Environment(
-                                variables=envs
-                            ),
-                            pythons=[
-                                Python(
-                                    version=python_version,
-                                    interpreter=interpreter,
-                                    modules=[
-                                        Module(
-                                            filename=filename,
-                                            version=version,
-                                            variables=variables,
-                                            functions=functions,
-                                            classes=classes
-                                        )
-                                    ]
-                                )
-                            ]
-                        )
-                    ]
-                )
-            ]
-        )
+        return _observed(cls, {
+            "filename": module.filename,
+            "deployments": [runtime]
+        })
 
 
 class Error(BaseModel):
@@ -332,6 +612,9 @@ class Error(BaseModel):
     Includes the context, error type, message, and resolution steps.
     Used to serialize feedback during contract enforcement.
     """
+
+    model_config = ConfigDict(defer_build=True)
+
     context: Contexts
     title: str
     category: Errors.Category
@@ -10,8 +10,12 @@ messages in case of missing, malformed, or inaccessible contract files.
 """
 
 from abc import ABC, abstractmethod
-from ruamel.yaml import YAML
 import functools
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
 
 
 class Parser(ABC):
@@ -118,16 +122,32 @@ class YamlParser(Parser):
 
     Uses `ruamel.yaml` to read and write `.yml` files that define import contracts.  
     Preserves formatting, indentation, and quotes for consistent serialization.
+
+    A `ruamel.yaml.YAML` instance is not safe to use from several threads at
+    once, so each thread gets its own, created on first use. `ruamel.yaml`
+    itself is only imported then, when a contract is first read or written.
     """
 
     def __init__(self):
         """
         Initializes the YAML parser and configures output formatting.
         """
-        self.yaml = YAML()
-        self._yml_configuration()
+        self._local = threading.local()
+
+    @property
+    def yaml(self) -> 'YAML':
+        """
+        The calling thread's configured `YAML` instance.
+        """
+        yaml = getattr(self._local, "yaml", None)
+        if yaml is None:
+            from ruamel.yaml import YAML
+
+            yaml = self._local.yaml = YAML()
+            self._yml_configuration(yaml)
+        return yaml
 
-    def _yml_configuration(self):
+    def _yml_configuration(self, yaml: 'YAML'):
         """
         Applies formatting rules to YAML output:
 
@@ -135,9 +155,9 @@ class YamlParser(Parser):
         - Sets consistent indentation
         - Preserves quotes in strings
         """
-        self.yaml.default_flow_style = False
-        self.yaml.indent(mapping=2, sequence=4, offset=2)
-        self.yaml.preserve_quotes = True
+        yaml.default_flow_style = False
+        yaml.indent(mapping=2, sequence=4, offset=2)
+        yaml.preserve_quotes = True
 
     @handle_persistence_error
     def save(self, data: dict, filepath: str):
@@ -173,5 +193,39 @@ class YamlParser(Parser):
             Parsed contract structure.
         """
         with open(filepath) as file:
-            data = self.yaml.load(file)
-            return dict(data)
+            return self._load(file)
+
+    @handle_persistence_error
+    def loads(self, content: str) -> dict:
+        """
+        Parses a `.yml` contract already read into memory.
+
+        Used when the contract travels as data instead of as a path, e.g. to
+        worker processes or subinterpreters.
+
+        Parameters:
+        -----------
+
+        content : str
+            The contract text.
+
+        Returns:
+        --------
+        dict
+            Parsed contract structure.
+        """
+        return self._load(content)
+
+    def _load(self, stream) -> dict:
+        """
+        Parses a contract with the calling thread's `YAML` instance.
+
+        `ruamel.yaml` records details of every document it loads on the
+        instance itself, so a long-lived instance would grow with each
+        contract; the record of previous documents is dropped first.
+        """
+        yaml = self.yaml
+        doc_infos = getattr(yaml, "doc_infos", None)
+        if doc_infos:
+            doc_infos.clear()
+        return dict(yaml.load(stream))
@@ -17,34 +17,26 @@ This module is typically used as the entry point for programmatic validation wor
 """
 
 from types import ModuleType
-from .models import (
-    SpyModel,
-    Runtime,
-    Python,
-    Module
-)
+import functools
 from .utilities.module_util import ModuleUtil
-from .validators import (
-    RuntimeValidator,
-    SystemValidator,
-    PythonValidator,
-    ModuleValidator
-)
 from .log_manager import LogManager
-from .persistences import Parser, YamlParser
+from .persistences import Parser
+from .session import SpySession, default_session
+from .verdicts import VerdictCache
 from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
     Optional,
-    List
+    List,
+    Tuple,
+    Union
 )
 import logging
-from .violation_systems import (
-    Bundle,
-    ModuleContractViolation,
-    RuntimeContractViolation,
-    SystemContractViolation,
-    PythonContractViolation
-)
-from .constants import Contexts
+from .deferred import DeferredModule, defer
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 
 class Spy:
@@ -59,30 +51,61 @@ class Spy:
     - **Embedded mode**: validates the caller of the current module
     - **External/CLI mode**: validates an explicitly provided module
 
+    A `Spy` instance can be shared between threads: modules are re-executed
+    under unique synthetic names and contracts are parsed with per-thread
+    parsers, so concurrent validations never interfere with each other or
+    with `sys.modules`.
+
     Attributes:
     -----------
 
     logger : logging.Logger
         Structured logger for validation diagnostics.
 
+    session : SpySession
+        Session holding the parser, validators and caches used for validation.
+
     parser : Parser 
         Parser used to load import contracts (defaults to YAML).
+
+    verdicts : Optional[VerdictCache]
+        Verdict store consulted before validating, if any.
         
     """
 
-    def __init__(self):
+    def __init__(self,
+                 verdicts: Optional[VerdictCache] = None,
+                 session: Optional[SpySession] = None):
         """
         Initialize the Spy instance.
 
-        Sets up a dedicated logger and the default YAML parser
+        Sets up a dedicated logger and attaches the validation session.
+
+        Parameters:
+        -----------
+        verdicts : Optional[VerdictCache]
+            Verdict store shared with other processes. When set, a module whose
+            source, contract and host profile have already been validated is not
+            validated again; e.g. `VerdictCache.shared(ttl=3600)` lets pre-forked
+            workers reuse the verdict of the first one.
+
+        session : Optional[SpySession]
+            Long-lived session to validate with. Defaults to the process-wide
+            session, so one-shot `Spy()` calls share warm caches.
         """
         self.logger = LogManager().get_logger(self.__class__.__name__)
-        self.parser: Parser = YamlParser()
+        self.session = session if session is not None else default_session()
+        self.parser: Parser = self.session.parser
+        self.verdicts = verdicts
 
     def importspy(self,
                   filepath: Optional[str] = None,
                   log_level: Optional[int] = None,
-                  info_module: Optional[ModuleType] = None) -> ModuleType:
+                  info_module: Optional[ModuleType] = None,
+                  reload: bool = True,
+                  revalidate: bool = False,
+                  deferred: bool = False,
+                  on_failure: Optional[Callable[[BaseException], None]] = None) -> Union[ModuleType, DeferredModule]:
         """
         Main entry point for validation.
 
@@ -101,10 +124,25 @@ class Spy:
         info_module : Optional[ModuleType]
             The module to validate. If `None`, uses the importer via stack inspection.
 
+        reload : bool
+            Whether to re-execute the module from its file before inspecting it.
+            Import hooks pass `False` to validate the module object they just created.
+
+        revalidate : bool
+            Ignore any cached verdict and validate again.
+
+        deferred : bool
+            Validate on a background thread and return a `DeferredModule` proxy
+            immediately. Violations are raised on first attribute access to the
+            proxy instead of here. Blocking validation remains the default.
+
+        on_failure : Optional[Callable[[BaseException], None]]
+            Callback invoked with the violation when a deferred validation fails.
+
         Returns:
         --------
-        ModuleType
-            The validated module.
+        ModuleType | DeferredModule
+            The validated module, or a proxy for it in deferred mode.
 
         Raises:
         -------
@@ -115,78 +153,180 @@ class Spy:
             If recursion is detected (e.g., a module is validating itself).
         """
         self._configure_logging(log_level)
-        spymodel: SpyModel = SpyModel(**self.parser.load(filepath=filepath))
         if not info_module:
             info_module = self._inspect_module()
-        return self._validate_module(spymodel, info_module)
-
-    def _configure_logging(self, log_level: Optional[int] = None):
+        if deferred:
+            return defer(
+                functools.partial(self._validate, filepath, info_module, reload, revalidate),
+                on_failure
+            )
+        return self._validate(filepath, info_module, reload, revalidate)
+
+    async def aimportspy(self,
+                         filepath: str,
+                         *,
+                         info_module: Union[ModuleType, str],
+                         log_level: Optional[int] = None,
+                         executor: Optional['Executor'] = None,
+                         timeout: Optional[float] = None) -> ModuleType:
         """
-        Set up logging for validation.
+        Asynchronous counterpart of `importspy()` for asyncio applications.
 
-        If not already configured, applies the provided or default log level
-        using ImportSpy’s centralized logging system.
+        Contract parsing, module execution and extraction are offloaded to
+        `executor` so the event loop keeps serving other tasks meanwhile.
+
+        With a thread executor (or `None`, the loop's default one) the whole
+        validation runs in a worker thread. With an isolated executor (a
+        process pool or a subinterpreter pool, see `importspy.backends`) the
+        module is loaded and validated in the worker from its file; only the
+        verdict travels back, and a module given by path is then imported in
+        the caller once it is known to be compliant.
+
+        Arguments after `filepath` are keyword-only, since `importspy()`
+        takes `log_level` before `info_module`.
 
         Parameters:
         -----------
+        filepath : str
+            Path to the `.yml` import contract.
+
+        info_module : ModuleType | str
+            The module to validate, or the path of its source file.
+
         log_level : Optional[int]
-            Logging level to use (e.g., `logging.INFO`, `logging.DEBUG`).
+            Log verbosity level (e.g., `logging.DEBUG`).
+
+        executor : Optional[Executor]
+            Thread or process pool running the validation.
+
+        timeout : Optional[float]
+            Seconds after which `asyncio.TimeoutError` is raised. Work already
+            running in a thread cannot be interrupted and is left to complete.
+
+        Returns:
+        --------
+        ModuleType
+            The validated module.
+
+        Raises:
+        -------
+        ValueError
+            If the module does not satisfy the contract.
+
+        asyncio.TimeoutError
+            If validation does not complete within `timeout`.
         """
-        log_manager = LogManager()
-        if not log_manager.configured:
-            system_log_level = logging.getLogger().getEffectiveLevel()
-            log_manager.configure(level=log_level or system_log_level)
+        import asyncio
+        from .backends import decode_verdict, encode_request, is_isolated, validate_request
 
-    def _validate_module(self, spymodel: SpyModel, info_module: ModuleType) -> ModuleType:
+        self._configure_logging(log_level)
+        loop = asyncio.get_running_loop()
+        if is_isolated(executor):
+            modulepath = info_module if isinstance(info_module, str) else info_module.__file__
+            call = functools.partial(validate_request, encode_request(modulepath, contract_path=filepath))
+            verdict = decode_verdict(await asyncio.wait_for(loop.run_in_executor(executor, call), timeout))
+            if not verdict.compliant:
+                raise ValueError(verdict.error)
+            if isinstance(info_module, ModuleType):
+                return info_module
+            return await loop.run_in_executor(None, ModuleUtil().import_from_path, info_module)
+        call = functools.partial(self._importspy_target, filepath, info_module)
+        return await asyncio.wait_for(loop.run_in_executor(executor, call), timeout)
+
+    async def avalidate_many(self,
+                             pairs: Iterable[Tuple[Union[ModuleType, str], str]],
+                             log_level: Optional[int] = None,
+                             executor: Optional['Executor'] = None,
+                             concurrency: int = 8,
+                             timeout: Optional[float] = None) -> List[Union[ModuleType, BaseException]]:
         """
-        Perform all validation steps against the loaded module.
+        Validate many modules concurrently without blocking the event loop.
 
-        This includes contract-level, runtime, system, and Python environment checks.
-        All contract violations are collected in a `Bundle`.
+        At most `concurrency` validations are in flight at any time. Failures
+        do not abort the batch: each position of the returned list holds
+        either the validated module or the exception raised for that pair.
+        Cancelling the returned coroutine cancels every pending validation.
 
         Parameters:
         -----------
-        spymodel : SpyModel
-            The expected contract loaded from file.
+        pairs : Iterable[Tuple[ModuleType | str, str]]
+            `(module or module path, contract path)` pairs.
 
-        info_module : ModuleType
-            The actual module to inspect and validate.
+        log_level : Optional[int]
+            Log verbosity level (e.g., `logging.DEBUG`).
+
+        executor : Optional[Executor]
+            Thread or process pool running the validations.
+
+        concurrency : int
+            Maximum number of validations running at the same time.
+
+        timeout : Optional[float]
+            Per-validation timeout in seconds.
 
         Returns:
         --------
-        ModuleType
-            The validated module, reloaded after introspection.
+        List[ModuleType | BaseException]
+            Results in the same order as `pairs`.
         """
-        self.logger.debug(f"info_module: {info_module}")
-        if spymodel:
-            bundle = Bundle()
-            module_validator = ModuleValidator()
-            self.logger.debug(f"Import contract detected: {spymodel}")
-            spy_module = SpyModel.from_module(info_module)
-            self.logger.debug(f"Extracted module structure: {spy_module}")
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _validate_pair(info_module: Union[ModuleType, str], filepath: str) -> ModuleType:
+            async with semaphore:
+                return await self.aimportspy(
+                    filepath, info_module=info_module, log_level=log_level, executor=executor, timeout=timeout
+                )
 
-            module_contract = ModuleContractViolation(Contexts.MODULE_CONTEXT, bundle)
-            module_validator.validate([spymodel], spy_module.deployments[0].systems[0].pythons[0].modules[0], module_contract)
+        return await asyncio.gather(
+            *(_validate_pair(info_module, filepath) for info_module, filepath in pairs),
+            return_exceptions=True
+        )
 
-            runtime_contract = RuntimeContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
-            runtime = RuntimeValidator().validate(spymodel.deployments, spy_module.deployments, runtime_contract)
+    def _importspy_target(self, filepath: str, info_module: Union[ModuleType, str]) -> ModuleType:
+        """
+        Blocking validation step run by `aimportspy` on a worker thread.
 
-            system_contract = SystemContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
-            pythons = SystemValidator().validate(runtime.systems, spy_module.deployments[0].systems, system_contract)
+        A module given by path is executed once and inspected in place.
+        """
+        reload = not isinstance(info_module, str)
+        if not reload:
+            info_module = ModuleUtil().import_from_path(info_module)
+        return self.importspy(filepath=filepath, info_module=info_module, reload=reload)
+
+    def _validate(self,
+                  filepath: str,
+                  info_module: ModuleType,
+                  reload: bool,
+                  revalidate: bool) -> ModuleType:
+        """
+        Validate a resolved module through the session.
+        """
+        return self.session.importspy(filepath, info_module, reload, revalidate, verdicts=self.verdicts)
 
-            python_contract = PythonContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
-            modules = PythonValidator().validate(pythons, spy_module.deployments[0].systems[0].pythons, python_contract)
+    def _configure_logging(self, log_level: Optional[int] = None):
+        """
+        Set up logging for validation.
 
-            module_validator.validate(modules, spy_module.deployments[0].systems[0].pythons[0].modules[0], module_contract)
+        If not already configured, applies the provided or default log level
+        using ImportSpy’s centralized logging system.
 
-        return ModuleUtil().load_module(info_module)
+        Parameters:
+        -----------
+        log_level : Optional[int]
+            Logging level to use (e.g., `logging.INFO`, `logging.DEBUG`).
+        """
+        LogManager().ensure_configured(level=log_level or logging.getLogger().getEffectiveLevel())
 
     def _inspect_module(self) -> ModuleType:
         """
         Infer the module that invoked validation (embedded mode).
 
-        This prevents a module from validating itself and ensures that
-        ImportSpy targets the correct caller in the stack.
+        Walks the call stack past ImportSpy's own frames and the importlib
+        bootstrap to reach the nearest module importing the caller. This
+        prevents a module from validating itself and ensures that ImportSpy
+        targets the correct importer even inside deep call stacks.
 
         Returns:
         --------
@@ -199,10 +339,9 @@ class Spy:
         ValueError
             If a module attempts to validate itself.
         """
-        module_util = ModuleUtil()
-        current_frame, caller_frame = module_util.inspect_module()
-        if current_frame.filename == caller_frame.filename:
+        info_module = ModuleUtil().resolve_caller()
+        if not info_module:
             raise ValueError("Recursion detected during module analysis.")
-        info_module = module_util.get_info_module(caller_frame)
         self.logger.debug(f"Inferred caller module: {info_module}")
         return info_module
+
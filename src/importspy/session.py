@@ -0,0 +1,677 @@
+"""
+Long-lived validation sessions for ImportSpy.
+
+A `Spy` used to rebuild everything on each call: a YAML parser, the
+validators, the contract model and the host description. A `SpySession`
+keeps all of that warm instead, which matters for plugin hosts that validate
+continuously:
+
+- parsed contracts, reused until the contract file content changes;
+- the host profile (architecture, OS, Python, environment), pinned once;
+- the extracted structure of each module, reused until its source or its
+  state changes;
+- the outcome of each validation, keyed by the structural fingerprints of
+  the contract, the module and the host and by the declaration order of the
+  contract, which violation messages follow, so that validating an
+  unchanged structure again costs a single lookup;
+- a single set of validator instances.
+
+Every cache is bounded and reports hit/miss statistics through `stats()`.
+Sessions have an explicit lifecycle: they can be used as context managers,
+and a closed session refuses further work. `Spy` delegates to the shared
+session returned by `default_session()` unless given one explicitly.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, List, Optional
+
+from .constants import Contexts, Errors
+from .incremental import (
+    IncrementalReport,
+    IncrementalStore,
+    IncrementalValidator,
+    strip_entities
+)
+from . import metrics
+from .log_manager import LogManager
+from .models import Module, Runtime, SpyModel
+from .persistences import Parser, YamlParser
+from .utilities.module_util import ModuleUtil
+from .validators import (
+    ModuleValidator,
+    PythonValidator,
+    RuntimeValidator,
+    SystemValidator
+)
+from .timings import (
+    PHASE_CONTRACT,
+    PHASE_EXTRACT,
+    PHASE_HOST,
+    PHASE_LOAD,
+    PHASE_VALIDATE,
+    span
+)
+from .tracing import CATEGORY_VALIDATOR, trace
+from .verdicts import (
+    Verdict,
+    VerdictCache,
+    file_digest,
+    host_profile
+)
+from .violation_systems import (
+    Bundle,
+    ModuleContractViolation,
+    PythonContractViolation,
+    RuntimeContractViolation,
+    SystemContractViolation
+)
+
+if TYPE_CHECKING:
+    from .contract_index import ContractIndex
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit and miss counters of a session cache.
+
+    Attributes:
+    -----------
+    hits : int
+        Lookups served from the cache.
+
+    misses : int
+        Lookups that had to compute the value.
+
+    size : int
+        Entries currently held.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+class _BoundedCache:
+    """
+    Thread-safe LRU mapping with hit/miss accounting.
+
+    Values are computed outside the lock, so a slow computation never blocks
+    lookups of other keys; two threads missing the same key at once may both
+    compute it, and the last one wins.
+    """
+
+    def __init__(self, maxsize: int, name: str):
+        self.maxsize = maxsize
+        self.name = name
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get_or_compute(self, key: Hashable, compute: Callable):
+        if key is None:
+            return compute()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                metrics.record_cache(self.name, hit=True)
+                return self._entries[key]
+            self._stats.misses += 1
+        metrics.record_cache(self.name, hit=False)
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._stats.hits, self._stats.misses, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+
+
+def _file_stamp(filepath: str) -> Optional[tuple]:
+    """
+    Identify a file version by path and content digest.
+
+    Modification times are too coarse to tell apart quick successive saves,
+    and hashing a source file is far cheaper than parsing or executing it.
+    Returns `None` if the file cannot be read, which disables caching for
+    that lookup and lets the regular code path report the error.
+    """
+    try:
+        return (os.path.abspath(filepath), file_digest(filepath))
+    except (OSError, TypeError):
+        return None
+
+
+class SpySession:
+    """
+    Reusable validation context holding preloaded contracts and warm caches.
+
+    Attributes:
+    -----------
+    parser : Parser
+        Parser used to load import contracts.
+
+    verdicts : Optional[VerdictCache]
+        Verdict store consulted before validating, if any.
+
+    pin_host : bool
+        Whether the host description is captured once and reused. Call
+        `refresh_host()` after changing the environment of a pinned session.
+
+    incremental : IncrementalStore
+        Clause outcomes used by `validate_incremental()`.
+
+    index : Optional[ContractIndex]
+        Reverse index updated by every `importspy()` call, if any.
+    """
+
+    def __init__(self,
+                 verdicts: Optional[VerdictCache] = None,
+                 pin_host: bool = True,
+                 cache_size: int = 256,
+                 incremental: Optional[IncrementalStore] = None,
+                 index: Optional['ContractIndex'] = None):
+        """
+        Open a session.
+
+        Parameters:
+        -----------
+        verdicts : Optional[VerdictCache]
+            Verdict store consulted before validating.
+
+        pin_host : bool
+            Capture the host profile once instead of at every validation.
+
+        cache_size : int
+            Maximum number of contracts and of module structures kept in memory.
+
+        incremental : Optional[IncrementalStore]
+            Store of clause outcomes for incremental validation; an in-memory
+            one is created when omitted.
+
+        index : Optional[ContractIndex]
+            Reverse index recording which modules depend on which contract
+            clauses, so that `ContractIndex.revalidate()` can handle edits.
+        """
+        self.logger = LogManager().get_logger(self.__class__.__name__)
+        self.parser: Parser = YamlParser()
+        self.verdicts = verdicts
+        self.pin_host = pin_host
+        self.module_validator = ModuleValidator()
+        self.runtime_validator = RuntimeValidator()
+        self.system_validator = SystemValidator()
+        self.python_validator = PythonValidator()
+        self.incremental_validator = IncrementalValidator()
+        self.incremental = incremental or IncrementalStore()
+        self.index = index
+        self._contracts = _BoundedCache(cache_size, "contracts")
+        self._structures = _BoundedCache(cache_size, "structures")
+        self._host = _BoundedCache(2, "host")
+        self._outcomes = _BoundedCache(cache_size, "outcomes")
+        self._closed = False
+
+    def __enter__(self) -> 'SpySession':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether `close()` has been called."""
+        return self._closed
+
+    def close(self):
+        """
+        Release every cache. Any further use of the session raises `RuntimeError`.
+        """
+        self.clear()
+        self._closed = True
+
+    def clear(self):
+        """
+        Drop every cached contract, module structure and host profile.
+        """
+        self._contracts.clear()
+        self._structures.clear()
+        self._host.clear()
+        self._outcomes.clear()
+        self.incremental.clear()
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """
+        Return hit/miss statistics for each session cache.
+        """
+        return {
+            "contracts": self._contracts.stats(),
+            "structures": self._structures.stats(),
+            "host": self._host.stats(),
+            "outcomes": self._outcomes.stats(),
+        }
+
+    def preload(self, *filepaths: str):
+        """
+        Parse contracts ahead of time so that later validations find them warm.
+        """
+        for filepath in filepaths:
+            self.load_contract(filepath)
+
+    def load_contract(self, filepath: str) -> SpyModel:
+        """
+        Return the contract at `filepath`, parsing it only if its content changed.
+        """
+        self._check_open()
+        with span(PHASE_CONTRACT):
+            return self._contracts.get_or_compute(
+                _file_stamp(filepath),
+                lambda: SpyModel(**self.parser.load(filepath=filepath))
+            )
+
+    def extract(self, info_module: ModuleType, reuse: bool = True) -> Module:
+        """
+        Return the structure of an executed module.
+
+        The structure is reused only while both the module source and the
+        module state are unchanged (see `_module_state`), so values assigned
+        at runtime, or computed differently by another execution, are always
+        seen.
+
+        Parameters:
+        -----------
+        info_module : ModuleType
+            The executed module to inspect.
+
+        reuse : bool
+            Whether to look the structure up in the session cache. Pass `False`
+            for a module that was just executed and cannot have been seen before.
+        """
+        self._check_open()
+        with span(PHASE_EXTRACT):
+            if not reuse:
+                return _extract(info_module)
+            stamp = _file_stamp(info_module.__file__)
+            key = stamp and (stamp, _module_state(info_module))
+            return self._structures.get_or_compute(key, lambda: _extract(info_module))
+
+    def host(self) -> List[Runtime]:
+        """
+        Describe the running host as a list of deployments, as contracts do.
+        """
+        self._check_open()
+        with span(PHASE_HOST):
+            if not self.pin_host:
+                return [Runtime.from_host()]
+            return self._host.get_or_compute("runtime", lambda: [Runtime.from_host()])
+
+    def host_profile(self) -> str:
+        """
+        Digest of the host used in verdict keys, pinned like `host()`.
+        """
+        with span(PHASE_HOST):
+            if not self.pin_host:
+                return host_profile()
+            return self._host.get_or_compute("profile", host_profile)
+
+    def refresh_host(self):
+        """
+        Capture the host profile again on the next validation.
+        """
+        self._host.clear()
+
+    def importspy(self,
+                  filepath: str,
+                  info_module: ModuleType,
+                  reload: bool = True,
+                  revalidate: bool = False,
+                  verdicts: Optional[VerdictCache] = None) -> ModuleType:
+        """
+        Validate a module against the contract at `filepath`.
+
+        Parameters:
+        -----------
+        filepath : str
+            Path to the `.yml` import contract.
+
+        info_module : ModuleType
+            The module to validate.
+
+        reload : bool
+            Whether to re-execute the module instead of inspecting it in place.
+
+        revalidate : bool
+            Ignore any cached verdict and validate again.
+
+        verdicts : Optional[VerdictCache]
+            Verdict store overriding the session's own for this call.
+
+        Returns:
+        --------
+        ModuleType
+            The validated module.
+
+        Raises:
+        -------
+        ValueError
+            If the module is not compliant.
+        """
+        self._check_open()
+        with trace(f"importspy {ModuleUtil().original_name(info_module.__name__)}", module=info_module.__file__, contract=filepath):
+            verdicts = verdicts if verdicts is not None else self.verdicts
+            if verdicts is not None:
+                return self._validate_cached(filepath, info_module, reload, revalidate, verdicts)
+            if self.index is not None:
+                return self._validate_indexed(filepath, info_module, reload)
+            return self.validate(self.load_contract(filepath), info_module, reload)
+
+    def validate(self,
+                 spymodel: SpyModel,
+                 info_module: ModuleType,
+                 reload: bool = True,
+                 host: Optional[List[Runtime]] = None) -> ModuleType:
+        """
+        Perform all validation steps against the loaded module.
+
+        This includes contract-level, runtime, system, and Python environment checks.
+        All contract violations are collected in a `Bundle`.
+
+        Parameters:
+        -----------
+        spymodel : SpyModel
+            The expected contract.
+
+        info_module : ModuleType
+            The actual module to inspect and validate.
+
+        reload : bool
+            Whether to re-execute the module instead of inspecting it in place.
+
+        host : Optional[List[Runtime]]
+            Host description to validate against instead of the running host,
+            e.g. the one of a client process.
+
+        Returns:
+        --------
+        ModuleType
+            The validated module. When `reload` is set this is the isolated copy
+            that was executed and inspected, not registered in `sys.modules`.
+        """
+        self._check_open()
+        self.logger.debug(f"info_module: {info_module}")
+        if reload:
+            with span(PHASE_LOAD):
+                info_module = ModuleUtil().load_module(info_module)
+        if spymodel:
+            self.logger.debug(f"Import contract detected: {spymodel}")
+            module = self.extract(info_module, reuse=not reload)
+            host = host or self.host()
+            self.logger.debug(f"Extracted module structure: {module}")
+            self._validate_structure(spymodel, module, host)
+        return info_module
+
+    def validate_incremental(self,
+                             filepath: str,
+                             info_module: ModuleType,
+                             reload: bool = True) -> IncrementalReport:
+        """
+        Validate a module, re-checking only the function and class clauses
+        whose contract or module entity changed since the previous run.
+
+        Module-level checks (filename, version, variables) and deployment
+        checks always run; when they fail the report holds that violation
+        alone. Unlike `importspy()`, violations are reported, not raised.
+
+        Parameters:
+        -----------
+        filepath : str
+            Path to the `.yml` import contract.
+
+        info_module : ModuleType
+            The module to validate.
+
+        reload : bool
+            Whether to re-execute the module instead of inspecting it in place.
+
+        Returns:
+        --------
+        IncrementalReport
+            The verdict, the violations, and which entities were checked or skipped.
+        """
+        self._check_open()
+        spymodel = self.load_contract(filepath)
+        if reload:
+            with span(PHASE_LOAD):
+                info_module = ModuleUtil().load_module(info_module)
+        module = self.extract(info_module, reuse=not reload)
+        host = self.host()
+        error = self._structure_error(strip_entities(spymodel), module, host)
+        if error is not None:
+            metrics.record_validation(error)
+            return IncrementalReport(compliant=False, violations=[error])
+        with span(PHASE_VALIDATE):
+            modules = self._match_host(spymodel, host, Bundle()) or []
+            state, report = self.incremental_validator.validate(
+                [spymodel, *modules],
+                module,
+                self.incremental.get(info_module.__file__)
+            )
+        self.incremental.put(info_module.__file__, state)
+        metrics.record_validation(None if report.compliant else report.violations[0])
+        return report
+
+    def _validate_structure(self, spymodel: SpyModel, module: Module, host: List[Runtime]):
+        """
+        Validate an extracted module structure and host description, reusing
+        the outcome recorded for the same fingerprints if there is one.
+
+        Raises:
+        -------
+        ValueError
+            If the module is not compliant.
+        """
+        error = self._structure_error(spymodel, module, host)
+        metrics.record_validation(error)
+        if error is not None:
+            raise ValueError(error)
+
+    def _structure_error(self, spymodel: SpyModel, module: Module, host: List[Runtime]) -> Optional[str]:
+        """
+        Return the violation of an extracted module structure and host
+        description, or `None` if compliant, without counting a validation.
+        """
+        with span(PHASE_VALIDATE):
+            key = (spymodel.fingerprint, spymodel.layout, module.fingerprint, host[0].fingerprint)
+            return self._outcomes.get_or_compute(key, lambda: self._run_validators(spymodel, module, host))
+
+    def _run_validators(self, spymodel: SpyModel, module: Module, host: List[Runtime]) -> Optional[str]:
+        """
+        Run the validators and return the violation message, or `None` if compliant.
+        """
+        try:
+            self._check_structure(spymodel, module, host)
+        except ValueError as ve:
+            return str(ve)
+        return None
+
+    def _check_structure(self, spymodel: SpyModel, module: Module, host: List[Runtime]):
+        """
+        Run the validators on an extracted module structure and host description.
+        """
+        bundle = Bundle()
+        bundle[Errors.KEY_FILE_NAME] = spymodel.filename
+
+        module_contract = ModuleContractViolation(Contexts.MODULE_CONTEXT, bundle)
+        with trace("ModuleValidator", CATEGORY_VALIDATOR, scope="contract"):
+            self.module_validator.validate([spymodel], module, module_contract)
+
+        modules = self._match_host(spymodel, host, bundle)
+
+        with trace("ModuleValidator", CATEGORY_VALIDATOR, scope="deployment"):
+            self.module_validator.validate(modules, module, module_contract)
+
+    def _match_host(self, spymodel: SpyModel, host: List[Runtime], bundle: Bundle) -> Optional[List[Module]]:
+        """
+        Match the contract deployments against the host and return the modules
+        declared for the matching Python runtime, if any.
+        """
+        runtime_contract = RuntimeContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
+        with trace("RuntimeValidator", CATEGORY_VALIDATOR):
+            runtime = self.runtime_validator.validate(spymodel.deployments, host, runtime_contract)
+
+        system_contract = SystemContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
+        with trace("SystemValidator", CATEGORY_VALIDATOR):
+            pythons = self.system_validator.validate(runtime.systems if runtime else None, host[0].systems, system_contract)
+
+        python_contract = PythonContractViolation(Contexts.RUNTIME_CONTEXT, bundle)
+        with trace("PythonValidator", CATEGORY_VALIDATOR):
+            return self.python_validator.validate(pythons, host[0].systems[0].pythons, python_contract)
+
+    def _validate_indexed(self, filepath: str, info_module: ModuleType, reload: bool) -> ModuleType:
+        """
+        Validate and record the module structure and verdict in the reverse index.
+
+        Raises:
+        -------
+        ValueError
+            If the module is not compliant.
+        """
+        spymodel = self.load_contract(filepath)
+        if reload:
+            with span(PHASE_LOAD):
+                info_module = ModuleUtil().load_module(info_module)
+        module = self.extract(info_module, reuse=not reload)
+        try:
+            self._validate_structure(spymodel, module, self.host())
+        except ValueError as ve:
+            self.index.record(filepath, spymodel, info_module.__file__, module, str(ve))
+            raise
+        self.index.record(filepath, spymodel, info_module.__file__, module)
+        return info_module
+
+    def _validate_cached(self,
+                         filepath: str,
+                         info_module: ModuleType,
+                         reload: bool,
+                         revalidate: bool,
+                         verdicts: VerdictCache) -> ModuleType:
+        """
+        Validate through the verdict store, parsing the contract only on a miss.
+
+        Raises:
+        -------
+        ValueError
+            If the module is not compliant, now or according to the cached verdict.
+        """
+        key = VerdictCache.make_key(file_digest(info_module.__file__), file_digest(filepath), self.host_profile())
+        validated: List[ModuleType] = []
+        ran: List[bool] = []
+
+        def validate() -> Verdict:
+            ran.append(True)
+            try:
+                validated.append(self.validate(self.load_contract(filepath), info_module, reload))
+                return Verdict(compliant=True)
+            except ValueError as ve:
+                return Verdict(compliant=False, error=str(ve))
+
+        verdict = verdicts.resolve(key, validate, revalidate)
+        metrics.record_cache("verdicts", hit=not ran)
+        if not ran:
+            metrics.record_validation(verdict.error if not verdict.compliant else None)
+        if not verdict.compliant:
+            raise ValueError(verdict.error)
+        if validated:
+            return validated[0]
+        self.logger.debug(f"Reusing cached verdict for {info_module.__name__}")
+        if not reload:
+            return info_module
+        with span(PHASE_LOAD):
+            return ModuleUtil().load_module(info_module)
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError("SpySession has been closed.")
+
+
+_DIGESTED_TYPES = (type(None), bool, int, float, complex, str, bytes, bytearray, list, tuple, dict, set, frozenset)
+
+
+def _module_state(info_module: ModuleType) -> str:
+    """
+    Digest the state of a module that its structure is extracted from.
+
+    Every global is taken in the bounded form `ModuleUtil.capture_value`
+    gives it, so a reassigned or mutated value changes the digest. Functions,
+    classes and other objects it captures by type alone are identified by
+    `id()` as well, and the attributes of the module's classes are digested
+    the same way one level down.
+    """
+    capture = ModuleUtil().capture_value
+    digest = hashlib.blake2b(digest_size=16)
+
+    def add(name, value):
+        captured = capture(value)
+        identity = None if isinstance(value, _DIGESTED_TYPES) else id(value)
+        digest.update(repr((name, captured, identity)).encode())
+
+    for name, value in list(vars(info_module).items()):
+        if name == "__builtins__":
+            continue
+        add(name, value)
+        if isinstance(value, type) and value.__module__ == info_module.__name__:
+            for attribute, attribute_value in list(vars(value).items()):
+                add(f"{name}.{attribute}", attribute_value)
+    return digest.hexdigest()
+
+
+def _extract(info_module: ModuleType) -> Module:
+    """
+    Extract the structure of a module, counting the inspected members.
+    """
+    module = Module.from_module(info_module)
+    classes = module.classes or []
+    for kind, count in (
+        ("variable", len(module.variables or [])),
+        ("function", len(module.functions or [])),
+        ("class", len(classes)),
+        ("method", sum(len(cls.methods or []) for cls in classes)),
+        ("attribute", sum(len(cls.attributes or []) for cls in classes)),
+    ):
+        if count:
+            metrics.MEMBERS_INSPECTED.inc(count, kind=kind)
+    return module
+
+
+_default_session: Optional[SpySession] = None
+_default_session_lock = threading.Lock()
+
+
+def default_session() -> SpySession:
+    """
+    Return the process-wide session used by one-shot `Spy()` calls.
+
+    It does not pin the host profile, so environment changes made by the
+    process between validations are always observed.
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None or _default_session.closed:
+            _default_session = SpySession(pin_host=False)
+        return _default_session
@@ -0,0 +1,160 @@
+"""
+Per-phase timing instrumentation for ImportSpy.
+
+A validation goes through a handful of phases: parsing the YAML contract,
+executing the module, extracting its structure, capturing the host
+(architecture, OS, Python, environment) and running the validators. Each of
+them is wrapped in a `span`, which measures it with `perf_counter_ns` and
+adds the elapsed time to the recording active in the current context.
+
+Each phase is also observed by the `importspy_phase_seconds` histogram of
+`importspy.metrics`. A recording collects the phases of one block of code:
+
+    with record() as timings:
+        Spy().importspy(filepath="spymodel.yml", info_module=module)
+    print(format_timings(timings))
+
+Phases are reported in seconds. Time not spent in any phase (cache lookups,
+hashing for verdict keys) only shows in `total`. While a trace is being
+recorded (see `importspy.tracing`), every phase also appears in it as a span.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import metrics, tracing
+
+PHASE_CONTRACT = "contract"
+PHASE_LOAD = "load"
+PHASE_EXTRACT = "extract"
+PHASE_HOST = "host"
+PHASE_VALIDATE = "validate"
+PHASE_TOTAL = "total"
+
+PHASES = (PHASE_CONTRACT, PHASE_LOAD, PHASE_EXTRACT, PHASE_HOST, PHASE_VALIDATE)
+
+_recording: ContextVar[Optional[Dict[str, int]]] = ContextVar("importspy_timings", default=None)
+
+
+class span:
+    """
+    Context manager observing the duration of its block as a phase, in the
+    phase histogram and in the active recording and trace, if any.
+    """
+
+    __slots__ = ("phase", "_recording", "_tracer", "_started")
+
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __enter__(self) -> 'span':
+        self._recording = _recording.get()
+        self._tracer = tracing.active_tracer()
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        ended = time.perf_counter_ns()
+        metrics.PHASE_SECONDS.observe((ended - self._started) / 1e9, phase=self.phase)
+        if self._recording is not None:
+            self._recording[self.phase] = self._recording.get(self.phase, 0) + ended - self._started
+        if self._tracer is not None:
+            self._tracer.add(self.phase, tracing.CATEGORY_PHASE, self._started, ended)
+
+
+@contextmanager
+def record() -> Iterator[Dict[str, float]]:
+    """
+    Record the phases run in the block, in the current thread or task.
+
+    The yielded dictionary is filled when the block exits, even if it raises,
+    with the seconds spent in each phase and in the whole block (`total`).
+    Phases recorded by a nested `record()` also count towards the outer one.
+
+    Yields:
+    -------
+    Dict[str, float]
+        Seconds per phase.
+    """
+    timings: Dict[str, float] = {}
+    nanoseconds: Dict[str, int] = {}
+    outer = _recording.get()
+    token = _recording.set(nanoseconds)
+    started = time.perf_counter_ns()
+    try:
+        yield timings
+    finally:
+        total = time.perf_counter_ns() - started
+        _recording.reset(token)
+        if outer is not None:
+            for phase, elapsed in nanoseconds.items():
+                outer[phase] = outer.get(phase, 0) + elapsed
+        nanoseconds[PHASE_TOTAL] = total
+        timings.update({phase: elapsed / 1e9 for phase, elapsed in nanoseconds.items()})
+
+
+def format_timings(timings: Dict[str, float]) -> str:
+    """
+    Render the timings of one validation as a table, phases in execution order.
+    """
+    total = timings.get(PHASE_TOTAL) or sum(timings.values())
+    rows = [(phase, timings[phase]) for phase in PHASES if phase in timings]
+    rows += [(phase, value) for phase, value in timings.items() if phase not in PHASES and phase != PHASE_TOTAL]
+    rows.append((PHASE_TOTAL, total))
+    lines = [f"{'phase':<10} {'ms':>10} {'share':>7}"]
+    for phase, value in rows:
+        share = f"{100 * value / total:6.1f}%" if total else "      -"
+        lines.append(f"{phase:<10} {value * 1000:>10.3f} {share}")
+    return "\n".join(lines)
+
+
+def slowest(results: Iterable, top: int = 10) -> Tuple[List[Tuple[str, float]], List[Tuple[str, str, float]]]:
+    """
+    Find where the time of a batch went.
+
+    Parameters:
+    -----------
+    results : Iterable[ValidationResult]
+        Results carrying a `module` and its `timings`.
+
+    top : int
+        Number of entries to keep in each ranking.
+
+    Returns:
+    --------
+    Tuple[List[Tuple[str, float]], List[Tuple[str, str, float]]]
+        The slowest modules as `(module, seconds)`, and the slowest single
+        phases as `(module, phase, seconds)`, slowest first.
+    """
+    modules = []
+    phases = []
+    for result in results:
+        modules.append((result.module, result.timings.get(PHASE_TOTAL, 0.0)))
+        phases.extend(
+            (result.module, phase, value) for phase, value in result.timings.items() if phase != PHASE_TOTAL
+        )
+    modules.sort(key=lambda entry: entry[1], reverse=True)
+    phases.sort(key=lambda entry: entry[2], reverse=True)
+    return modules[:top], phases[:top]
+
+
+def format_summary(results: Iterable, top: int = 10) -> str:
+    """
+    Render the slowest modules and phases of a batch, and the time spent in
+    each phase across all of it.
+    """
+    results = list(results)
+    modules, phases = slowest(results, top)
+    totals: Dict[str, float] = {}
+    for result in results:
+        for phase, value in result.timings.items():
+            totals[phase] = totals.get(phase, 0.0) + value
+    lines = [f"Slowest modules (of {len(results)}):"]
+    lines += [f"  {value * 1000:>10.3f} ms  {module}" for module, value in modules]
+    lines.append("Slowest phases:")
+    lines += [f"  {value * 1000:>10.3f} ms  {phase:<9} {module}" for module, phase, value in phases]
+    lines.append("Time per phase, whole batch:")
+    lines += ["  " + line for line in format_timings(totals).splitlines()]
+    return "\n".join(lines)
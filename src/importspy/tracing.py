@@ -0,0 +1,188 @@
+"""
+Chrome trace-event export for ImportSpy.
+
+Totals per phase (see `importspy.timings`) do not show how a batch spread
+over its workers or which validation sat on the critical path. While a
+`Tracer` is active, ImportSpy records every phase as a span: contract load,
+module execution, structure extraction (one span per class), host capture
+and each validator, with its process and thread id. The result is written as
+Chrome trace-event JSON, which Perfetto (https://ui.perfetto.dev) and
+`chrome://tracing` open directly:
+
+    with tracing("trace.json"):
+        list(validate_many(pairs))
+
+Spans recorded by process-pool workers travel back with their verdicts and
+are merged into the caller's trace. When no tracer is active, `trace()`
+returns a shared no-op context manager, so instrumented code pays a global
+lookup per span.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+CATEGORY_VALIDATION = "validation"
+CATEGORY_PHASE = "phase"
+CATEGORY_EXTRACT = "extract"
+CATEGORY_VALIDATOR = "validator"
+
+_tracer: Optional['Tracer'] = None
+
+
+class Tracer:
+    """
+    Collects complete (`"ph": "X"`) trace events from every thread of the process.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.events: List[dict] = []
+        self._threads: Dict[tuple, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, category: str, started: int, ended: int, args: Optional[dict] = None):
+        """
+        Record a span of the calling thread, timed with `perf_counter_ns`.
+        """
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": started / 1000,
+            "dur": (ended - started) / 1000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault((event["pid"], event["tid"]), thread.name)
+
+    def merge(self, events: Iterable[dict]):
+        """
+        Add events recorded elsewhere, e.g. by a worker process.
+        """
+        with self._lock:
+            self.events.extend(events)
+
+    def to_json(self) -> dict:
+        """
+        Return the trace as a Chrome trace-event document.
+        """
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for (pid, tid), name in threads.items()
+        ]
+        metadata += [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": f"importspy {pid}"}}
+            for pid in sorted({event["pid"] for event in events})
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, filepath: str):
+        """
+        Write the trace to `filepath` as JSON.
+        """
+        with open(filepath, "w") as file:
+            json.dump(self.to_json(), file)
+
+
+class _Span:
+
+    __slots__ = ("tracer", "name", "category", "args", "_started")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> '_Span':
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.add(self.name, self.category, self._started, time.perf_counter_ns(), self.args)
+
+
+class _NoSpan:
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NoSpan':
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def trace(name: str, category: str = CATEGORY_VALIDATION, **args):
+    """
+    Return a context manager recording its block as a span of the active
+    tracer, or a no-op one when tracing is off.
+    """
+    if _tracer is None or _tracer.pid != os.getpid():
+        return _NO_SPAN
+    return _Span(_tracer, name, category, args)
+
+
+def active_tracer() -> Optional[Tracer]:
+    """
+    Return the tracer spans are currently recorded into, if any. A tracer
+    inherited by a forked worker process is not active in the worker.
+    """
+    if _tracer is None or _tracer.pid != os.getpid():
+        return None
+    return _tracer
+
+
+def start() -> Tracer:
+    """
+    Start recording spans from every thread of the process.
+
+    Raises:
+    -------
+    RuntimeError
+        If a tracer is already active.
+    """
+    global _tracer
+    if active_tracer() is not None:
+        raise RuntimeError("A trace is already being recorded.")
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop() -> Optional[Tracer]:
+    """
+    Stop recording and return the tracer that was active, if any.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+@contextmanager
+def tracing(filepath: Optional[str] = None) -> Iterator[Tracer]:
+    """
+    Record the spans of the block and, if `filepath` is given, write them
+    there when the block exits, even if it raises.
+    """
+    tracer = start()
+    try:
+        yield tracer
+    finally:
+        stop()
+        if filepath:
+            tracer.write(filepath)
@@ -11,6 +11,8 @@ Features:
 - Extract version information via metadata or attributes.
 - Retrieve global variables, top-level functions, and class definitions.
 - Analyze methods, attributes (class-level and instance-level), and superclasses.
+- Capture values in bounded form: scalars inline, anything else as a type tag,
+  a size and a digest of a bounded part of its content.
 
 Example:
     ```python
@@ -23,15 +25,21 @@ Example:
     ```
 """
 
+import functools
+import hashlib
 import inspect
 import importlib.util
+import itertools
 import sys
-import importlib.metadata
+import os
+import threading
 import logging
-from types import ModuleType, FunctionType
+from types import ModuleType, FunctionType, CodeType, FrameType
 from typing import List, Optional, Any
 from collections import namedtuple
 
+from ..tracing import CATEGORY_EXTRACT, trace
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
@@ -40,6 +48,157 @@ FunctionInfo = namedtuple('FunctionInfo', ["name", "arguments", "return_annotati
 ArgumentInfo = namedtuple('ArgumentInfo', ["name", "annotation", "value"])
 AttributeInfo = namedtuple('AttributeInfo', ["type", "name", "annotation", "value"])
 VariableInfo = namedtuple('VariableInfo', ["name", "annotation", "value"])
+ValueInfo = namedtuple('ValueInfo', ["type", "size", "digest"])
+
+MAX_INLINE_LENGTH = 256
+MAX_INLINE_BITS = 64
+MAX_DIGEST_BYTES = 64 * 1024
+MAX_DIGEST_DEPTH = 32
+
+IMPORTSPY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+IMPORTLIB_DIR = os.path.dirname(importlib.util.__file__) + os.sep
+
+FRAME_IMPORTSPY = "importspy"
+FRAME_BOOTSTRAP = "bootstrap"
+FRAME_USER = "user"
+
+SYNTHETIC_SEPARATOR = "@importspy"
+
+_synthetic_ids = itertools.count(1)
+_synthetic_ids_lock = threading.Lock()
+
+
+class _BoundedDigest:
+    """
+    Digest of the canonical encoding of a value, bounded by `MAX_DIGEST_BYTES`.
+
+    Sequences are walked element by element and the walk stops once the
+    budget is spent, so their cost does not depend on their size. Sets and
+    dictionaries have no order that is the same in every process, so any
+    elements picked within a budget would differ between processes: each of
+    their elements (or key-value pairs) is digested on its own, with an equal
+    share of the budget of at least `MIN_ELEMENT_BYTES`, and the element
+    digests are summed, which does not depend on iteration order. Those with
+    more elements than the budget has shares are encoded by type and size
+    only, so their cost does not depend on their size either.
+    Objects other than scalars, strings, bytes and builtin containers are
+    encoded by type only: their representation may be costly or hold
+    memory addresses.
+    """
+
+    MIN_ELEMENT_BYTES = 64
+
+    def __init__(self, budget: int = MAX_DIGEST_BYTES, stack: Optional[set] = None):
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._budget = budget
+        self._stack: set = stack if stack is not None else set()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def feed(self, data: bytes) -> bool:
+        if self._budget <= 0:
+            return False
+        self._hash.update(data[:self._budget])
+        self._budget -= len(data)
+        return self._budget > 0
+
+    def add(self, value: Any) -> bool:
+        """
+        Encode `value`; returns False once the budget is spent.
+        """
+        encoded = _encode_scalar(value, self._budget)
+        if encoded is not None:
+            return self.feed(encoded)
+        if not isinstance(value, (list, tuple, dict, set, frozenset)) or len(self._stack) >= MAX_DIGEST_DEPTH:
+            return self.feed(f"<{_type_name(value)}>;".encode())
+        if id(value) in self._stack:
+            return self.feed(b"<cycle>;")
+        self._stack.add(id(value))
+        try:
+            if not self.feed(f"{_type_name(value)}:{len(value)}[".encode()):
+                return False
+            if isinstance(value, (dict, set, frozenset)):
+                return self._add_unordered(value) and self.feed(b"];")
+            for item in value:
+                if not self.add(item):
+                    return False
+            return self.feed(b"];")
+        finally:
+            self._stack.discard(id(value))
+
+    def _add_unordered(self, value) -> bool:
+        """
+        Encode the sum of the digests of the elements of a set, or of the
+        key-value pairs of a dictionary, or only a marker when it has more
+        elements than the budget has shares.
+        """
+        if len(value) > self._budget // self.MIN_ELEMENT_BYTES:
+            return self.feed(b"<unsampled>")
+        share = max(self._budget // max(len(value), 1), self.MIN_ELEMENT_BYTES)
+        total = 0
+        spent = 0
+        pairs = isinstance(value, dict)
+        for element in (value.items() if pairs else value):
+            if pairs:
+                key, item = _encode_scalar(element[0], share), _encode_scalar(element[1], share)
+                encoded = b"tuple:2[" + key + item + b"];" if key is not None and item is not None else None
+            else:
+                encoded = _encode_scalar(element, share)
+            if encoded is not None:
+                encoded = encoded[:share]
+                total += int.from_bytes(hashlib.blake2b(encoded, digest_size=16).digest(), "big")
+                spent += len(encoded)
+                continue
+            digest = _BoundedDigest(share, self._stack)
+            digest.add(element)
+            total += int(digest.hexdigest(), 16)
+            spent += share - max(digest._budget, 0)
+        self._budget -= spent
+        self._hash.update(f"{total % (1 << 128):032x}".encode())
+        return self._budget > 0
+
+
+def _encode_scalar(value: Any, budget: int) -> Optional[bytes]:
+    """
+    Return the canonical encoding of a scalar, string or bytes value, of
+    which at most `budget` bytes are content, or `None` for anything else.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return f"{_type_name(value)}:{value:x};".encode()
+    if value is None or isinstance(value, (bool, float, complex)):
+        return f"{_type_name(value)}:{value!r};".encode()
+    if isinstance(value, str):
+        return f"str:{len(value)}:".encode() + value[:max(budget, 0)].encode("utf-8", "surrogatepass")
+    if isinstance(value, (bytes, bytearray)):
+        return f"bytes:{len(value)}:".encode() + bytes(value[:max(budget, 0)])
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _file_kind(filename: str) -> str:
+    """
+    Classify a source file as ImportSpy, importlib bootstrap or user code.
+
+    Kinds are cached by file name rather than by code object, so the cache
+    stays bounded and keeps no code object alive once its module is gone.
+    """
+    if filename.startswith(IMPORTSPY_DIR):
+        return FRAME_IMPORTSPY
+    if filename.startswith("<frozen importlib") or filename.startswith(IMPORTLIB_DIR):
+        return FRAME_BOOTSTRAP
+    return FRAME_USER
+
+
+def _type_name(value: Any) -> str:
+    """
+    Return the name of the type of `value`, qualified unless it is a builtin.
+    """
+    value_type = type(value)
+    if value_type.__module__ == "builtins":
+        return value_type.__qualname__
+    return f"{value_type.__module__}.{value_type.__qualname__}"
+
 
 
 class ModuleUtil:
@@ -63,6 +222,61 @@ class ModuleUtil:
         caller_frame = stack[-1]
         return current_frame, caller_frame
 
+    def resolve_caller(self) -> ModuleType | None:
+        """
+        Resolve the module importing the one that invoked ImportSpy.
+
+        Walks `sys._getframe()` lazily instead of materializing `inspect.stack()`,
+        so no `FrameInfo` objects are built and no source lines are read from disk.
+        ImportSpy's own frames are skipped to find the module that called it;
+        importlib bootstrap frames and further frames of that same file are then
+        skipped to reach the nearest importing module. Frame classification is
+        cached per code object.
+
+        Returns:
+            ModuleType | None: The importing module, or None if the caller
+            has no distinct importer (e.g. a module validating itself).
+        """
+        frame = sys._getframe(1)
+        while frame and self._frame_kind(frame.f_code) == FRAME_IMPORTSPY:
+            frame = frame.f_back
+        if not frame:
+            return None
+        current_filename = frame.f_code.co_filename
+        frame = frame.f_back
+        while frame and (
+            self._frame_kind(frame.f_code) != FRAME_USER
+            or frame.f_code.co_filename == current_filename
+        ):
+            frame = frame.f_back
+        if not frame:
+            return None
+        return self.module_from_frame(frame)
+
+    def module_from_frame(self, frame: FrameType) -> ModuleType | None:
+        """
+        Return the module whose code is running in `frame`.
+
+        Looks the frame's `__name__` up in `sys.modules` and falls back to
+        `inspect.getmodule` when that module does not own the frame's file.
+
+        Args:
+            frame (FrameType): The frame to resolve.
+
+        Returns:
+            ModuleType | None: The resolved module or None if not found.
+        """
+        module = sys.modules.get(frame.f_globals.get("__name__"))
+        if module is not None and getattr(module, "__file__", None) == frame.f_code.co_filename:
+            return module
+        return inspect.getmodule(frame)
+
+    def _frame_kind(self, code: CodeType) -> str:
+        """
+        Classify a code object as ImportSpy, importlib bootstrap or user code.
+        """
+        return _file_kind(code.co_filename)
+
     def get_info_module(self, caller_frame: inspect.FrameInfo) -> ModuleType | None:
         """
         Resolve a module object from a given caller frame.
@@ -77,7 +291,12 @@ class ModuleUtil:
 
     def load_module(self, info_module: ModuleType) -> ModuleType | None:
         """
-        Reload a module dynamically from its file location.
+        Re-execute a module from its file location in isolation.
+
+        The fresh copy is executed under a unique synthetic name (see
+        `synthetic_name`), so concurrent loads of modules sharing the same
+        name never clobber each other, and the original module in
+        `sys.modules` is left untouched.
 
         Args:
             info_module (ModuleType): The module to reload.
@@ -85,25 +304,90 @@ class ModuleUtil:
         Returns:
             ModuleType | None: The reloaded module or None if loading fails.
         """
-        spec = importlib.util.spec_from_file_location(info_module.__name__, info_module.__file__)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
+        return self._exec_isolated(self.original_name(info_module.__name__), info_module.__file__)
+
+    def import_from_path(self, modulepath: str) -> ModuleType | None:
+        """
+        Execute a Python source file in isolation as a module named after its stem.
+
+        Args:
+            modulepath (str): Path to the `.py` file.
+
+        Returns:
+            ModuleType | None: The executed module or None if loading fails.
+        """
+        module_path = os.path.abspath(modulepath)
+        module_name = os.path.splitext(os.path.basename(module_path))[0]
+        return self._exec_isolated(module_name, module_path)
+
+    def synthetic_name(self, module_name: str) -> str:
+        """
+        Return a process-unique name for an isolated copy of `module_name`.
+
+        The suffix is appended to the last dotted component, so the copy keeps
+        the same parent package and relative imports still resolve.
+
+        Args:
+            module_name (str): The module's regular name.
+
+        Returns:
+            str: A name such as `plugins.extension@importspy3`.
+        """
+        with _synthetic_ids_lock:
+            synthetic_id = next(_synthetic_ids)
+        return f"{self.original_name(module_name)}{SYNTHETIC_SEPARATOR}{synthetic_id}"
+
+    def original_name(self, module_name: str) -> str:
+        """
+        Strip the suffix added by `synthetic_name`, if any.
+
+        Args:
+            module_name (str): A regular or synthetic module name.
+
+        Returns:
+            str: The regular module name.
+        """
+        return module_name.split(SYNTHETIC_SEPARATOR, 1)[0]
+
+    def _exec_isolated(self, module_name: str, filepath: str) -> ModuleType | None:
+        """
+        Execute `filepath` as a new module under a synthetic name.
+
+        The module is present in `sys.modules` only while its code runs
+        (dataclasses and typing look themselves up there), then removed,
+        so the global import state is the same before and after the call.
+        When the file is a package `__init__.py`, the submodules it imports
+        relatively are registered under the synthetic name too, and removed
+        with it.
+        """
+        spec = importlib.util.spec_from_file_location(self.synthetic_name(module_name), filepath)
+        if not (spec and spec.loader):
+            return None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        try:
             spec.loader.exec_module(module)
-            sys.modules[module.__name__] = module
-            return module
-        return None
+        finally:
+            if sys.modules.get(spec.name) is module:
+                del sys.modules[spec.name]
+            if spec.submodule_search_locations is not None:
+                prefix = spec.name + "."
+                for name in [name for name in list(sys.modules) if name.startswith(prefix)]:
+                    sys.modules.pop(name, None)
+        return module
 
     def unload_module(self, module: ModuleType):
         """
-        Unload a module from sys.modules and globals.
+        Unload a module from sys.modules.
+
+        Only removes the entry if it is this very module object, so it can never
+        evict an unrelated module that happens to share the name.
 
         Args:
             module (ModuleType): The module to unload.
         """
-        module_name = module.__name__
-        if module_name in sys.modules:
-            del sys.modules[module_name]
-            globals().pop(module_name, None)
+        if sys.modules.get(module.__name__) is module:
+            del sys.modules[module.__name__]
 
     def extract_version(self, info_module: ModuleType) -> str | None:
         """
@@ -117,8 +401,10 @@ class ModuleUtil:
         """
         if hasattr(info_module, '__version__'):
             return info_module.__version__
+        import importlib.metadata
+
         try:
-            return importlib.metadata.version(info_module.__name__)
+            return importlib.metadata.version(self.original_name(info_module.__name__))
         except importlib.metadata.PackageNotFoundError:
             return None
 
@@ -138,6 +424,40 @@ class ModuleUtil:
             return annotation.__name__
         return str(annotation)
 
+    def capture_value(self, value: Any) -> Any:
+        """
+        Capture a value in the bounded form compared by contracts.
+
+        Booleans, integers of up to `MAX_INLINE_BITS` bits, floats other than NaN
+        (which never equals itself), `None` and strings of up to
+        `MAX_INLINE_LENGTH` characters are kept inline, as
+        their base type. Anything else (containers, large strings and numbers,
+        arbitrary objects) is reduced to a `ValueInfo` holding its type, its size
+        when it has one, and a digest of its content, so neither the value nor
+        a full copy of it is retained.
+
+        Args:
+            value: The value of a module global, class attribute or default argument.
+
+        Returns:
+            Any: The inline scalar, or a `ValueInfo`.
+        """
+        if value is None or isinstance(value, bool):
+            return value
+        if isinstance(value, int) and value.bit_length() <= MAX_INLINE_BITS:
+            return int(value)
+        if isinstance(value, float) and value == value:
+            return float(value)
+        if isinstance(value, str) and len(value) <= MAX_INLINE_LENGTH:
+            return str.__str__(value)
+        try:
+            size = len(value) if hasattr(type(value), "__len__") else None
+        except Exception:
+            size = None
+        bounded = _BoundedDigest()
+        bounded.add(value)
+        return ValueInfo(_type_name(value), size if isinstance(size, int) else None, bounded.hexdigest())
+
     def extract_variables(self, info_module: ModuleType) -> List[VariableInfo]:
         """
         Extract top-level variable definitions from a module.
@@ -152,7 +472,7 @@ class ModuleUtil:
         for name, value in inspect.getmembers(info_module):
             if not name.startswith('__') and not inspect.ismodule(value) and not inspect.isfunction(value) and not inspect.isclass(value):
                 annotation = self.extract_annotation(type(value))
-                variables_info.append(VariableInfo(name=name, annotation=annotation, value=value))
+                variables_info.append(VariableInfo(name=name, annotation=annotation, value=self.capture_value(value)))
         return variables_info
 
     def extract_functions(self, info_module: ModuleType) -> List[FunctionInfo]:
@@ -201,7 +521,7 @@ class ModuleUtil:
         args = []
         for name, param in inspect.signature(obj).parameters.items():
             value = param.default if param.default is not inspect.Signature.empty else None
-            args.append(ArgumentInfo(name=name, annotation=self.extract_annotation(param.annotation), value=value))
+            args.append(ArgumentInfo(name=name, annotation=self.extract_annotation(param.annotation), value=self.capture_value(value)))
         return args
 
     def extract_methods(self, cls_obj:Any) -> List[FunctionInfo]:
@@ -237,7 +557,7 @@ class ModuleUtil:
             if not callable(value) and not attr_name.startswith('__'):
                 attributes.append(AttributeInfo(
                     name=attr_name,
-                    value=value,
+                    value=self.capture_value(value),
                     type="class",
                     annotation=self.extract_annotation(annotations.get(attr_name))
                 ))
@@ -270,18 +590,21 @@ class ModuleUtil:
         """
         classes = []
         for name, cls in inspect.getmembers(info_module, inspect.isclass):
-            attributes = self.extract_attributes(cls, info_module)
-            methods = self.extract_methods(cls)
-            superclasses = self.extract_superclasses(cls)
+            with trace(f"class {name}", CATEGORY_EXTRACT):
+                attributes = self.extract_attributes(cls, info_module)
+                methods = self.extract_methods(cls)
+                superclasses = self.extract_superclasses(cls, info_module)
             classes.append(ClassInfo(name, attributes, methods, superclasses))
         return classes
 
-    def extract_superclasses(self, cls:Any) -> List[ClassInfo]:
+    def extract_superclasses(self, cls:Any, info_module: Optional[ModuleType] = None) -> List[ClassInfo]:
         """
         Extract base classes for a given class, recursively.
 
         Args:
             cls: The class whose base classes are being extracted.
+            info_module (ModuleType, optional): The module being inspected, used for
+                bases defined in it, since isolated modules are not kept in sys.modules.
 
         Returns:
             List[ClassInfo]: Metadata for each superclass.
@@ -291,6 +614,8 @@ class ModuleUtil:
             if base.__name__ == "object":
                 continue
             module = sys.modules.get(base.__module__)
+            if not module and info_module and base.__module__ == info_module.__name__:
+                module = info_module
             if not module:
                 continue
             superclasses.append(ClassInfo(
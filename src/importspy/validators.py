@@ -12,10 +12,10 @@ objects raise informative `ValueError` exceptions enriched with context bundles.
 Used both in embedded runtime validation and CLI mode.
 """
 
-from typing import List
+from typing import Any, List
 from .models import (
     Runtime, System, Environment, Python, Module,
-    Variable, Function, Class
+    Variable, Function, Class, ValueDigest
 )
 from .violation_systems import (
     RuntimeContractViolation, SystemContractViolation,
@@ -442,10 +442,22 @@ class VariableValidator:
             if var_1.annotation and var_1.annotation != var_2.annotation:
                 raise ValueError(contract_violation.mismatch_error_handler(var_1.annotation, var_2.annotation, Errors.ENTITY_MESSAGES))
 
-            if var_1.value != var_2.value:
+            if not _same_value(var_1.value, var_2.value):
                 raise ValueError(contract_violation.mismatch_error_handler(var_1.value, var_2.value, Errors.ENTITY_MESSAGES))
 
 
+def _same_value(expected: Any, actual: Any) -> bool:
+    """Compare an expected value with an extracted one.
+
+    Extracted values that are not small scalars are held as a `ValueDigest`;
+    an expected value spelled out in full (e.g. a long string) is captured the
+    same way before comparing, so the comparison is always on digests.
+    """
+    if isinstance(actual, ValueDigest) and not isinstance(expected, ValueDigest):
+        expected = ValueDigest.capture(expected)
+    return expected == actual
+
+
 class FunctionValidator:
     """Validates functions, their arguments, and return annotations."""
 
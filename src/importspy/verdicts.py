@@ -0,0 +1,431 @@
+"""
+Verdict caching for ImportSpy.
+
+A verdict records whether a given module source satisfied a given import
+contract. Since both inputs are identified by content hashes, a verdict
+stays valid until either file changes, so it can be reused by later imports
+in the same process and, when a cache directory is configured, by later
+processes as well.
+
+Verdicts are stored as small JSON documents named after their cache key.
+Writes go through a temporary file and `os.replace`, so concurrent readers
+never observe a partially written verdict. `VerdictCache.resolve` adds a
+per-key file lock on top, so that when many pre-forked workers import the
+same module at boot only the first one validates while the others wait
+briefly and reuse its verdict.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+REVALIDATE_ENV = "IMPORTSPY_REVALIDATE"
+LOCK_STRIPES = 64
+
+logger = logging.getLogger("/".join(__file__.split('/')[-2:]))
+logger.addHandler(logging.NullHandler())
+
+
+def file_digest(filepath: str) -> str:
+    """
+    Compute the SHA-256 digest of a file's content.
+
+    Parameters:
+    -----------
+    filepath : str
+        Path to the file to hash (a module source or an import contract).
+
+    Returns:
+    --------
+    str
+        Hexadecimal digest of the file content.
+    """
+    with open(filepath, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def atomic_write(path: str, content: str, mode: Optional[int] = None):
+    """
+    Replace the file at `path` with `content`, so that readers see either
+    the previous content or the new one, never a partial file.
+
+    The content goes to a temporary file created next to `path` by
+    `tempfile.mkstemp`, unique to this call even among threads of one
+    process, which is then renamed over `path`.
+
+    Parameters:
+    -----------
+    path : str
+        The file to replace.
+
+    content : str
+        The text to write.
+
+    mode : Optional[int]
+        Permissions of the file; `mkstemp`'s 0600 when omitted.
+
+    Raises:
+    -------
+    OSError
+        If the file cannot be written. The temporary file is removed.
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(content)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def default_cache_dir() -> str:
+    """
+    Return the per-user directory where verdicts are persisted by default.
+
+    Honors `XDG_CACHE_HOME` and falls back to `~/.cache`.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "importspy", "verdicts")
+
+
+def shared_memory_cache_dir() -> Optional[str]:
+    """
+    Return a verdict directory on the shared-memory filesystem, if there is one.
+
+    On Linux `/dev/shm` is a tmpfs shared by every process on the host, so
+    verdicts written there are exchanged between workers without touching disk.
+    Since any user can create files there, the directory is only used once
+    `private_directory` has checked that it belongs to the current user.
+    Returns `None` on platforms without it.
+    """
+    if not os.path.isdir("/dev/shm"):
+        return None
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return os.path.join("/dev/shm", f"importspy-{user}", "verdicts")
+
+
+def private_directory(path: str) -> bool:
+    """
+    Create `path` if needed and check that only the current user controls it.
+
+    A verdict directory decides which modules skip validation, so it must
+    not be writable by anyone else: the directory has to belong to the
+    current user with mode 0700, and every parent has to belong to the user
+    or to root and be writable by others only if it is sticky (like `/tmp`
+    and `/dev/shm`), so that nobody can swap the directory for their own.
+
+    Parameters:
+    -----------
+    path : str
+        The directory to create and check.
+
+    Returns:
+    --------
+    bool
+        Whether the directory can be trusted. Always `True` on platforms
+        without user ids.
+    """
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    except OSError:
+        return False
+    if not hasattr(os, "getuid"):
+        return True
+    uid = os.getuid()
+    try:
+        status = os.lstat(path)
+        if not stat.S_ISDIR(status.st_mode) or status.st_uid != uid or stat.S_IMODE(status.st_mode) != 0o700:
+            return False
+        parent = os.path.dirname(os.path.abspath(path))
+        while True:
+            status = os.stat(parent)
+            if status.st_uid not in (uid, 0):
+                return False
+            if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not status.st_mode & stat.S_ISVTX:
+                return False
+            if os.path.dirname(parent) == parent:
+                return True
+            parent = os.path.dirname(parent)
+    except OSError:
+        return False
+
+
+def host_profile() -> str:
+    """
+    Compute a digest of the host properties an import contract can constrain.
+
+    This is the structural fingerprint of the host `Runtime`: it covers CPU
+    architecture, operating system, Python version and interpreter, and the
+    environment variables, so that a verdict is never reused on a host where
+    the runtime part of the contract could evaluate differently. The whole
+    environment is covered, not only the variables a contract names, so
+    processes whose environments differ in any variable never share verdicts.
+    """
+    from .models import Runtime
+
+    return Runtime.from_host().fingerprint
+
+
+@dataclass
+class Verdict:
+    """
+    Outcome of validating a module source against an import contract.
+
+    Attributes:
+    -----------
+    compliant : bool
+        Whether the module satisfied the contract.
+
+    error : Optional[str]
+        The violation message reported when the module was not compliant.
+
+    created : float
+        Epoch timestamp of the validation, used to expire the verdict.
+    """
+
+    compliant: bool
+    error: Optional[str] = None
+    created: float = field(default_factory=time.time)
+
+
+class VerdictCache:
+    """
+    Cache of validation verdicts keyed by source and contract hashes.
+
+    Verdicts are always kept in memory. When `directory` is given they are
+    also written to disk, so that other processes importing the same module
+    under the same contract can skip validation entirely. A directory that
+    other users could write to (see `private_directory`) is not used, and
+    verdicts then only live in memory.
+    """
+
+    def __init__(self,
+                 directory: Optional[str] = None,
+                 ttl: Optional[float] = None,
+                 lock_timeout: float = 30.0):
+        """
+        Initialize the cache.
+
+        Parameters:
+        -----------
+        directory : Optional[str]
+            Directory used to persist verdicts. If `None`, verdicts only live
+            in memory for the lifetime of the cache object.
+
+        ttl : Optional[float]
+            Seconds after which a verdict is considered stale. `None` keeps
+            verdicts until the module source or the contract changes.
+
+        lock_timeout : float
+            Seconds a process waits for another one validating the same key
+            before giving up and validating on its own.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self._verdicts: dict[str, Verdict] = {}
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._held = threading.local()
+        if directory and not private_directory(directory):
+            logger.warning(f"Not persisting verdicts: {directory} is not private to the current user")
+            self.directory = None
+
+    @classmethod
+    def shared(cls, ttl: Optional[float] = None, lock_timeout: float = 30.0) -> 'VerdictCache':
+        """
+        Build a cache in shared memory, falling back to the user cache directory
+        when there is no shared memory or its directory is not private.
+        """
+        directory = shared_memory_cache_dir()
+        if not directory or not private_directory(directory):
+            directory = default_cache_dir()
+        return cls(directory, ttl=ttl, lock_timeout=lock_timeout)
+
+    @staticmethod
+    def make_key(source_hash: str, contract_hash: str, profile: Optional[str] = None) -> str:
+        """
+        Combine the module source hash, the contract hash and, optionally,
+        the host profile into a cache key.
+        """
+        return hashlib.sha256(f"{source_hash}:{contract_hash}:{profile or ''}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Verdict]:
+        """
+        Return the verdict stored under `key`, or `None` if there is none
+        or it has expired.
+        """
+        verdict = self._verdicts.get(key)
+        if verdict is None and self.directory:
+            verdict = self._read(key)
+            if verdict is not None:
+                self._verdicts[key] = verdict
+        if verdict is not None and self._expired(verdict):
+            self._verdicts.pop(key, None)
+            return None
+        return verdict
+
+    def put(self, key: str, verdict: Verdict):
+        """
+        Store `verdict` under `key`, persisting it if a directory is configured.
+        """
+        self._verdicts[key] = verdict
+        if self.directory:
+            self._write(key, verdict)
+
+    def resolve(self,
+                key: str,
+                validate: Callable[[], Verdict],
+                revalidate: bool = False) -> Verdict:
+        """
+        Return the verdict for `key`, producing it with `validate` at most once.
+
+        The lookup and the validation run under a lock shared across threads
+        and, when a directory is configured, across processes. Keys are spread
+        over `LOCK_STRIPES` locks, so their number stays fixed however many
+        keys are resolved; keys of the same stripe wait for each other. Callers
+        that find the lock taken wait up to `lock_timeout` seconds and then
+        reuse the verdict written by the lock holder.
+
+        Parameters:
+        -----------
+        key : str
+            Cache key built with `make_key()`.
+
+        validate : Callable[[], Verdict]
+            Function performing the actual validation on a cache miss.
+
+        revalidate : bool
+            Ignore any stored verdict and validate again. Setting the
+            `IMPORTSPY_REVALIDATE` environment variable has the same effect.
+
+        Returns:
+        --------
+        Verdict
+            The cached or freshly produced verdict.
+        """
+        revalidate = revalidate or bool(os.environ.get(REVALIDATE_ENV))
+        if not revalidate:
+            verdict = self.get(key)
+            if verdict is not None:
+                return verdict
+        stripe = self._stripe(key)
+        held = self._held_stripes()
+        if stripe in held:
+            # A validation nested in one of this thread, e.g. a module that
+            # validates its own importer: the stripe is already held.
+            return self._produce(key, validate, revalidate)
+        with self._locks[stripe], self._file_lock(stripe):
+            held.add(stripe)
+            try:
+                return self._produce(key, validate, revalidate)
+            finally:
+                held.discard(stripe)
+
+    def clear(self):
+        """
+        Forget every in-memory verdict. Persisted verdicts are left untouched.
+        """
+        self._verdicts.clear()
+
+    def _expired(self, verdict: Verdict) -> bool:
+        return self.ttl is not None and time.time() - verdict.created > self.ttl
+
+    def _produce(self, key: str, validate: Callable[[], Verdict], revalidate: bool) -> Verdict:
+        if not revalidate:
+            verdict = self.get(key)
+            if verdict is not None:
+                return verdict
+        verdict = validate()
+        self.put(key, verdict)
+        return verdict
+
+    @staticmethod
+    def _stripe(key: str) -> int:
+        return int(hashlib.sha256(key.encode()).hexdigest()[:8], 16) % LOCK_STRIPES
+
+    def _held_stripes(self) -> set:
+        held = getattr(self._held, "stripes", None)
+        if held is None:
+            held = self._held.stripes = set()
+        return held
+
+    def _file_lock(self, stripe: int) -> '_FileLock':
+        path = os.path.join(self.directory, f"stripe-{stripe:02x}.lock") if self.directory and fcntl else None
+        return _FileLock(path, self.lock_timeout)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read(self, key: str) -> Optional[Verdict]:
+        try:
+            with open(self._path(key)) as file:
+                return Verdict(**json.load(file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write(self, key: str, verdict: Verdict):
+        try:
+            atomic_write(self._path(key), json.dumps(asdict(verdict)))
+        except OSError:
+            pass
+
+
+class _FileLock:
+    """
+    Exclusive advisory lock on a file, acquired by polling up to a timeout.
+
+    If the lock cannot be taken in time the protected block runs anyway:
+    a late validation is always preferable to blocking an import forever.
+    A `None` path makes the lock a no-op.
+    """
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, path: Optional[str], timeout: float):
+        self.path = path
+        self.timeout = timeout
+        self._fd: Optional[int] = None
+
+    def __enter__(self):
+        if not self.path:
+            return self
+        try:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError:
+            return self
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return self
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(self._fd)
+                    self._fd = None
+                    return self
+                time.sleep(self.POLL_INTERVAL)
+
+    def __exit__(self, *exc_info):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
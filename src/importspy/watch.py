@@ -0,0 +1,374 @@
+"""
+Watch mode for ImportSpy.
+
+`Watcher` keeps a set of modules under continuous validation against one
+import contract. It waits for file changes using inotify on Linux, falling
+back to polling elsewhere, lets bursts of saves settle for a debounce
+period, and then:
+
+- re-imports and revalidates only the modules whose content changed;
+- on a contract edit, re-checks the modules affected by the edited clauses
+  on their cached structures, through a `ContractIndex`, without importing
+  them again.
+
+Each check returns `Delta` objects describing what changed since the
+previous one (newly failing, newly passing, removed), so that callers print
+changes rather than full reports. All state is bounded by the number of
+watched files: modules are loaded in isolation and never registered in
+`sys.modules`, and the session caches are size-bounded.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .contract_index import ContractIndex
+from .session import SpySession
+from .utilities.module_util import ModuleUtil
+from .verdicts import file_digest
+
+
+@dataclass
+class Delta:
+    """
+    Change in the verdict of a watched module.
+
+    Attributes:
+    -----------
+    module : str
+        Path of the module.
+
+    compliant : Optional[bool]
+        The new verdict, or `None` if the module was removed.
+
+    previous : Optional[bool]
+        The previous verdict, or `None` if the module was not watched before.
+
+    error : Optional[str]
+        The violation or error reported for a non-compliant module.
+    """
+
+    module: str
+    compliant: Optional[bool]
+    previous: Optional[bool]
+    error: Optional[str] = None
+
+    @property
+    def newly_failing(self) -> bool:
+        return self.compliant is False and self.previous is not False
+
+    @property
+    def newly_passing(self) -> bool:
+        return self.compliant is True and self.previous is not True
+
+
+class _Inotify:
+    """
+    Minimal ctypes binding to Linux inotify, used to sleep until a watched
+    directory changes instead of polling it.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watched = set()
+
+    def add(self, directory: str):
+        if directory in self._watched:
+            return
+        if self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK) >= 0:
+            self._watched.add(directory)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """
+        Block until an event arrives or `timeout` expires, then drain the queue.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _open_inotify() -> Optional[_Inotify]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return _Inotify()
+    except (OSError, AttributeError):
+        return None
+
+
+class Watcher:
+    """
+    Continuously validates modules against an import contract.
+    """
+
+    def __init__(self,
+                 paths: Iterable[str],
+                 contract: str,
+                 session: Optional[SpySession] = None,
+                 debounce: float = 0.2,
+                 poll_interval: float = 1.0,
+                 use_inotify: bool = True):
+        """
+        Prepare a watcher. Nothing is validated until the first `check()`.
+
+        Parameters:
+        -----------
+        paths : Iterable[str]
+            Module files or directories, searched recursively for the `.py`
+            files named as the contract's `filename`.
+
+        contract : str
+            Path to the `.yml` import contract.
+
+        session : Optional[SpySession]
+            Session used to validate; it must have a `ContractIndex`. A new
+            one is opened when omitted.
+
+        debounce : float
+            Seconds without further changes before a burst of saves is checked.
+
+        poll_interval : float
+            Seconds between scans when inotify is not used.
+
+        use_inotify : bool
+            Use inotify where available instead of polling.
+
+        Raises:
+        -------
+        ValueError
+            If `session` has no `ContractIndex`.
+        """
+        if session is not None and session.index is None:
+            raise ValueError("Watcher needs a SpySession with a ContractIndex.")
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.contract = os.path.abspath(contract)
+        self.session = session or SpySession(index=ContractIndex())
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._inotify = _open_inotify() if use_inotify else None
+        self._stats: Dict[str, Tuple[int, int]] = {}
+        self._digests: Dict[str, str] = {}
+        self._verdicts: Dict[str, Tuple[bool, Optional[str]]] = {}
+        self._contract_failed = False
+        self._filename: Optional[str] = None
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Whether changes are detected through inotify rather than polling."""
+        return self._inotify is not None
+
+    def check(self) -> List[Delta]:
+        """
+        Revalidate what changed since the previous check.
+
+        Returns:
+        --------
+        List[Delta]
+            Modules whose verdict or violation changed. The first check
+            reports every module.
+        """
+        stats = self._settled_scan()
+        changed = [path for path in stats if self._content_changed(path, stats)]
+        removed = [path for path in self._stats if path not in stats]
+        self._stats = stats
+
+        verdicts: Dict[str, Tuple[bool, Optional[str]]] = {}
+        if self.contract in changed:
+            changed.remove(self.contract)
+            if self._contract_failed:
+                changed = sorted(set(changed) | set(self._verdicts))
+            else:
+                verdicts.update(self._revalidate_contract())
+        for path in changed:
+            verdicts[path] = self._validate(path)
+
+        deltas = []
+        for path in removed:
+            self._digests.pop(path, None)
+            self.session.index.forget(self.contract, path)
+            previous = self._verdicts.pop(path, None)
+            if previous is not None:
+                deltas.append(Delta(path, None, previous[0]))
+        for path, verdict in sorted(verdicts.items()):
+            previous = self._verdicts.get(path)
+            self._verdicts[path] = verdict
+            if previous != verdict:
+                deltas.append(Delta(path, verdict[0], previous[0] if previous else None, verdict[1]))
+        return deltas
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sleep until a watched file may have changed.
+
+        Returns:
+        --------
+        bool
+            False if `timeout` expired without any change notification.
+            Without inotify, always True after `poll_interval` seconds.
+        """
+        if self._inotify is None:
+            time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+            return True
+        for directory in self._directories():
+            self._inotify.add(directory)
+        return self._inotify.wait(timeout)
+
+    def run(self, on_delta: Callable[[Delta], None], stop: Optional[threading.Event] = None):
+        """
+        Check and report changes until `stop` is set.
+
+        Parameters:
+        -----------
+        on_delta : Callable[[Delta], None]
+            Called for every change, starting with the initial verdicts.
+
+        stop : Optional[threading.Event]
+            Event ending the loop; without it the loop runs until interrupted.
+        """
+        stop = stop or threading.Event()
+        for delta in self.check():
+            on_delta(delta)
+        while not stop.is_set():
+            if self.wait(timeout=1.0):
+                for delta in self.check():
+                    on_delta(delta)
+
+    def close(self):
+        """
+        Release the inotify descriptor and the session.
+        """
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self.session.close()
+
+    def _contract_filename(self) -> Optional[str]:
+        """
+        Return the module filename the contract applies to. While the contract
+        cannot be loaded, the last known one is kept.
+        """
+        try:
+            self._filename = self.session.load_contract(self.contract).filename
+        except Exception:
+            pass
+        return self._filename
+
+    def _modules(self) -> List[str]:
+        """
+        Return the watched module files. In directories, only the files named
+        as the contract's `filename` are watched, leaving out packages'
+        `__init__.py` and helper modules the contract does not describe.
+        """
+        filename = self._contract_filename()
+        modules = []
+        for path in self.paths:
+            if os.path.isdir(path):
+                for root, directories, files in os.walk(path):
+                    directories[:] = [d for d in directories if not d.startswith(".") and d != "__pycache__"]
+                    modules.extend(
+                        os.path.join(root, name) for name in files
+                        if name.endswith(".py") and (filename is None or name == filename)
+                    )
+            elif os.path.isfile(path):
+                modules.append(path)
+        return modules
+
+    def _directories(self) -> List[str]:
+        directories = {os.path.dirname(self.contract)}
+        for path in self.paths:
+            if os.path.isdir(path):
+                for root, subdirectories, _ in os.walk(path):
+                    subdirectories[:] = [d for d in subdirectories if not d.startswith(".") and d != "__pycache__"]
+                    directories.add(root)
+            else:
+                directories.add(os.path.dirname(path))
+        return sorted(directories)
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        stats = {}
+        for path in [self.contract, *self._modules()]:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def _settled_scan(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Scan until two scans `debounce` seconds apart agree, so that a burst
+        of saves is handled once.
+        """
+        stats = self._scan()
+        while stats != self._stats and self.debounce > 0:
+            time.sleep(self.debounce)
+            settled = self._scan()
+            if settled == stats:
+                break
+            stats = settled
+        return stats
+
+    def _content_changed(self, path: str, stats: Dict[str, Tuple[int, int]]) -> bool:
+        if self._stats.get(path) == stats[path]:
+            return False
+        try:
+            digest = file_digest(path)
+        except OSError:
+            return False
+        if self._digests.get(path) == digest:
+            return False
+        self._digests[path] = digest
+        return True
+
+    def _validate(self, path: str) -> Tuple[bool, Optional[str]]:
+        try:
+            info_module = ModuleUtil().import_from_path(path)
+            self.session.importspy(self.contract, info_module, reload=False)
+            self._contract_failed = False
+            return True, None
+        except ValueError as ve:
+            return False, str(ve)
+        except Exception as e:
+            return False, f"{type(e).__name__}: {e}"
+
+    def _revalidate_contract(self) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """
+        Re-check the modules affected by a contract edit. If the contract
+        cannot be loaded every module fails, and the next edit re-imports them.
+        """
+        try:
+            results = self.session.index.revalidate(self.contract, self.session)
+        except Exception as e:
+            self._contract_failed = True
+            error = f"{type(e).__name__}: {e}"
+            return {path: (False, error) for path in self._verdicts}
+        return {
+            result.module: (result.compliant, result.violations[0] if result.violations else None)
+            for result in results
+        }
@@ -0,0 +1,46 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from importspy.backends import (
+    Backend,
+    create_executor,
+    decode_verdict,
+    encode_request,
+    is_isolated,
+    subinterpreters_available,
+    validate_request
+)
+
+
+class TestBackends:
+
+    @pytest.fixture
+    def plugin(self, make_plugin):
+        return make_plugin("backendplugin.py")
+
+    @pytest.fixture
+    def contract_text(self, engine_contract):
+        return lambda engine: engine_contract("backendplugin.py", engine)
+
+    def test_validate_request_compliant(self, plugin, contract_text):
+        verdict = decode_verdict(validate_request(encode_request(plugin, contract_text=contract_text("docker"))))
+        assert verdict.compliant
+
+    def test_validate_request_violation(self, plugin, make_contract):
+        contract = make_contract("backendplugin.py", "podman")
+        verdict = decode_verdict(validate_request(encode_request(plugin, contract_path=contract)))
+        assert not verdict.compliant
+        assert "engine" in verdict.error
+
+    def test_thread_backend(self):
+        with create_executor(Backend.THREADS, 2) as executor:
+            assert isinstance(executor, ThreadPoolExecutor)
+            assert not is_isolated(executor)
+
+    def test_subinterpreter_backend(self, plugin, contract_text):
+        with create_executor(Backend.SUBINTERPRETERS, 2) as executor:
+            if not subinterpreters_available():
+                assert isinstance(executor, ProcessPoolExecutor)
+            assert is_isolated(executor)
+            payloads = [encode_request(plugin, contract_text=contract_text(engine)) for engine in ("docker", "podman")]
+            verdicts = [decode_verdict(payload) for payload in executor.map(validate_request, payloads)]
+        assert [verdict.compliant for verdict in verdicts] == [True, False]
@@ -0,0 +1,61 @@
+import pytest
+from importspy.backends import Backend
+from importspy.batch import ValidationResult, validate_many
+from importspy.session import SpySession
+
+
+class TestValidateMany:
+
+    @pytest.fixture
+    def plugins(self, make_plugin):
+        return [
+            make_plugin("batchplugin.py", f"engine = '{'docker' if index % 3 else 'podman'}'\n", f"plugin{index}")
+            for index in range(12)
+        ]
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return make_contract("batchplugin.py", name="spymodel.yml")
+
+    @pytest.mark.parametrize("backend", [Backend.THREADS, Backend.PROCESSES])
+    def test_results(self, plugins, contract, backend):
+        results = list(validate_many(((plugin, contract) for plugin in plugins), workers=2, backend=backend))
+        assert all(isinstance(result, ValidationResult) for result in results)
+        assert sorted(result.module for result in results) == sorted(plugins)
+        failing = sorted(result.module for result in results if not result.compliant)
+        assert failing == plugins[::3]
+        for result in results:
+            assert result.timings["total"] >= result.timings["load"] >= 0
+            assert bool(result.violations) != result.compliant
+            assert result.error is None
+
+    def test_bounded_in_flight(self, plugins, contract):
+        consumed = []
+
+        def pairs():
+            for plugin in plugins:
+                consumed.append(plugin)
+                yield plugin, contract
+
+        results = validate_many(pairs(), workers=2)
+        next(results)
+        assert len(consumed) <= 2 * 2 + 1
+        results.close()
+        assert len(consumed) < len(plugins)
+
+    def test_contract_parsed_once(self, plugins, contract):
+        with SpySession() as session:
+            list(validate_many(((plugin, contract) for plugin in plugins), workers=4, session=session))
+            stats = session.stats()["contracts"]
+        assert stats.misses == 1
+        assert stats.hits + stats.misses == len(plugins)
+
+    @pytest.mark.parametrize("backend", [Backend.THREADS, Backend.PROCESSES])
+    def test_errors_do_not_stop_batch(self, plugins, contract, tmp_path, backend):
+        broken = tmp_path / "broken.py"
+        broken.write_text("raise ImportError('missing dependency')\n")
+        pairs = [(str(broken), contract), (plugins[1], contract), (plugins[1], str(tmp_path / "missing.yml"))]
+        results = {(result.module, result.contract): result for result in validate_many(pairs, workers=2, backend=backend)}
+        assert "missing dependency" in results[(str(broken), contract)].error
+        assert results[(plugins[1], contract)].compliant
+        assert not results[(plugins[1], str(tmp_path / "missing.yml"))].compliant
@@ -0,0 +1,172 @@
+import json
+import pytest
+from benchmarks.corpus import (
+    STATUS_EXTRACTION_ERROR,
+    STATUS_OK,
+    STATUS_SKIPPED,
+    ModuleReport,
+    format_report,
+    main as corpus_main,
+    self_validate
+)
+from benchmarks.generator import Shape, generate, module_source, shape_for
+from benchmarks.memory import PhaseMemory, format_profile, phases, profile
+from benchmarks.run import compare, format_results, measure
+from benchmarks import structures
+from importspy.s import Spy
+from importspy.session import SpySession
+from importspy.utilities.module_util import ModuleUtil
+
+
+class TestGenerator:
+
+    def test_shape_for(self):
+        shape = shape_for(1000)
+        assert shape.variables == 250
+        assert shape.functions == 250
+        assert abs(shape.members - 1000) < 1 + shape.methods
+
+    @pytest.mark.parametrize("shape", [shape_for(10), shape_for(200), Shape(3, 2, 7, methods=0, arguments=0, depth=3)])
+    def test_generated_module_is_compliant(self, tmp_path, shape):
+        module_path, contract_path = generate(shape, str(tmp_path))
+        info_module = ModuleUtil().import_from_path(module_path)
+        Spy().importspy(filepath=contract_path, info_module=info_module, reload=False)
+
+    def test_generated_contract_is_checked(self, tmp_path):
+        shape = shape_for(50)
+        module_path, contract_path = generate(shape, str(tmp_path))
+        with open(module_path, "w") as file:
+            file.write(module_source(shape).replace("var_3: int = 3", "var_3: int = 4"))
+        info_module = ModuleUtil().import_from_path(module_path)
+        with pytest.raises(ValueError):
+            Spy().importspy(filepath=contract_path, info_module=info_module, reload=False)
+
+
+class TestRun:
+
+    def test_measure(self, tmp_path):
+        results = measure(10, str(tmp_path), repeat=1)
+        assert results["members"] == shape_for(10).members
+        for metric in ("contract_load", "from_module", "module_validator", "python_validator", "cli"):
+            assert results[metric] > 0
+
+    def test_compare(self):
+        baseline = {"results": {"10": {"members": 9, "cli": 0.4, "extract": 0.001}}}
+        results = {"results": {
+            "10": {"members": 9, "cli": 0.45, "extract": 0.002, "from_module": 0.1},
+            "100": {"members": 99, "cli": 9.0}
+        }}
+        assert compare(results, baseline, tolerance=0.25) == [("10", "extract", 0.001, 0.002)]
+        assert compare(results, baseline, tolerance=1.5) == []
+
+    def test_format_results(self):
+        table = format_results({"results": {"10": {"members": 9, "cli": 0.5}, "100": {"members": 99, "cli": 0.75}}})
+        assert table.splitlines()[1].split() == ["cli", "500.000", "750.000"]
+
+
+class TestCorpus:
+
+    @pytest.fixture
+    def corpus(self, tmp_path, monkeypatch):
+        (tmp_path / "corpus_plain.py").write_text(
+            "engine = 'docker'\nretries = 3\n\ndef run(job: str) -> bool:\n    return True\n\n"
+            "class Job:\n    kind = 'batch'\n\n    def start(self, delay: int) -> None:\n        pass\n"
+        )
+        (tmp_path / "corpus_table.py").write_text("TABLE = {'a': 1, 'b': 2}\n")
+        (tmp_path / "corpus_broken.py").write_text("callback = print\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        return tmp_path
+
+    @pytest.fixture
+    def session(self):
+        with SpySession() as session:
+            yield session
+
+    def test_self_validation(self, corpus, session):
+        report = self_validate("corpus_plain", str(corpus), session)
+        assert report.status == STATUS_OK, report.error
+        assert report.members == 5
+        assert set(report.timings) == {"extract", "dump", "load", "validate"}
+        assert report.peak_memory > 0
+        assert (corpus / "corpus_plain.yml").exists()
+
+    def test_table_is_compliant(self, corpus, session):
+        assert self_validate("corpus_table", str(corpus), session).status == STATUS_OK
+
+    def test_extraction_error(self, corpus, session):
+        report = self_validate("corpus_broken", str(corpus), session)
+        assert report.status == STATUS_EXTRACTION_ERROR
+        assert report.error.startswith("ValidationError")
+
+    @pytest.mark.parametrize("name", ["sys", "corpus_missing"])
+    def test_skipped(self, corpus, session, name):
+        assert self_validate(name, str(corpus), session).status == STATUS_SKIPPED
+
+    def test_format_report(self):
+        table = format_report([
+            ModuleReport("fast", timings={"extract": 0.001}, members=3),
+            ModuleReport("slow", timings={"extract": 0.002}, members=5),
+            ModuleReport("broken", status=STATUS_EXTRACTION_ERROR, error="TypeError: boom")
+        ])
+        lines = table.splitlines()
+        assert lines[0] == "Modules: 1 extraction_error, 2 ok"
+        assert "broken: TypeError: boom" in lines[2]
+        assert lines[4].endswith("slow")
+
+    def test_main(self, corpus, tmp_path, capsys):
+        output = tmp_path / "corpus.json"
+        assert corpus_main(["corpus_plain", "corpus_broken", "--output", str(output)]) == 1
+        reports = json.loads(output.read_text())["modules"]
+        assert [report["status"] for report in reports] == [STATUS_OK, STATUS_EXTRACTION_ERROR]
+        assert "Failures:" in capsys.readouterr().out
+
+
+class TestMemoryProfile:
+
+    def test_profile_detects_growth(self):
+        held = []
+        result = profile("leaky", lambda: held.append(bytearray(1024)), iterations=20)
+        assert result.iterations == 20
+        assert result.peak >= result.retained
+        assert result.growth >= 10 * 1024
+        assert result.growth_per_run >= 1024
+
+    def test_profile_top(self):
+        result = profile("noop", lambda: None, iterations=4, top=3)
+        assert len(result.top) <= 3
+
+    def test_phases(self, tmp_path):
+        module_path, contract_path = generate(shape_for(10), str(tmp_path))
+        selected = phases(module_path, contract_path)
+        assert list(selected) == ["contract", "load", "extract", "host", "validate", "importspy"]
+        for run in selected.values():
+            run()
+
+    def test_format_profile(self):
+        table = format_profile([PhaseMemory("load", 10, 4096, 2048, 1024, [("module.py:3", 2048)])])
+        lines = table.splitlines()
+        assert lines[1].split() == ["load", "10", "4.0", "2.0", "204.8"]
+        assert lines[2] == "Retained by load:"
+
+
+class TestStructures:
+
+    def test_measure(self, tmp_path):
+        results = structures.measure(10, str(tmp_path), repeat=1)
+        assert results["models"] > results["members"]
+        for metric in ("extract", "observed", "validated"):
+            assert results[metric] > 0
+        assert 0 < results["observed_bytes"] < results["validated_bytes"]
+
+    def test_count_models(self):
+        from importspy.models import Argument, Function, Module
+
+        module = Module(functions=[Function(name="run", arguments=[Argument(name="job"), Argument(name="retries")])])
+        assert structures.count_models(module) == 4
+
+    def test_format_results(self):
+        table = structures.format_results([{
+            "members": 9, "models": 40, "extract": 0.002, "observed": 0.001, "validated": 0.001,
+            "observed_bytes": 280.0, "validated_bytes": 500.0
+        }])
+        assert table.splitlines()[1].split() == ["9", "40", "2.000", "1.000", "1.000", "280.0", "500.0"]
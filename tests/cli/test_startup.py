@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from importspy import __version__
+from importspy.cli import _simple_validation, main
+
+# Cumulative import time, in microseconds, allowed for `importspy.cli` when
+# answering `--version`. Importing the validation stack takes several hundred
+# milliseconds, so a regression that pulls it back in fails by a wide margin.
+STARTUP_BUDGET_US = 100_000
+
+HEAVY_MODULES = ("typer", "click", "pydantic", "ruamel.yaml", "importspy.s", "importspy.models")
+
+VERSION_CODE = "import sys; sys.argv = ['importspy', '--version']; from importspy.cli import main; main()"
+
+
+def import_times(code: str, env: dict = None) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup:
+
+    @pytest.fixture
+    def plugin(self, make_plugin):
+        return make_plugin("startupplugin.py")
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return make_contract("startupplugin.py", name="spymodel.yml")
+
+    def test_version_skips_heavy_imports(self):
+        times = import_times(VERSION_CODE)
+        assert not [name for name in HEAVY_MODULES if name in times]
+        assert {name for name in times if name.startswith("importspy")} == {"importspy", "importspy.cli"}
+
+    @pytest.mark.benchmark
+    def test_version_startup_budget(self):
+        assert import_times(VERSION_CODE)["importspy.cli"] < STARTUP_BUDGET_US
+
+    def test_import_package_is_lazy(self):
+        times = import_times("import importspy")
+        assert "pydantic" not in times
+        assert "importspy.s" not in times
+
+    def test_version_output(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "argv", ["importspy", "--version"])
+        main()
+        assert capsys.readouterr().out.strip() == f"ImportSpy v{__version__}"
+
+    def test_simple_validation(self):
+        assert _simple_validation(["plugin.py"]) == ("plugin.py", "spymodel.yml")
+        assert _simple_validation(["plugin.py", "-s", "c.yml"]) == ("plugin.py", "c.yml")
+        assert _simple_validation(["--spymodel=c.yml", "plugin.py"]) == ("plugin.py", "c.yml")
+        assert _simple_validation(["plugin.py", "-l", "DEBUG"]) is None
+        assert _simple_validation(["plugin.py", "other.py"]) is None
+        assert _simple_validation([]) is None
+
+    def test_falls_back_in_process(self, plugin, contract, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("IMPORTSPY_SOCKET", str(tmp_path / "missing.sock"))
+        monkeypatch.setattr(sys, "argv", ["importspy", plugin, "-s", contract])
+        with pytest.raises(SystemExit) as exit:
+            main()
+        assert exit.value.code == 0
+        assert "Module is compliant" in capsys.readouterr().out
+
+    def test_timings(self, plugin, contract, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "argv", ["importspy", plugin, "-s", contract, "--timings"])
+        with pytest.raises(SystemExit):
+            main()
+        out = capsys.readouterr().out
+        assert "Timings:" in out
+        assert "validate" in out
+
+    def test_trace(self, plugin, contract, tmp_path, monkeypatch):
+        output = tmp_path / "trace.json"
+        monkeypatch.setattr(sys, "argv", ["importspy", plugin, "-s", contract, "--trace", str(output)])
+        with pytest.raises(SystemExit):
+            main()
+        assert any(event["name"] == "validate" for event in json.loads(output.read_text())["traceEvents"])
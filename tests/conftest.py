@@ -1,4 +1,6 @@
+import importlib.util
 import pytest
+from types import ModuleType
 
 from importspy.violation_systems import Bundle
 
@@ -27,4 +29,55 @@ def functionbundle(modulebundle) -> Bundle:
 @pytest.fixture
 def methodbundle(classbundle) -> Bundle:
     classbundle[Errors.FUNCTIONS_DINAMIC_PAYLOAD[Errors.ENTITY_MESSAGES][Contexts.CLASS_CONTEXT]] = "test_method"
-    return classbundle
\ No newline at end of file
+    return classbundle
+
+ENGINE_PLUGIN = "engine = 'docker'\n"
+
+
+@pytest.fixture
+def engine_contract():
+    """
+    Render a contract for `filename` requiring `engine == <engine>`, followed by `extra` YAML.
+    """
+    def _render(filename: str, engine: str = "docker", extra: str = "") -> str:
+        return f"filename: {filename}\nvariables:\n  - name: engine\n    value: {engine}\n{extra}"
+    return _render
+
+
+@pytest.fixture
+def make_plugin(tmp_path):
+    """
+    Write a plugin module under `tmp_path` (in `directory` if given) and return its path.
+    """
+    def _plugin(filename: str, source: str = ENGINE_PLUGIN, directory: str = "") -> str:
+        path = tmp_path / directory / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+        return str(path)
+    return _plugin
+
+
+@pytest.fixture
+def make_contract(tmp_path, engine_contract):
+    """
+    Write an engine contract for `filename` under `tmp_path` and return its path.
+    """
+    def _contract(filename: str, engine: str = "docker", name: str = "", extra: str = "") -> str:
+        path = tmp_path / (name or f"{filename.rsplit('.', 1)[0]}-{engine}.yml")
+        path.write_text(engine_contract(filename, engine, extra))
+        return str(path)
+    return _contract
+
+
+@pytest.fixture
+def executed_plugin(make_plugin):
+    """
+    Write a plugin module and execute it outside `sys.modules`.
+    """
+    def _executed(filename: str, source: str = ENGINE_PLUGIN, directory: str = "") -> ModuleType:
+        path = make_plugin(filename, source, directory)
+        spec = importlib.util.spec_from_file_location(filename.rsplit(".", 1)[0], path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    return _executed
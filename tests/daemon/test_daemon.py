@@ -0,0 +1,202 @@
+import os
+import platform
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import pytest
+from importspy import daemon
+from importspy.daemon import (
+    DaemonClient,
+    SpyServer,
+    recv_frame,
+    send_frame
+)
+from importspy.utilities.runtime_util import RuntimeUtil
+from importspy.utilities.system_util import SystemUtil
+
+
+class TestDaemon:
+
+    @pytest.fixture
+    def socket_path(self, tmp_path):
+        return str(tmp_path / "importspy.sock")
+
+    @pytest.fixture
+    def server(self, socket_path):
+        server = SpyServer(socket_path)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    @pytest.fixture
+    def plugin(self, make_plugin):
+        return make_plugin("daemonplugin.py")
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return make_contract("daemonplugin.py", name="spymodel.yml")
+
+    def test_validate(self, server, socket_path, plugin, contract, make_contract):
+        client = DaemonClient(socket_path)
+        assert client.validate(plugin, contract).compliant
+        make_contract("daemonplugin.py", "podman", name="spymodel.yml")
+        verdict = client.validate(plugin, contract)
+        assert not verdict.compliant
+        assert "engine" in verdict.error
+        assert server.session.stats()["contracts"].misses == 2
+
+    def test_client_environment(self, server, socket_path, plugin, tmp_path, monkeypatch):
+        contract = tmp_path / "envmodel.yml"
+        contract.write_text(
+            "deployments:\n"
+            f"  - arch: {RuntimeUtil().extract_arch()}\n"
+            "    systems:\n"
+            f"      - os: {SystemUtil().extract_os()}\n"
+            "        environment:\n"
+            "          variables:\n"
+            "            - name: IMPORTSPY_DAEMON_TEST\n"
+            "              value: client\n"
+            "        pythons:\n"
+            f"          - interpreter: {platform.python_implementation()}\n"
+            "            modules: []\n"
+        )
+        monkeypatch.setenv("IMPORTSPY_DAEMON_TEST", "client")
+        assert DaemonClient(socket_path).validate(plugin, str(contract)).compliant
+        monkeypatch.setenv("IMPORTSPY_DAEMON_TEST", "other")
+        assert not DaemonClient(socket_path).validate(plugin, str(contract)).compliant
+
+    def test_many_requests_per_connection(self, server, socket_path, plugin, contract):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            for _ in range(3):
+                send_frame(sock, {
+                    "module": plugin,
+                    "contract": contract,
+                    "env": dict(os.environ),
+                    "python": [platform.python_version(), platform.python_implementation()],
+                })
+                assert recv_frame(sock)["compliant"]
+
+    def test_helper_reloaded_between_requests(self, server, socket_path, make_plugin, contract, tmp_path, monkeypatch):
+        helper = tmp_path / "lib" / "daemonhelper.py"
+        helper.parent.mkdir()
+        helper.write_text("ENGINE = 'docker'\n")
+        monkeypatch.syspath_prepend(str(helper.parent))
+        plugin = make_plugin("daemonplugin.py", "from daemonhelper import ENGINE as engine\n")
+        client = DaemonClient(socket_path)
+        assert client.validate(plugin, contract).compliant
+        helper.write_text("ENGINE = 'containerd'\n")
+        verdict = client.validate(plugin, contract)
+        assert not verdict.compliant
+        assert "engine" in verdict.error
+        assert "daemonhelper" not in sys.modules
+
+    def test_client_working_directory(self, server, socket_path, make_plugin, contract, tmp_path):
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        (workdir / "engine.txt").write_text("docker")
+        plugin = make_plugin("daemonplugin.py", "engine = open('engine.txt').read()\n")
+        cwd = os.getcwd()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            send_frame(sock, {
+                "module": plugin,
+                "contract": contract,
+                "env": {},
+                "python": [platform.python_version(), platform.python_implementation()],
+                "cwd": str(workdir),
+                "path": sys.path,
+            })
+            assert recv_frame(sock)["compliant"]
+        assert os.getcwd() == cwd
+
+    def test_mismatched_python_falls_back(self, server, socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            send_frame(sock, {"module": "x.py", "contract": "c.yml", "env": {}, "python": ["2.7.18", "CPython"]})
+            assert recv_frame(sock) == {"status": "mismatch"}
+
+    def test_errors_fall_back(self, server, socket_path, contract, tmp_path):
+        broken = tmp_path / "broken.py"
+        broken.write_text("raise ImportError('missing dependency')\n")
+        assert DaemonClient(socket_path).validate(str(broken), contract) is None
+
+    def test_no_daemon(self, socket_path, plugin, contract):
+        assert DaemonClient(socket_path).validate(plugin, contract) is None
+
+    def test_single_instance(self, server, socket_path):
+        with pytest.raises(RuntimeError):
+            SpyServer(socket_path)
+
+    def test_stale_socket_replaced(self, socket_path):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+        server = SpyServer(socket_path)
+        server.server_close()
+        assert not os.path.exists(socket_path)
+
+    def test_cli_forwards_to_daemon(self, server, socket_path, plugin, contract, monkeypatch, capsys):
+        from importspy.cli import main
+
+        monkeypatch.setenv("IMPORTSPY_SOCKET", socket_path)
+        monkeypatch.setattr(sys, "argv", ["importspy", plugin, "-s", contract])
+        main()
+        assert "Module is compliant" in capsys.readouterr().out
+        assert server.session.stats()["contracts"].misses == 1
+
+    def test_command_forwards_to_daemon(self, server, socket_path, plugin, make_contract, monkeypatch, capsys):
+        from importspy.commands import app
+
+        contract = make_contract("daemonplugin.py", "podman", name="spymodel.yml")
+        monkeypatch.setenv("IMPORTSPY_SOCKET", socket_path)
+        with pytest.raises(SystemExit) as exit:
+            app(args=[plugin, "-s", contract], prog_name="importspy")
+        assert exit.value.code == 0
+        out = capsys.readouterr().out
+        assert out.count("Module is NOT compliant") == 1
+        assert "Module is compliant" not in out
+        assert server.session.stats()["contracts"].misses == 1
+
+    def test_socket_mode(self, server, socket_path):
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+    def test_only_referenced_environment_sent(self, server, socket_path, plugin, contract, monkeypatch):
+        requests = []
+        handle = server.handle_request_message
+        monkeypatch.setattr(server, "handle_request_message", lambda request: requests.append(request) or handle(request))
+        monkeypatch.setenv("IMPORTSPY_DAEMON_SECRET", "hunter2")
+        assert DaemonClient(socket_path).validate(plugin, contract).compliant
+        assert "env" not in requests[0]
+        assert requests[1]["env"] == {}
+
+    def test_foreign_peer_refused(self, server, socket_path, plugin, contract, monkeypatch):
+        monkeypatch.setattr(daemon, "_peer_uid", lambda sock: os.getuid() + 1)
+        assert DaemonClient(socket_path).validate(plugin, contract) is None
+        assert server.session.stats()["contracts"].misses == 0
+
+    def test_default_socket_directory(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("IMPORTSPY_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        directory = os.path.dirname(daemon.default_socket_path())
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+        os.chmod(directory, 0o777)
+        with pytest.raises(PermissionError):
+            daemon.default_socket_path()
+        assert DaemonClient().socket_path is None
+
+    def test_client_creates_no_directory(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("IMPORTSPY_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        assert DaemonClient().socket_path is None
+        assert os.listdir(tmp_path) == []
+        server = SpyServer()
+        server.server_close()
+        assert DaemonClient().socket_path == server.socket_path
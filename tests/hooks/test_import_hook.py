@@ -0,0 +1,77 @@
+import importlib
+import sys
+import pytest
+from importspy import hooks
+from importspy.session import SpySession
+from importspy.verdicts import VerdictCache
+
+
+class TestImportHook:
+
+    @pytest.fixture
+    def plugin_dir(self, tmp_path, monkeypatch, make_plugin, make_contract):
+        make_plugin(
+            "hookplugin.py",
+            "engine = 'docker'\n"
+            "\n"
+            "class Extension:\n"
+            "    def run(self, msg: str) -> str:\n"
+            "        return msg\n"
+        )
+        make_contract(
+            "hookplugin.py",
+            name="compliant.yml",
+            extra="classes:\n"
+                  "  - name: Extension\n"
+                  "    methods:\n"
+                  "      - name: run\n"
+                  "        arguments:\n"
+                  "          - name: self\n"
+                  "          - name: msg\n"
+                  "            annotation: str\n"
+        )
+        make_contract("hookplugin.py", "podman", name="violated.yml")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        yield tmp_path
+        sys.modules.pop("hookplugin", None)
+
+    @pytest.fixture
+    def install(self, plugin_dir):
+        finders = []
+
+        def _install(contract):
+            finder = hooks.install(
+                {"hookplugin": str(plugin_dir / contract)},
+                cache=VerdictCache(str(plugin_dir / "verdicts"))
+            )
+            finders.append(finder)
+            return finder
+
+        yield _install
+        for finder in finders:
+            hooks.uninstall(finder)
+
+    def test_compliant_import(self, install):
+        install("compliant.yml")
+        module = importlib.import_module("hookplugin")
+        assert module.Extension().run("ok") == "ok"
+
+    def test_violated_import(self, install):
+        install("violated.yml")
+        with pytest.raises(ValueError, match="engine"):
+            importlib.import_module("hookplugin")
+        assert "hookplugin" not in sys.modules
+
+    def test_unrouted_import(self, install):
+        finder = install("violated.yml")
+        assert finder.route("json") is None
+        assert finder.route("importspy.models") is None
+
+    def test_cached_verdict(self, install, monkeypatch):
+        finder = install("compliant.yml")
+        importlib.import_module("hookplugin")
+        hooks.uninstall(finder)
+        del sys.modules["hookplugin"]
+        monkeypatch.setattr(SpySession, "validate", lambda *args, **kwargs: pytest.fail("verdict was not reused"))
+        install("compliant.yml")
+        assert importlib.import_module("hookplugin").engine == "docker"
@@ -0,0 +1,121 @@
+import stat
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from importspy import metrics
+from importspy.metrics import Counter, Histogram, Registry
+from importspy.session import SpySession
+from importspy.utilities.module_util import ModuleUtil
+from importspy.verdicts import VerdictCache
+
+PLUGIN_SOURCE = """
+engine = 'docker'
+
+class Plugin:
+    name = 'plugin'
+
+    def run(self):
+        pass
+"""
+
+
+class TestRegistry:
+
+    @pytest.fixture
+    def registry(self):
+        return Registry()
+
+    def test_counter(self, registry):
+        counter = registry.register(Counter("test_total", "Test counter.", ("kind",)))
+        counter.inc(kind="a")
+        counter.inc(2, kind='b"c')
+        assert counter.value(kind="a") == 1
+        assert registry.render() == (
+            "# HELP test_total Test counter.\n"
+            "# TYPE test_total counter\n"
+            'test_total{kind="a"} 1\n'
+            'test_total{kind="b\\"c"} 2\n'
+        )
+
+    def test_labels_checked(self, registry):
+        counter = registry.register(Counter("test_total", "Test counter.", ("kind",)))
+        with pytest.raises(ValueError):
+            counter.inc(other="a")
+        with pytest.raises(ValueError):
+            registry.register(Counter("test_total", "Duplicate."))
+
+    def test_histogram(self, registry):
+        histogram = registry.register(Histogram("test_seconds", "Test histogram.", buckets=(0.1, 1.0)))
+        for value in (0.05, 0.5, 2.0):
+            histogram.observe(value)
+        lines = registry.render().splitlines()
+        assert lines[2:] == [
+            'test_seconds_bucket{le="0.1"} 1',
+            'test_seconds_bucket{le="1"} 2',
+            'test_seconds_bucket{le="+Inf"} 3',
+            "test_seconds_sum 2.55",
+            "test_seconds_count 3",
+        ]
+
+    def test_write_textfile(self, registry, tmp_path):
+        registry.register(Counter("test_total", "Test counter.")).inc()
+        path = tmp_path / "importspy.prom"
+        registry.write_textfile(str(path))
+        assert path.read_text().endswith("test_total 1\n")
+        assert [p.name for p in tmp_path.iterdir()] == ["importspy.prom"]
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_concurrent_writers(self, registry, tmp_path):
+        counter = registry.register(Counter("test_total", "Test counter."))
+        path = tmp_path / "importspy.prom"
+
+        def write(_):
+            counter.inc()
+            registry.write_textfile(str(path))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(write, range(64)))
+        assert path.read_text().startswith("# HELP test_total")
+        assert [p.name for p in tmp_path.iterdir()] == ["importspy.prom"]
+
+
+class TestSessionMetrics:
+
+    @pytest.fixture(autouse=True)
+    def clear(self):
+        metrics.REGISTRY.clear()
+        yield
+        metrics.REGISTRY.clear()
+
+    @pytest.fixture
+    def plugin(self, make_plugin):
+        return make_plugin("meteredplugin.py", PLUGIN_SOURCE)
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return lambda engine: make_contract("meteredplugin.py", engine)
+
+    def test_validations(self, plugin, contract):
+        session = SpySession()
+        module = ModuleUtil().import_from_path(plugin)
+        session.importspy(contract("docker"), module)
+        with pytest.raises(ValueError):
+            session.importspy(contract("podman"), module)
+        assert metrics.VALIDATIONS.value(outcome="compliant") == 1
+        assert metrics.VALIDATIONS.value(outcome="violation") == 1
+        assert metrics.VIOLATIONS.value(context="module") == 1
+        assert metrics.CACHE_REQUESTS.value(cache="contracts", result="miss") == 2
+        assert metrics.CACHE_REQUESTS.value(cache="structures", result="hit") == 0
+        assert metrics.PHASE_SECONDS.count(phase="load") == 2
+        assert metrics.PHASE_SECONDS.count(phase="extract") == 2
+        assert metrics.MEMBERS_INSPECTED.value(kind="class") == 2
+        assert metrics.MEMBERS_INSPECTED.value(kind="method") == 2
+
+    def test_verdict_cache(self, plugin, contract):
+        session = SpySession(verdicts=VerdictCache())
+        contract = contract("docker")
+        for _ in range(3):
+            session.importspy(contract, ModuleUtil().import_from_path(plugin), reload=False)
+        assert metrics.CACHE_REQUESTS.value(cache="verdicts", result="miss") == 1
+        assert metrics.CACHE_REQUESTS.value(cache="verdicts", result="hit") == 2
+        assert metrics.VALIDATIONS.value(outcome="compliant") == 3
+        assert "importspy_validations_total" in metrics.render()
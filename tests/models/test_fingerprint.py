@@ -0,0 +1,75 @@
+import pytest
+from importspy.models import (
+    Argument,
+    Class,
+    Function,
+    Module,
+    Runtime,
+    SpyModel,
+    Variable
+)
+
+
+class TestFingerprint:
+
+    @pytest.fixture
+    def functions(self):
+        return [
+            Function(name="start", arguments=[Argument(name="self"), Argument(name="port", annotation="int")]),
+            Function(name="stop", arguments=[Argument(name="self")], return_annotation="bool"),
+        ]
+
+    @pytest.fixture
+    def module(self, functions):
+        return Module(
+            filename="plugin.py",
+            variables=[Variable(name="engine", value="docker"), Variable(name="retries", value=3)],
+            functions=functions,
+            classes=[Class(name="Plugin", methods=functions)]
+        )
+
+    def test_order_independent(self, module, functions):
+        reordered = Module(
+            filename="plugin.py",
+            variables=list(reversed(module.variables)),
+            functions=list(reversed(functions)),
+            classes=[Class(name="Plugin", methods=list(reversed(functions)))]
+        )
+        assert reordered.fingerprint == module.fingerprint
+
+    def test_change_propagates_bottom_up(self, module, functions):
+        changed_method = Function(name="stop", arguments=[Argument(name="self"), Argument(name="force")])
+        changed = module.model_copy(update={"classes": [Class(name="Plugin", methods=[functions[0], changed_method])]})
+        assert changed.classes[0].methods[0].fingerprint == functions[0].fingerprint
+        assert changed.classes[0].fingerprint != module.classes[0].fingerprint
+        assert changed.fingerprint != module.fingerprint
+
+    def test_value_types_distinguished(self):
+        assert Variable(name="x", value=1).fingerprint != Variable(name="x", value="1").fingerprint
+        assert Variable(name="x").fingerprint != Argument(name="x").fingerprint
+
+    def test_contract_fingerprint(self, module):
+        contract = SpyModel(**module.model_dump(), deployments=[Runtime.from_host()])
+        same = SpyModel(**module.model_dump(), deployments=[Runtime.from_host()])
+        assert contract.fingerprint == same.fingerprint
+        assert contract.fingerprint != SpyModel(**module.model_dump()).fingerprint
+        assert contract.fingerprint != module.fingerprint
+
+    def test_positional_order_kept(self):
+        def deployment(version):
+            return {"arch": "x86_64", "systems": [{"os": "linux", "pythons": [{"version": version, "modules": []}]}]}
+
+        first = SpyModel(filename="plugin.py", deployments=[deployment("3.11"), deployment("3.12")])
+        second = SpyModel(filename="plugin.py", deployments=[deployment("3.12"), deployment("3.11")])
+        assert first.fingerprint != second.fingerprint
+
+    def test_assignment_discards_fingerprint(self, module):
+        fingerprint, layout = module.fingerprint, module.layout
+        module.filename = "other.py"
+        assert module.fingerprint != fingerprint
+        assert module.layout != layout
+
+    def test_layout_follows_declaration_order(self, module, functions):
+        reordered = module.model_copy(update={"functions": list(reversed(functions))})
+        assert reordered.fingerprint == module.fingerprint
+        assert reordered.layout != module.layout
@@ -0,0 +1,69 @@
+import gc
+import pytest
+from pydantic import ValidationError
+from importspy.models import Argument, Module, Runtime, Variable, _flyweights
+from importspy.utilities.module_util import ArgumentInfo, ModuleUtil, ValueInfo, VariableInfo
+
+
+class TestFlyweights:
+
+    def test_arguments_shared(self, tmp_path):
+        path = tmp_path / "sharedplugin.py"
+        path.write_text(
+            "class Job:\n"
+            "    def start(self, name: str): pass\n"
+            "    def stop(self, name: str): pass\n"
+        )
+        module = Module.from_module(ModuleUtil().import_from_path(str(path)))
+        start, stop = module.classes[0].methods
+        assert all(first is second for first, second in zip(start.arguments, stop.arguments))
+
+    def test_values_kept_apart(self):
+        variables = Variable.from_variable_info([
+            VariableInfo("flag", None, 1),
+            VariableInfo("flag", None, True),
+            VariableInfo("flag", None, 1.0),
+            VariableInfo("flag", None, 1)
+        ])
+        assert [type(variable.value) for variable in variables] == [int, bool, float, int]
+        assert variables[0] is variables[3]
+        assert variables[0] is not variables[1]
+
+    def test_digests_not_shared(self):
+        digest = ValueInfo("dict", 2, "0" * 32)
+        first, second = Argument.from_arguments_info([ArgumentInfo("table", None, digest)] * 2)
+        assert first == second
+        assert first is not second
+
+    def test_entries_released(self):
+        argument = Argument.from_arguments_info([ArgumentInfo("released_argument", "int", None)])[0]
+        gc.collect()
+        entries = len(_flyweights)
+        del argument
+        gc.collect()
+        assert len(_flyweights) == entries - 1
+
+    def test_host_shared(self, monkeypatch):
+        runtime = Runtime.from_host()
+        assert Runtime.from_host() is runtime
+        attached = Runtime.from_host([Module(filename="plugin.py")])
+        assert attached.systems[0].environment is runtime.systems[0].environment
+        monkeypatch.setenv("IMPORTSPY_FLYWEIGHT_TEST", "1")
+        assert Runtime.from_host() is not runtime
+
+    def test_shared_models_frozen(self):
+        argument = Argument.from_arguments_info([ArgumentInfo("frozen_argument", "int", 1)])[0]
+        with pytest.raises(ValidationError):
+            argument.value = 2
+        copied = argument.model_copy()
+        copied.value = 2
+        assert argument.value == 1
+        assert Argument.from_arguments_info([ArgumentInfo("frozen_argument", "int", 1)])[0].value == 1
+
+    def test_host_frozen(self):
+        runtime = Runtime.from_host()
+        with pytest.raises(ValidationError):
+            runtime.systems[0].os = "windows"
+        copied = runtime.model_copy(deep=True)
+        copied.systems[0].os = "windows"
+        assert Runtime.from_host().systems[0].os == runtime.systems[0].os != "windows"
@@ -0,0 +1,78 @@
+import warnings
+import pytest
+from pydantic import ValidationError
+from importspy.constants import Constants
+from importspy.models import Argument, Attribute, Module, SpyModel
+from importspy.utilities.module_util import ArgumentInfo, AttributeInfo, ModuleUtil
+
+
+class TestObservedModels:
+
+    @pytest.fixture
+    def plugin(self, tmp_path):
+        path = tmp_path / "observedplugin.py"
+        path.write_text(
+            "engine = 'docker'\n"
+            "ROUTES = {'start': 1}\n\n"
+            "def run(job: str, retries: int = 3) -> bool:\n"
+            "    return True\n\n"
+            "class Base:\n"
+            "    kind: str = 'base'\n\n"
+            "class Job(Base):\n"
+            "    def __init__(self):\n"
+            "        self.enabled = True\n\n"
+            "    def start(self, delay: float) -> None:\n"
+            "        pass\n"
+        )
+        return ModuleUtil().import_from_path(str(path))
+
+    def test_same_as_validated(self, plugin):
+        module = Module.from_module(plugin)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            data = module.model_dump()
+        validated = Module.model_validate(data)
+        assert validated == module
+        assert validated.fingerprint == module.fingerprint
+
+    def test_enums_converted(self, plugin):
+        function = Module.from_module(plugin).functions[0]
+        assert function.return_annotation is Constants.SupportedAnnotations.BOOL
+        assert function.arguments[0].annotation is Constants.SupportedAnnotations.STR
+
+    def test_model_copy(self, plugin):
+        for model in (Module.from_module(plugin), SpyModel.from_module(plugin, reload=False)):
+            copied = model.model_copy(update={"version": "2.0"})
+            assert copied.version == "2.0"
+            assert "version" in copied.model_fields_set
+            assert model.version != "2.0"
+            assert copied.fingerprint != model.fingerprint
+            assert type(model).model_validate(copied.model_dump()).fingerprint == copied.fingerprint
+            assert copied.model_copy(update={"version": model.version}).fingerprint == model.fingerprint
+
+    def test_fields_set_per_instance(self):
+        first, second = Argument.from_arguments_info([
+            ArgumentInfo("job", "str", None),
+            ArgumentInfo("retries", "int", 3)
+        ])
+        assert first.model_fields_set is not second.model_fields_set
+        assert first.model_fields_set <= set(Argument.model_fields)
+
+    def test_unsupported_value_validated(self):
+        with pytest.raises(ValidationError):
+            Attribute.from_attributes_info([AttributeInfo("static", "callback", "builtin_function_or_method", None)])
+
+    def test_spymodel(self, plugin):
+        spymodel = SpyModel.from_module(plugin, reload=False)
+        assert spymodel.filename == "observedplugin.py"
+        assert spymodel.variables is None
+        assert SpyModel.model_validate(spymodel.model_dump()).fingerprint == spymodel.fingerprint
+
+    def test_version_validated(self, tmp_path):
+        path = tmp_path / "versionedplugin.py"
+        path.write_text("__version__ = '1.0'\n")
+        module = Module.from_module(ModuleUtil().import_from_path(str(path)))
+        assert Module.model_validate(module.model_dump()) == module
+        path.write_text("__version__ = (1, 0)\n")
+        with pytest.raises(ValidationError):
+            Module.from_module(ModuleUtil().import_from_path(str(path)))
@@ -0,0 +1,55 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from importspy.s import Spy
+
+
+class TestAsyncValidation:
+
+    @pytest.fixture
+    def plugin_path(self, make_plugin):
+        return lambda name, *source: make_plugin(f"{name}.py", *source)
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return make_contract
+
+    def test_aimportspy(self, plugin_path, contract):
+        module = asyncio.run(Spy().aimportspy(contract("asyncplugin.py"), info_module=plugin_path("asyncplugin")))
+        assert module.engine == "docker"
+
+    def test_aimportspy_keyword_only(self, plugin_path, contract):
+        with pytest.raises(TypeError):
+            asyncio.run(Spy().aimportspy(contract("asyncplugin.py"), plugin_path("asyncplugin")))
+
+    def test_aimportspy_violation(self, plugin_path, contract):
+        with pytest.raises(ValueError, match="engine"):
+            asyncio.run(Spy().aimportspy(contract("asyncplugin.py", "podman"), info_module=plugin_path("asyncplugin")))
+
+    def test_aimportspy_timeout(self, plugin_path, contract):
+        slow = plugin_path("slowplugin", "import time\ntime.sleep(0.5)\nengine = 'docker'\n")
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(Spy().aimportspy(contract("slowplugin.py"), info_module=slow, timeout=0.05))
+
+    def test_aimportspy_process_executor(self, plugin_path, contract):
+        async def _run():
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                return await Spy().aimportspy(
+                    contract("procplugin.py"), info_module=plugin_path("procplugin"), executor=executor
+                )
+        assert asyncio.run(_run()).engine == "docker"
+
+    def test_avalidate_many(self, plugin_path, contract):
+        pairs = [
+            (plugin_path(f"batchplugin{index}"), contract(f"batchplugin{index}.py", "docker" if index % 2 else "podman"))
+            for index in range(6)
+        ]
+
+        async def _run():
+            with ThreadPoolExecutor(4) as executor:
+                return await Spy().avalidate_many(pairs, executor=executor, concurrency=3)
+
+        results = asyncio.run(_run())
+        assert [isinstance(result, ValueError) for result in results] == [True, False] * 3
+        assert results[1].engine == "docker"
@@ -0,0 +1,136 @@
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from importspy.log_manager import LogManager
+from importspy.s import Spy
+from importspy.utilities.module_util import SYNTHETIC_SEPARATOR, ModuleUtil
+
+
+def run_all(function, count: int) -> list:
+    """
+    Run `function(index)` for every index on 32 threads, starting at once,
+    and return the results after checking that no call raised.
+    """
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        futures = [executor.submit(function, index) for index in range(count)]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    assert errors == []
+    return [future.result() for future in futures]
+
+
+def plugin_modules() -> set:
+    return {name for name in sys.modules if SYNTHETIC_SEPARATOR in name or name.split(".")[0] in ("extension", "sub", "__init__")}
+
+
+class TestConcurrentValidation:
+
+    plugins = 20
+    validations = 300
+
+    @pytest.fixture(autouse=True)
+    def unconfigured_logging(self, monkeypatch):
+        """
+        Start from unconfigured logging, so that the first validations, which
+        configure it, run concurrently.
+        """
+        root = logging.getLogger()
+        handlers, level = list(root.handlers), root.level
+        monkeypatch.setattr(LogManager, "_configured", False)
+        yield
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    @pytest.fixture
+    def layout(self, tmp_path):
+        pairs = []
+        for index in range(self.plugins):
+            plugin_dir = tmp_path / f"plugin{index}"
+            plugin_dir.mkdir()
+            (plugin_dir / "extension.py").write_text(
+                f"engine = 'engine{index}'\n"
+                "\n"
+                "class Base:\n"
+                "    def run(self):\n"
+                "        pass\n"
+                "\n"
+                "class Extension(Base):\n"
+                "    pass\n"
+            )
+            (plugin_dir / "spymodel.yml").write_text(
+                "filename: extension.py\n"
+                "variables:\n"
+                "  - name: engine\n"
+                f"    value: engine{index}\n"
+                "classes:\n"
+                "  - name: Extension\n"
+                "    superclasses:\n"
+                "      - name: Base\n"
+            )
+            pairs.append((str(plugin_dir / "extension.py"), str(plugin_dir / "spymodel.yml")))
+        return pairs
+
+    def test_same_stem_plugins_in_threads(self, layout):
+        spy = Spy()
+        modules_before = plugin_modules()
+
+        def _validate(index):
+            modulepath, contract = layout[index % self.plugins]
+            info_module = ModuleUtil().import_from_path(modulepath)
+            validated = spy.importspy(filepath=contract, info_module=info_module)
+            return index, validated.engine
+
+        results = run_all(_validate, self.validations)
+        assert all(engine == f"engine{index % self.plugins}" for index, engine in results)
+        assert plugin_modules() == modules_before
+
+    def test_cross_contract_violations_in_threads(self, layout):
+        spy = Spy()
+
+        def _validate(index):
+            modulepath, _ = layout[index % self.plugins]
+            _, contract = layout[(index + 1) % self.plugins]
+            try:
+                spy.importspy(filepath=contract, info_module=ModuleUtil().import_from_path(modulepath))
+            except ValueError:
+                return True
+            return False
+
+        assert all(run_all(_validate, self.validations))
+
+    @pytest.fixture
+    def packages(self, tmp_path, make_plugin, make_contract):
+        pairs = []
+        for index in range(self.plugins):
+            make_plugin("sub.py", f"engine = 'engine{index}'\n", f"package{index}/extension")
+            init = make_plugin("__init__.py", "from . import sub\nengine = sub.engine\n", f"package{index}/extension")
+            contract = make_contract("__init__.py", f"engine{index}", name=f"package{index}/spymodel.yml")
+            pairs.append((init, contract))
+        return pairs
+
+    def test_package_plugins_in_threads(self, packages):
+        spy = Spy()
+        modules_before = plugin_modules()
+
+        def _validate(index):
+            modulepath, contract = packages[index % self.plugins]
+            validated = spy.importspy(filepath=contract, info_module=ModuleUtil().import_from_path(modulepath))
+            return index, validated.engine
+
+        results = run_all(_validate, self.validations)
+        assert all(engine == f"engine{index % self.plugins}" for index, engine in results)
+        assert plugin_modules() == modules_before
+
+    def test_logging_configured_once(self, monkeypatch):
+        apply = LogManager._apply
+        calls = []
+
+        def slow_apply(self, level=None, handlers=None):
+            calls.append(level)
+            time.sleep(0.01)
+            apply(self, level, handlers)
+
+        monkeypatch.setattr(LogManager, "_apply", slow_apply)
+        run_all(lambda _: Spy()._configure_logging(), 8)
+        assert len(calls) == 1
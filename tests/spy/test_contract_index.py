@@ -0,0 +1,89 @@
+import os
+import pathlib
+import pytest
+from importspy.contract_index import ContractIndex, contract_clauses
+from importspy.models import SpyModel
+from importspy.session import SpySession
+from importspy.utilities.module_util import ModuleUtil
+
+FUNCTIONS = "functions:\n  - name: start\n"
+
+
+class TestContractIndex:
+
+    @pytest.fixture
+    def plugins(self, executed_plugin):
+        return [
+            executed_plugin("indexedplugin.py", "engine = 'docker'\ndef start(): pass\ndef stop(): pass\n", "a"),
+            executed_plugin("indexedplugin.py", "engine = 'docker'\ndef start(): pass\n", "b")
+        ]
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return pathlib.Path(make_contract("indexedplugin.py", name="spymodel.yml", extra=FUNCTIONS))
+
+    @pytest.fixture
+    def rewrite(self, contract, engine_contract):
+        def _rewrite(engine="docker", extra=""):
+            contract.write_text(engine_contract("indexedplugin.py", engine, FUNCTIONS + extra))
+        return _rewrite
+
+    @pytest.fixture
+    def session(self, tmp_path, plugins, contract):
+        session = SpySession(index=ContractIndex(str(tmp_path / "index")))
+        for plugin in plugins:
+            session.importspy(str(contract), plugin, reload=False)
+        yield session
+        session.close()
+
+    @pytest.fixture
+    def no_import(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("modules must not be imported")
+        monkeypatch.setattr(ModuleUtil, "load_module", fail)
+        monkeypatch.setattr(ModuleUtil, "import_from_path", fail)
+
+    def test_reverse_index(self, session, plugins, contract):
+        expected = {os.path.abspath(plugin.__file__) for plugin in plugins}
+        assert session.index.modules_for(str(contract), "variable:engine") == expected
+        assert session.index.modules_for(str(contract), "function:stop") == set()
+
+    def test_unchanged_contract(self, session, contract, no_import):
+        assert session.index.revalidate(str(contract), session) == []
+
+    def test_added_clause(self, session, plugins, contract, rewrite, no_import):
+        rewrite(extra="  - name: stop\n")
+        results = {result.module: result for result in session.index.revalidate(str(contract), session)}
+        assert results[os.path.abspath(plugins[0].__file__)].compliant
+        assert not results[os.path.abspath(plugins[1].__file__)].compliant
+        assert session.index.revalidate(str(contract), session) == []
+
+    def test_changed_variable(self, session, contract, rewrite, no_import):
+        rewrite("podman")
+        results = session.index.revalidate(str(contract), session)
+        assert len(results) == 2
+        assert all("engine" in result.violations[0] for result in results)
+
+    def test_persisted(self, session, plugins, contract, rewrite, tmp_path, no_import):
+        rewrite(extra="  - name: stop\n")
+        index = ContractIndex(str(tmp_path / "index"))
+        assert len(index.affected(str(contract), session.load_contract(str(contract)))) == 2
+
+    def test_record_rewrites_one_module(self, session, plugins, contract, tmp_path):
+        files = list((tmp_path / "index").rglob("*.json"))
+        assert len(files) == 2
+        os.utime(files[0], ns=(0, 0))
+        os.utime(files[1], ns=(0, 0))
+        session.importspy(str(contract), plugins[0], reload=False)
+        assert sorted(path.stat().st_mtime_ns != 0 for path in files) == [False, True]
+
+    def test_clauses_kept_apart(self):
+        spymodel = SpyModel(filename="plugin.py", deployments=[
+            {"arch": "x86_64", "systems": [{"os": "linux", "pythons": [{"version": "3.11", "modules": []}],
+                                            "environment": {"variables": [{"name": "MODE", "value": "prod"}]}}]},
+            {"arch": "x86_64", "systems": [{"os": "linux", "pythons": [{"version": "3.12", "modules": []}],
+                                            "environment": {"variables": [{"name": "MODE", "value": "dev"}]}}]},
+        ])
+        clauses = contract_clauses(spymodel)
+        assert len([clause for clause in clauses if clause.startswith("deployment:")]) == 2
+        assert len([clause for clause in clauses if clause.startswith("env:")]) == 2
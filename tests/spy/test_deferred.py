@@ -0,0 +1,44 @@
+import threading
+import pytest
+from importspy.s import Spy
+from importspy.deferred import DeferredModule, future_of
+
+
+class TestDeferredValidation:
+
+    @pytest.fixture
+    def plugin(self, executed_plugin):
+        return executed_plugin("deferredplugin.py")
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return lambda engine: make_contract("deferredplugin.py", engine)
+
+    def test_deferred_compliant(self, plugin, contract):
+        module = Spy().importspy(filepath=contract("docker"), info_module=plugin, deferred=True)
+        assert isinstance(module, DeferredModule)
+        assert module.engine == "docker"
+        assert future_of(module).result().__file__ == plugin.__file__
+
+    def test_deferred_violation_on_access(self, plugin, contract):
+        failures = []
+        notified = threading.Event()
+
+        def on_failure(error):
+            failures.append(error)
+            notified.set()
+
+        module = Spy().importspy(
+            filepath=contract("podman"),
+            info_module=plugin,
+            deferred=True,
+            on_failure=on_failure
+        )
+        with pytest.raises(ValueError, match="engine"):
+            module.engine
+        assert notified.wait(5)
+        assert isinstance(failures[0], ValueError)
+
+    def test_blocking_is_default(self, plugin, contract):
+        with pytest.raises(ValueError, match="engine"):
+            Spy().importspy(filepath=contract("podman"), info_module=plugin)
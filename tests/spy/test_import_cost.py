@@ -0,0 +1,77 @@
+import subprocess
+import sys
+import pytest
+
+# Import time allowed for ImportSpy's own modules behind `from importspy import Spy`,
+# relative to the cost of importing pydantic in the same process. ImportSpy's
+# share is about 60% of pydantic's; building every model schema eagerly, or
+# importing ruamel and asyncio up front, brings it to 100% or more.
+# The best of a few runs is kept, as load on the machine skews single runs;
+# the default run checks what gets imported instead (see `benchmark` in pytest.ini).
+IMPORT_BUDGET_RATIO = 0.8
+IMPORT_RUNS = 3
+
+
+def import_times(code: str) -> list:
+    """
+    Run `code` under `-X importtime` and return (name, cumulative
+    microseconds, nesting depth) for every import, in order.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            times.append((name.strip(), int(cumulative), (len(name) - len(name.lstrip()) - 1) // 2))
+    return times
+
+
+def import_ratio() -> float:
+    """
+    Return the import time of `importspy.s` over that of pydantic, imported
+    first in the same process.
+    """
+    times = import_times("from pydantic import BaseModel, ConfigDict\nimport importspy.s")
+    split = next(position for position, (name, _, depth) in enumerate(times) if name == "importspy.s" and depth == 0)
+    pydantic = sum(cumulative for _, cumulative, depth in times[:split] if depth == 0)
+    return times[split][1] / pydantic
+
+
+def imported(code: str) -> dict:
+    return {name: cumulative for name, cumulative, _ in import_times(code)}
+
+
+class TestImportCost:
+
+    def test_package_import_is_light(self):
+        times = imported("import importspy")
+        assert set(times) & {"pydantic", "ruamel.yaml", "importspy.s"} == set()
+
+    def test_spy_import_skips_heavy_modules(self):
+        times = imported("from importspy import Spy")
+        assert set(times) & {"ruamel.yaml", "asyncio", "concurrent.futures", "importspy.backends"} == set()
+
+    @pytest.mark.benchmark
+    def test_spy_import_budget(self):
+        assert min(import_ratio() for _ in range(IMPORT_RUNS)) < IMPORT_BUDGET_RATIO
+
+    def test_schemas_built_on_first_use(self):
+        code = (
+            "from importspy import Spy\n"
+            "from importspy.models import Module, SpyModel\n"
+            "assert not SpyModel.__pydantic_complete__\n"
+            "SpyModel.model_validate({'filename': 'plugin.py'})\n"
+            "assert SpyModel.__pydantic_complete__\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.parametrize("name", ["Spy", "SpySession", "batch", "session"])
+    def test_lazy_attributes(self, name):
+        import importspy
+        assert name in dir(importspy)
+        assert getattr(importspy, name) is not None
@@ -0,0 +1,100 @@
+import importlib.util
+import pytest
+from importspy.incremental import IncrementalStore
+from importspy.session import SpySession
+
+PLUGIN_SOURCE = """
+def helper(value):
+    return value
+
+
+class Plugin:
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+"""
+
+CONTRACT_SOURCE = """
+filename: incrementalplugin.py
+functions:
+  - name: helper
+    arguments:
+      - name: value
+classes:
+  - name: Plugin
+    methods:
+      - name: start
+        arguments:
+          - name: self
+      - name: stop
+        arguments:
+          - name: self
+"""
+
+
+class TestIncrementalValidation:
+
+    @pytest.fixture
+    def plugin_path(self, tmp_path):
+        path = tmp_path / "incrementalplugin.py"
+        path.write_text(PLUGIN_SOURCE)
+        return path
+
+    @pytest.fixture
+    def plugin(self, plugin_path):
+        spec = importlib.util.spec_from_file_location("incrementalplugin", str(plugin_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    @pytest.fixture
+    def contract(self, tmp_path):
+        path = tmp_path / "spymodel.yml"
+        path.write_text(CONTRACT_SOURCE)
+        return path
+
+    def test_unchanged_entities_skipped(self, plugin, contract):
+        with SpySession() as session:
+            first = session.validate_incremental(str(contract), plugin)
+            second = session.validate_incremental(str(contract), plugin)
+        assert first.compliant and second.compliant
+        assert sorted(first.checked) == ["class Plugin", "function helper"]
+        assert second.checked == []
+        assert sorted(second.skipped) == ["class Plugin", "function helper"]
+
+    def test_changed_method_rechecks_its_class(self, plugin, plugin_path, contract):
+        with SpySession() as session:
+            session.validate_incremental(str(contract), plugin)
+            plugin_path.write_text(PLUGIN_SOURCE.replace("def stop(self):", "def halt(self):"))
+            report = session.validate_incremental(str(contract), plugin)
+        assert report.checked == ["class Plugin"]
+        assert report.skipped == ["function helper"]
+        assert not report.compliant
+        assert len(report.violations) == 1
+
+    def test_contract_edit_rechecks_clause(self, plugin, contract):
+        with SpySession() as session:
+            session.validate_incremental(str(contract), plugin)
+            contract.write_text(CONTRACT_SOURCE.replace("- name: helper", "- name: helper2"))
+            report = session.validate_incremental(str(contract), plugin)
+        assert report.checked == ["function helper2"]
+        assert report.skipped == ["class Plugin"]
+        assert not report.compliant
+
+    def test_module_level_violation(self, plugin, contract):
+        contract.write_text(CONTRACT_SOURCE + "variables:\n  - name: engine\n")
+        with SpySession() as session:
+            report = session.validate_incremental(str(contract), plugin)
+        assert not report.compliant
+        assert report.checked == report.skipped == []
+
+    def test_persisted_outcomes(self, plugin, contract, tmp_path):
+        directory = str(tmp_path / "incremental")
+        with SpySession(incremental=IncrementalStore(directory)) as session:
+            session.validate_incremental(str(contract), plugin)
+        with SpySession(incremental=IncrementalStore(directory)) as session:
+            report = session.validate_incremental(str(contract), plugin)
+        assert report.checked == []
+        assert report.compliant
@@ -0,0 +1,106 @@
+import gc
+import logging
+import sys
+import pytest
+from importspy.log_manager import LogManager
+from importspy.persistences import YamlParser
+from importspy.s import Spy
+from importspy.session import SpySession
+from importspy.utilities.module_util import ModuleUtil
+
+VALIDATIONS = 10_000
+WARMUP = 1_000
+# Blocks the process may gain over the measured validations: caches reaching
+# their steady size, resized dictionaries. A leak of even one object per
+# validation exceeds it several times over.
+MAX_BLOCK_GROWTH = 2_000
+
+
+class TestMemory:
+
+    @pytest.fixture
+    def plugin(self, make_plugin):
+        return ModuleUtil().import_from_path(make_plugin(
+            "leakplugin.py",
+            "engine = 'docker'\n\n"
+            "class Extension:\n"
+            "    name = 'extension'\n\n"
+            "    def __init__(self):\n"
+            "        self.enabled = True\n\n"
+            "    def run(self, msg: str) -> str:\n"
+            "        return msg\n"
+        ))
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return make_contract(
+            "leakplugin.py",
+            name="spymodel.yml",
+            extra="classes:\n"
+                  "  - name: Extension\n"
+                  "    methods:\n"
+                  "      - name: run\n"
+                  "        arguments:\n"
+                  "          - name: self\n"
+                  "          - name: msg\n"
+                  "            annotation: str\n"
+        )
+
+    @pytest.fixture
+    def package(self, make_plugin, make_contract):
+        make_plugin("sub.py", "engine = 'docker'\n", "leakpackage")
+        init = make_plugin("__init__.py", "from . import sub\nengine = sub.engine\n", "leakpackage")
+        return ModuleUtil().import_from_path(init), make_contract("__init__.py", name="leakpackage.yml")
+
+    @pytest.fixture
+    def quiet_logging(self):
+        # Keep the test runner from capturing every debug record in memory.
+        logging.disable(logging.CRITICAL)
+        yield
+        logging.disable(logging.NOTSET)
+
+    def test_log_managers_share_configuration(self):
+        assert LogManager().default_handler is LogManager().default_handler
+        assert LogManager().configured == LogManager().configured
+
+    def test_logging_configured_once(self, plugin, contract):
+        Spy().importspy(filepath=contract, info_module=plugin)
+        handlers = list(logging.getLogger().handlers)
+        for _ in range(20):
+            Spy().importspy(filepath=contract, info_module=plugin)
+        assert logging.getLogger().handlers == handlers
+
+    def test_parser_does_not_accumulate_documents(self, contract):
+        parser = YamlParser()
+        for _ in range(50):
+            parser.load(contract)
+        assert len(parser.yaml.doc_infos) <= 1
+
+    @pytest.mark.skipif(not hasattr(sys, "getallocatedblocks"), reason="needs CPython's block accounting")
+    def test_repeated_validations_retain_no_memory(self, plugin, contract, quiet_logging):
+        modules = set(sys.modules)
+        with SpySession() as session:
+            for _ in range(WARMUP):
+                Spy(session=session).importspy(filepath=contract, info_module=plugin)
+            gc.collect()
+            blocks = sys.getallocatedblocks()
+            for _ in range(VALIDATIONS - WARMUP):
+                Spy(session=session).importspy(filepath=contract, info_module=plugin)
+            gc.collect()
+            assert sys.getallocatedblocks() - blocks < MAX_BLOCK_GROWTH
+        assert set(sys.modules) - modules == set()
+
+    @pytest.mark.skipif(not hasattr(sys, "getallocatedblocks"), reason="needs CPython's block accounting")
+    def test_repeated_package_validations_retain_no_memory(self, package, quiet_logging):
+        info_module, contract = package
+        modules = set(sys.modules)
+        with SpySession() as session:
+            for _ in range(WARMUP // 10):
+                Spy(session=session).importspy(filepath=contract, info_module=info_module)
+            gc.collect()
+            blocks = sys.getallocatedblocks()
+            for _ in range((VALIDATIONS - WARMUP) // 10):
+                Spy(session=session).importspy(filepath=contract, info_module=info_module)
+            gc.collect()
+            assert sys.getallocatedblocks() - blocks < MAX_BLOCK_GROWTH
+        assert set(sys.modules) - modules == set()
@@ -0,0 +1,94 @@
+import pytest
+from importspy.s import Spy
+from importspy.session import SpySession, default_session
+
+
+class TestSpySession:
+
+    @pytest.fixture
+    def plugin(self, executed_plugin):
+        return executed_plugin("sessionplugin.py")
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return make_contract("sessionplugin.py", name="spymodel.yml")
+
+    def test_warm_caches(self, plugin, contract):
+        with SpySession() as session:
+            session.preload(contract)
+            for _ in range(3):
+                session.importspy(contract, plugin, reload=False)
+            stats = session.stats()
+        assert (stats["contracts"].hits, stats["contracts"].misses) == (3, 1)
+        assert (stats["structures"].hits, stats["structures"].misses) == (2, 1)
+        assert stats["host"].misses == 1
+
+    def test_reload_extracts_again(self, executed_plugin, contract, monkeypatch):
+        plugin = executed_plugin("sessionplugin.py", "import os\nengine = os.environ.get('ENGINE', 'docker')\n")
+        monkeypatch.delenv("ENGINE", raising=False)
+        with SpySession() as session:
+            session.importspy(contract, plugin)
+            monkeypatch.setenv("ENGINE", "podman")
+            with pytest.raises(ValueError, match="engine"):
+                session.importspy(contract, plugin)
+            assert session.stats()["structures"].hits == 0
+
+    def test_structure_reused_while_module_unchanged(self, plugin):
+        with SpySession() as session:
+            assert session.extract(plugin) is session.extract(plugin)
+
+    def test_mutated_module_extracted_again(self, executed_plugin, contract):
+        plugin = executed_plugin("sessionplugin.py", "engine = 'docker'\nclass Job:\n    kind = 'job'\n")
+        with SpySession() as session:
+            structure = session.extract(plugin)
+            session.importspy(contract, plugin, reload=False)
+            plugin.engine = "podman"
+            with pytest.raises(ValueError, match="engine"):
+                session.importspy(contract, plugin, reload=False)
+            plugin.engine = "docker"
+            plugin.Job.kind = "task"
+            assert session.extract(plugin) is not structure
+
+    def test_contract_change_invalidates(self, plugin, contract):
+        session = SpySession()
+        session.importspy(contract, plugin, reload=False)
+        with open(contract) as file:
+            content = file.read()
+        with open(contract, "w") as file:
+            file.write(content.replace("docker", "podman"))
+        with pytest.raises(ValueError, match="engine"):
+            session.importspy(contract, plugin, reload=False)
+        assert session.stats()["contracts"].misses == 2
+
+    def test_closed_session(self, plugin, contract):
+        session = SpySession()
+        session.close()
+        with pytest.raises(RuntimeError):
+            session.importspy(contract, plugin)
+
+    def test_spy_uses_default_session(self, plugin, contract):
+        spy = Spy()
+        assert spy.session is default_session()
+        assert spy.importspy(filepath=contract, info_module=plugin).engine == "docker"
+
+    def test_spy_with_session(self, plugin, contract):
+        session = SpySession()
+        Spy(session=session).importspy(filepath=contract, info_module=plugin)
+        assert session.stats()["contracts"].misses == 1
+
+    def test_outcome_follows_contract_order(self, executed_plugin, make_contract):
+        plugin = executed_plugin("sessionplugin.py", "engine = 'docker'\ndef start(): pass\n")
+        missing = "functions:\n  - name: first\n  - name: second\n"
+        reordered = "functions:\n  - name: second\n  - name: first\n"
+        with SpySession() as session:
+            with pytest.raises(ValueError, match="first"):
+                session.importspy(make_contract("sessionplugin.py", name="one.yml", extra=missing), plugin, reload=False)
+            with pytest.raises(ValueError, match="second"):
+                session.importspy(make_contract("sessionplugin.py", name="two.yml", extra=reordered), plugin, reload=False)
+
+    def test_outcome_reused_for_same_fingerprints(self, plugin, contract):
+        with SpySession() as session:
+            session.importspy(contract, plugin, reload=False)
+            session.importspy(contract, plugin, reload=True)
+            stats = session.stats()["outcomes"]
+        assert (stats.hits, stats.misses) == (1, 1)
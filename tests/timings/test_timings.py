@@ -0,0 +1,95 @@
+import threading
+import pytest
+from importspy.batch import ValidationResult, validate_many
+from importspy.session import SpySession
+from importspy.timings import (
+    PHASE_CONTRACT,
+    PHASE_EXTRACT,
+    PHASE_HOST,
+    PHASE_LOAD,
+    PHASE_TOTAL,
+    PHASE_VALIDATE,
+    format_summary,
+    format_timings,
+    record,
+    slowest,
+    span
+)
+from importspy.utilities.module_util import ModuleUtil
+
+
+class TestTimings:
+
+    @pytest.fixture
+    def plugin(self, make_plugin):
+        return make_plugin("timedplugin.py")
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return make_contract("timedplugin.py", name="spymodel.yml")
+
+    def test_span_without_recording(self):
+        with span(PHASE_LOAD):
+            pass
+
+    def test_record_phases(self):
+        with record() as timings:
+            with span(PHASE_LOAD):
+                pass
+            with span(PHASE_LOAD):
+                pass
+        assert set(timings) == {PHASE_LOAD, PHASE_TOTAL}
+        assert timings[PHASE_TOTAL] >= timings[PHASE_LOAD] >= 0
+
+    def test_nested_records_add_up(self):
+        with record() as outer:
+            with record() as inner:
+                with span(PHASE_HOST):
+                    pass
+        assert inner[PHASE_HOST] == outer[PHASE_HOST]
+
+    def test_recordings_are_per_thread(self):
+        recorded = {}
+
+        def worker():
+            with record() as timings:
+                with span(PHASE_VALIDATE):
+                    pass
+            recorded.update(timings)
+
+        with record() as timings:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        assert PHASE_VALIDATE in recorded
+        assert PHASE_VALIDATE not in timings
+
+    def test_session_phases(self, plugin, contract):
+        session = SpySession()
+        with record() as timings:
+            session.importspy(contract, ModuleUtil().import_from_path(plugin))
+        assert {PHASE_CONTRACT, PHASE_LOAD, PHASE_EXTRACT, PHASE_HOST, PHASE_VALIDATE} <= set(timings)
+        assert timings[PHASE_TOTAL] >= sum(value for phase, value in timings.items() if phase != PHASE_TOTAL)
+
+    def test_batch_results(self, plugin, contract):
+        [result] = validate_many([(plugin, contract)], workers=1)
+        assert {PHASE_CONTRACT, PHASE_LOAD, PHASE_EXTRACT, PHASE_VALIDATE, PHASE_TOTAL} <= set(result.timings)
+
+    def test_format_timings(self):
+        table = format_timings({PHASE_LOAD: 0.003, PHASE_VALIDATE: 0.001, PHASE_TOTAL: 0.004})
+        lines = table.splitlines()
+        assert [line.split()[0] for line in lines] == ["phase", PHASE_LOAD, PHASE_VALIDATE, PHASE_TOTAL]
+        assert "75.0%" in lines[1]
+
+    def test_slowest(self):
+        results = [
+            ValidationResult("a.py", "c.yml", True, timings={PHASE_LOAD: 0.5, PHASE_TOTAL: 0.6}),
+            ValidationResult("b.py", "c.yml", True, timings={PHASE_VALIDATE: 0.7, PHASE_TOTAL: 0.9}),
+            ValidationResult("c.py", "c.yml", True, timings={PHASE_LOAD: 0.1, PHASE_TOTAL: 0.2}),
+        ]
+        modules, phases = slowest(results, top=2)
+        assert modules == [("b.py", 0.9), ("a.py", 0.6)]
+        assert phases == [("b.py", PHASE_VALIDATE, 0.7), ("a.py", PHASE_LOAD, 0.5)]
+        summary = format_summary(results, top=2)
+        assert "Slowest modules (of 3):" in summary
+        assert "c.py" not in summary
@@ -0,0 +1,71 @@
+import json
+import os
+import sys
+import threading
+import pytest
+from importspy import tracing
+from importspy.backends import Backend
+from importspy.batch import validate_many
+from importspy.session import SpySession
+from importspy.tracing import CATEGORY_EXTRACT, CATEGORY_PHASE, CATEGORY_VALIDATOR, trace
+from importspy.utilities.module_util import ModuleUtil
+
+
+class TestTracing:
+
+    @pytest.fixture
+    def plugins(self, make_plugin):
+        return [
+            make_plugin("tracedplugin.py", "engine = 'docker'\n\nclass Plugin:\n    def run(self):\n        pass\n", f"plugin{index}")
+            for index in range(4)
+        ]
+
+    @pytest.fixture
+    def contract(self, make_contract):
+        return make_contract("tracedplugin.py", name="spymodel.yml")
+
+    def test_disabled(self):
+        assert tracing.active_tracer() is None
+        assert trace("a") is trace("b")
+
+    def test_spans(self, plugins, contract):
+        with tracing.tracing() as tracer:
+            SpySession().importspy(contract, ModuleUtil().import_from_path(plugins[0]))
+        assert tracing.active_tracer() is None
+        categories = {event["cat"] for event in tracer.events}
+        assert {CATEGORY_PHASE, CATEGORY_EXTRACT, CATEGORY_VALIDATOR} <= categories
+        assert "class Plugin" in {event["name"] for event in tracer.events}
+        for event in tracer.events:
+            assert event["ph"] == "X"
+            assert event["pid"] == os.getpid()
+            assert event["dur"] >= 0
+
+    def test_threads(self):
+        with tracing.tracing() as tracer:
+            thread = threading.Thread(target=lambda: trace("worker").__enter__().__exit__(None, None, None), name="tracer-test")
+            thread.start()
+            thread.join()
+        names = [event["args"]["name"] for event in tracer.to_json()["traceEvents"] if event["name"] == "thread_name"]
+        assert names == ["tracer-test"]
+
+    def test_nested_start(self):
+        with tracing.tracing():
+            with pytest.raises(RuntimeError):
+                tracing.start()
+
+    def test_write(self, tmp_path, plugins, contract):
+        output = tmp_path / "trace.json"
+        with tracing.tracing(str(output)):
+            list(validate_many(((plugin, contract) for plugin in plugins), workers=2))
+        document = json.loads(output.read_text())
+        spans = [event for event in document["traceEvents"] if event["ph"] == "X"]
+        assert len([event for event in spans if event["name"].startswith("validate ")]) == len(plugins)
+        assert document["displayTimeUnit"] == "ms"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="process pool start-up is slow on Windows")
+    def test_worker_processes(self, plugins, contract):
+        with tracing.tracing() as tracer:
+            list(validate_many(((plugin, contract) for plugin in plugins), workers=2, backend=Backend.PROCESSES))
+        worker_pids = {event["pid"] for event in tracer.events} - {os.getpid()}
+        assert worker_pids
+        assert len([event for event in tracer.events if event["name"].startswith("validate ")]) == len(plugins)
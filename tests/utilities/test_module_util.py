@@ -0,0 +1,43 @@
+import gc
+import importlib
+import sys
+import weakref
+import pytest
+from importspy.utilities.module_util import ModuleUtil
+
+
+class TestModuleUtil:
+
+    module_util = ModuleUtil()
+
+    @pytest.fixture
+    def core_module(self, tmp_path, monkeypatch):
+        (tmp_path / "embeddedcore.py").write_text(
+            "from importspy.utilities.module_util import ModuleUtil\n"
+            "\n"
+            "def _resolve():\n"
+            "    return ModuleUtil().resolve_caller()\n"
+            "\n"
+            "caller = _resolve()\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        yield "embeddedcore"
+        sys.modules.pop("embeddedcore", None)
+
+    def test_resolve_importer(self, core_module):
+        module = importlib.import_module(core_module)
+        assert module.caller is sys.modules[__name__]
+
+    def test_frame_kind_cached(self):
+        code = sys._getframe().f_code
+        assert self.module_util._frame_kind(code) == "user"
+        assert self.module_util._frame_kind(ModuleUtil.resolve_caller.__code__) == "importspy"
+        assert self.module_util._frame_kind(importlib.import_module.__code__) == "bootstrap"
+
+    def test_frame_kind_keeps_no_code(self):
+        code = compile("pass", "/tmp/reloaded_plugin.py", "exec")
+        reference = weakref.ref(code)
+        assert self.module_util._frame_kind(code) == "user"
+        del code
+        gc.collect()
+        assert reference() is None
@@ -0,0 +1,150 @@
+import enum
+import time
+import pytest
+from importspy.models import SpyModel, ValueDigest, Variable
+from importspy.s import Spy
+from importspy.utilities.module_util import (
+    MAX_DIGEST_BYTES,
+    ModuleUtil,
+    ValueInfo
+)
+from importspy.validators import _same_value
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+
+
+class TestValueCapture:
+
+    module_util = ModuleUtil()
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, None),
+        (True, True),
+        (42, 42),
+        (Level.LOW, 1),
+        (1.5, 1.5),
+        ("docker", "docker"),
+    ])
+    def test_scalars_inline(self, value, expected):
+        captured = self.module_util.capture_value(value)
+        assert captured == expected
+        assert type(captured) is type(expected)
+
+    @pytest.mark.parametrize("value, type_name, size", [
+        ("x" * 1000, "str", 1000),
+        ({"a": 1, "b": [1, 2]}, "dict", 2),
+        ({3, 1, 2}, "set", 3),
+        (2 ** 100, "int", None),
+        (float("nan"), "float", None),
+        (Level, "enum.EnumType", 1),
+    ])
+    def test_other_values_digested(self, value, type_name, size):
+        captured = self.module_util.capture_value(value)
+        assert isinstance(captured, ValueInfo)
+        assert (captured.type, captured.size) == (type_name, size)
+        assert len(captured.digest) == 32
+
+    def test_digest_follows_content(self):
+        capture = self.module_util.capture_value
+        assert capture({"a": [1, 2]}) == capture({"a": [1, 2]})
+        assert capture({"a": [1, 2]}) != capture({"a": [1, 3]})
+        assert capture(frozenset("abcdef")).digest == capture(frozenset("fedcba")).digest
+        assert capture([1, 2]).digest != capture((1, 2)).digest
+
+    def test_digest_is_bounded(self):
+        head = b"x" * MAX_DIGEST_BYTES
+        assert self.module_util.capture_value(head + b"a") == self.module_util.capture_value(head + b"b")
+        assert self.module_util.capture_value("x" * 10 ** 6) == self.module_util.capture_value("x" * 10 ** 6)
+        assert self.module_util.capture_value("x" * 10 ** 6) != self.module_util.capture_value("x" * (10 ** 6 + 1))
+
+    def test_unordered_containers(self):
+        capture = self.module_util.capture_value
+        large = list(range(1000))
+        assert capture(set(large)).digest == capture(set(reversed(large))).digest
+        assert capture(set(large)).digest != capture(set(large[1:]) | {-1}).digest
+        assert capture({"a": 1, "b": 2}) == capture({"b": 2, "a": 1})
+        assert capture({"a": 1, "b": 2}) != capture({"a": 2, "b": 1})
+        assert capture({"a", "b"}).digest != capture(["a", "b"]).digest
+
+    def test_large_unordered_containers_not_walked(self):
+        class Unwalkable(dict):
+            def __iter__(self):
+                raise AssertionError("walked")
+
+            def items(self):
+                raise AssertionError("walked")
+
+        table = Unwalkable((f"key{index}", index) for index in range(MAX_DIGEST_BYTES))
+        captured = self.module_util.capture_value(table)
+        assert captured.size == MAX_DIGEST_BYTES
+        assert captured == self.module_util.capture_value(Unwalkable(reversed(list(dict.items(table)))))
+
+    @pytest.mark.benchmark
+    def test_large_unordered_containers_are_bounded(self):
+        table = {f"key{index}": index for index in range(1_000_000)}
+        start = time.perf_counter()
+        captured = self.module_util.capture_value(table)
+        assert time.perf_counter() - start < 0.05
+        assert (captured.type, captured.size) == ("dict", 1_000_000)
+        assert captured == self.module_util.capture_value(dict(reversed(table.items())))
+
+    def test_cycles(self):
+        loop = []
+        loop.append(loop)
+        assert self.module_util.capture_value(loop).size == 1
+
+    def test_extracted_values_are_bounded(self, tmp_path):
+        path = tmp_path / "capturedplugin.py"
+        path.write_text("TABLE = {'a': 1, 'b': 2}\nengine = 'docker'\n")
+        info_module = self.module_util.import_from_path(str(path))
+        values = {info.name: info.value for info in self.module_util.extract_variables(info_module)}
+        assert values["engine"] == "docker"
+        assert isinstance(values["TABLE"], ValueInfo)
+
+
+class TestValueComparison:
+
+    @pytest.fixture
+    def plugin(self, tmp_path):
+        path = tmp_path / "tableplugin.py"
+        path.write_text(f"TABLE = {{'a': 1, 'b': 2}}\nBANNER = {'=' * 300!r}\n")
+        return ModuleUtil().import_from_path(str(path))
+
+    def test_contract_roundtrip(self, plugin):
+        spymodel = SpyModel.from_module(plugin, reload=False)
+        variables = spymodel.deployments[0].systems[0].pythons[0].modules[0].variables
+        table = next(variable for variable in variables if variable.name == "TABLE")
+        assert isinstance(table.value, ValueDigest)
+        assert Variable(**table.model_dump()) == table
+
+    def test_full_value_matches_digest(self):
+        assert _same_value("=" * 300, ValueDigest.capture("=" * 300))
+        assert not _same_value("=" * 299 + "-", ValueDigest.capture("=" * 300))
+
+    def test_validation(self, plugin, tmp_path):
+        digest = ValueDigest.capture({"a": 1, "b": 2})
+        contract = tmp_path / "spymodel.yml"
+        contract.write_text(
+            "filename: tableplugin.py\n"
+            "variables:\n"
+            "  - name: TABLE\n"
+            "    value:\n"
+            f"      type: dict\n      size: 2\n      digest: {digest.digest}\n"
+            "  - name: BANNER\n"
+            f"    value: {'=' * 300}\n"
+        )
+        Spy().importspy(filepath=str(contract), info_module=plugin, reload=False)
+
+    def test_mismatch(self, plugin, tmp_path):
+        contract = tmp_path / "spymodel.yml"
+        contract.write_text(
+            "filename: tableplugin.py\n"
+            "variables:\n"
+            "  - name: TABLE\n"
+            "    value:\n"
+            "      type: dict\n      size: 2\n      digest: 00000000000000000000000000000000\n"
+        )
+        with pytest.raises(ValueError):
+            Spy().importspy(filepath=str(contract), info_module=plugin, reload=False)
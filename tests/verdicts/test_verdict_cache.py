@@ -0,0 +1,123 @@
+import multiprocessing
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from importspy import verdicts
+from importspy.verdicts import (
+    Verdict,
+    VerdictCache,
+    REVALIDATE_ENV
+)
+
+
+def _resolve_in_worker(directory, key, marker_dir):
+    def validate():
+        open(os.path.join(marker_dir, str(os.getpid())), "w").close()
+        time.sleep(0.2)
+        return Verdict(compliant=True)
+    return VerdictCache(directory).resolve(key, validate).compliant
+
+
+class TestVerdictCache:
+
+    key = VerdictCache.make_key("source", "contract", "profile")
+
+    @pytest.fixture
+    def cache(self, tmp_path) -> VerdictCache:
+        return VerdictCache(str(tmp_path / "verdicts"))
+
+    def test_persisted(self, cache, tmp_path):
+        cache.put(self.key, Verdict(compliant=False, error="missing engine"))
+        verdict = VerdictCache(str(tmp_path / "verdicts")).get(self.key)
+        assert verdict.compliant is False
+        assert verdict.error == "missing engine"
+
+    def test_key_depends_on_profile(self):
+        assert self.key != VerdictCache.make_key("source", "contract", "other")
+
+    def test_ttl_expired(self, tmp_path):
+        cache = VerdictCache(str(tmp_path / "verdicts"), ttl=60)
+        cache.put(self.key, Verdict(compliant=True, created=time.time() - 120))
+        assert cache.get(self.key) is None
+
+    def test_revalidate(self, cache, monkeypatch):
+        cache.put(self.key, Verdict(compliant=False, error="stale"))
+        assert cache.resolve(self.key, lambda: Verdict(compliant=True)).compliant is False
+        assert cache.resolve(self.key, lambda: Verdict(compliant=True), revalidate=True).compliant is True
+        cache.put(self.key, Verdict(compliant=False, error="stale"))
+        monkeypatch.setenv(REVALIDATE_ENV, "1")
+        assert cache.resolve(self.key, lambda: Verdict(compliant=True)).compliant is True
+
+    def test_resolve_once_across_threads(self, cache):
+        calls = []
+
+        def validate():
+            calls.append(1)
+            time.sleep(0.05)
+            return Verdict(compliant=True)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: cache.resolve(self.key, validate), range(16)))
+        assert all(verdict.compliant for verdict in results)
+        assert len(calls) == 1
+
+    @pytest.mark.skipif(os.name != "posix", reason="file locks require fcntl")
+    def test_resolve_once_across_processes(self, tmp_path):
+        marker_dir = tmp_path / "markers"
+        marker_dir.mkdir()
+        context = multiprocessing.get_context("fork")
+        with context.Pool(4) as pool:
+            results = pool.starmap(
+                _resolve_in_worker,
+                [(str(tmp_path / "verdicts"), self.key, str(marker_dir))] * 4
+            )
+        assert all(results)
+        assert len(os.listdir(marker_dir)) == 1
+
+    def test_locks_bounded(self, cache, tmp_path):
+        for index in range(200):
+            cache.resolve(VerdictCache.make_key(str(index), "contract"), lambda: Verdict(compliant=True))
+        locks = [name for name in os.listdir(tmp_path / "verdicts") if name.endswith(".lock")]
+        assert len(locks) <= verdicts.LOCK_STRIPES
+        assert len(cache._locks) == verdicts.LOCK_STRIPES
+
+    def test_nested_resolve_same_stripe(self, cache):
+        first = VerdictCache.make_key("outer", "contract")
+        second = next(key for key in (VerdictCache.make_key(str(index), "contract") for index in range(10_000))
+                      if cache._stripe(key) == cache._stripe(first))
+        verdict = cache.resolve(first, lambda: cache.resolve(second, lambda: Verdict(compliant=True)))
+        assert verdict.compliant
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs user ids")
+    def test_private_files(self, cache, tmp_path):
+        cache.put(self.key, Verdict(compliant=True))
+        assert stat.S_IMODE(os.stat(tmp_path / "verdicts").st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(tmp_path / "verdicts" / f"{self.key}.json").st_mode) == 0o600
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs user ids")
+    def test_shared_directory_refused(self, tmp_path):
+        planted = tmp_path / "planted"
+        planted.mkdir()
+        planted.chmod(0o777)
+        (planted / f"{self.key}.json").write_text('{"compliant": true}')
+        cache = VerdictCache(str(planted))
+        assert cache.directory is None
+        assert cache.get(self.key) is None
+
+    @pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="needs to create another user's directory")
+    def test_foreign_directory_refused(self, tmp_path):
+        planted = tmp_path / "planted"
+        planted.mkdir(mode=0o700)
+        os.chown(planted, 12345, -1)
+        assert VerdictCache(str(planted / "verdicts")).directory is None
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs user ids")
+    def test_shared_falls_back(self, tmp_path, monkeypatch):
+        planted = tmp_path / "shm"
+        planted.mkdir()
+        planted.chmod(0o777)
+        monkeypatch.setattr(verdicts, "shared_memory_cache_dir", lambda: str(planted))
+        monkeypatch.setattr(verdicts, "default_cache_dir", lambda: str(tmp_path / "cache"))
+        assert VerdictCache.shared().directory == str(tmp_path / "cache")
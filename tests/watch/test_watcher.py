@@ -0,0 +1,90 @@
+import threading
+import pytest
+from importspy.session import SpySession
+from importspy.watch import Watcher
+
+
+class TestWatcher:
+
+    @pytest.fixture
+    def project(self, tmp_path, make_plugin, make_contract):
+        for name in ("a", "b"):
+            make_plugin("watchedplugin.py", directory=f"plugins/{name}")
+        make_contract("watchedplugin.py", name="spymodel.yml")
+        return tmp_path
+
+    @pytest.fixture
+    def watcher(self, project):
+        watcher = Watcher([str(project / "plugins")], str(project / "spymodel.yml"), debounce=0, use_inotify=False)
+        yield watcher
+        watcher.close()
+
+    def test_initial_check_reports_every_module(self, watcher):
+        deltas = watcher.check()
+        assert len(deltas) == 2
+        assert all(delta.newly_passing and delta.previous is None for delta in deltas)
+        assert watcher.check() == []
+
+    def test_module_change_reports_delta(self, watcher, project):
+        watcher.check()
+        plugin = project / "plugins" / "a" / "watchedplugin.py"
+        plugin.write_text("engine = 'podman'\n")
+        deltas = watcher.check()
+        assert [delta.module for delta in deltas] == [str(plugin)]
+        assert deltas[0].newly_failing
+        assert "engine" in deltas[0].error
+        plugin.write_text("engine = 'docker'\n")
+        assert watcher.check()[0].newly_passing
+
+    def test_contract_change_revalidates_without_import(self, watcher, make_contract, monkeypatch):
+        watcher.check()
+        monkeypatch.setattr(watcher, "_validate", lambda path: pytest.fail("module re-imported"))
+        make_contract("watchedplugin.py", "podman", name="spymodel.yml")
+        deltas = watcher.check()
+        assert len(deltas) == 2
+        assert all(delta.newly_failing for delta in deltas)
+
+    def test_broken_contract_recovers(self, watcher, project, make_contract):
+        watcher.check()
+        contract = project / "spymodel.yml"
+        contract.write_text("filename: [unterminated\n")
+        assert all(not delta.compliant for delta in watcher.check())
+        make_contract("watchedplugin.py", name="spymodel.yml")
+        assert all(delta.newly_passing for delta in watcher.check())
+
+    def test_removed_module(self, watcher, project):
+        watcher.check()
+        plugin = project / "plugins" / "b" / "watchedplugin.py"
+        plugin.unlink()
+        deltas = watcher.check()
+        assert [(delta.module, delta.compliant) for delta in deltas] == [(str(plugin), None)]
+        assert watcher.session.index.modules_for(watcher.contract, "module") == {
+            str(project / "plugins" / "a" / "watchedplugin.py")
+        }
+
+    def test_inotify_wakes_on_save(self, project):
+        watcher = Watcher([str(project / "plugins")], str(project / "spymodel.yml"), debounce=0)
+        try:
+            if not watcher.uses_inotify:
+                pytest.skip("inotify not available")
+            watcher.check()
+            assert not watcher.wait(timeout=0.05)
+            plugin = project / "plugins" / "a" / "watchedplugin.py"
+            timer = threading.Timer(0.05, plugin.write_text, args=("engine = 'podman'\n",))
+            timer.start()
+            assert watcher.wait(timeout=5)
+            timer.join()
+            assert watcher.check()[0].newly_failing
+        finally:
+            watcher.close()
+
+    def test_other_modules_ignored(self, watcher, project, make_plugin):
+        make_plugin("__init__.py", "", "plugins/a")
+        make_plugin("helpers.py", "def helper(): pass\n", "plugins/a")
+        assert {delta.module for delta in watcher.check()} == {
+            str(project / "plugins" / name / "watchedplugin.py") for name in ("a", "b")
+        }
+
+    def test_session_without_index(self, project):
+        with pytest.raises(ValueError):
+            Watcher([str(project / "plugins")], str(project / "spymodel.yml"), session=SpySession(), use_inotify=False)